@@ -5,195 +5,618 @@ Advanced Web Scraper - Uses Playwright for dynamic content scraping
 
 import json
 import asyncio
-from datetime import datetime
-from typing import List, Dict, Any
+import functools
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+from typing import List, Dict, Any, Set, AsyncIterator, AsyncIterable
 import os
 
+import numpy as np
+
+from app_config import load_config
+from currency_parser import parse_currency, parse_currency_array
+from geo_normalizer import LocationNormalizer
+from listing_io import JsonLinesWriter
+
+# Declarative per-source card layout. Each field names a CSS selector inside
+# the card and optionally an attribute to read instead of the rendered text;
+# ``allow_resources`` lists resource types the source needs despite the
+# default blocking. Adding a source only needs a new entry here.
+LISTING_SELECTORS = {
+    'bizbuysell': {
+        'card': '.business-card, .listing-item, [data-testid="listing-card"]',
+        'base_url': 'https://www.bizbuysell.com',
+        'allow_resources': [],
+        'fields': {
+            'title': {'selector': 'h2, h3, .title, .business-name'},
+            'asking_price': {'selector': '.price, .asking-price, [data-testid="price"]'},
+            'revenue': {'selector': '.revenue, [data-testid="revenue"]'},
+            'cash_flow': {'selector': '.cash-flow, .cashflow, [data-testid="cashflow"]'},
+            'location': {'selector': '.location, [data-testid="location"]'},
+            'url': {'selector': 'a[href*="/business/"]', 'attribute': 'href', 'default': ''}
+        }
+    },
+    'bizquest': {
+        'card': '.listing, .business-listing',
+        'base_url': 'https://www.bizquest.com',
+        'allow_resources': [],
+        'fields': {
+            'title': {'selector': 'h2, h3, .title'}
+        }
+    }
+}
+
+# Resource types never read by the card extraction
+BLOCKED_RESOURCE_TYPES = {'image', 'media', 'font', 'stylesheet'}
+
+# Analytics / ad hosts aborted regardless of resource type
+BLOCKED_HOSTS = (
+    'google-analytics.com', 'googletagmanager.com', 'doubleclick.net',
+    'googlesyndication.com', 'facebook.net', 'hotjar.com', 'segment.io',
+    'newrelic.com', 'nr-data.net', 'quantserve.com', 'scorecardresearch.com'
+)
+
+# Runs in the page: reads every field of every card in one round trip
+EXTRACT_CARDS_JS = """
+(cards, spec) => (spec.limit == null ? cards : cards.slice(0, spec.limit)).map(card => {
+    const record = {};
+    for (const [name, field] of Object.entries(spec.fields)) {
+        const elem = card.querySelector(field.selector);
+        if (!elem) {
+            record[name] = null;
+        } else if (field.attribute) {
+            record[name] = elem.getAttribute(field.attribute);
+        } else {
+            record[name] = elem.innerText;
+        }
+    }
+    return record;
+})
+"""
+
 class AdvancedScraper:
     def __init__(self, config_path: str = "/home/ubuntu/million_hunter/config.json"):
-        with open(config_path, 'r') as f:
-            self.config = json.load(f)
+        self.config = load_config(config_path)
         
         self.filters = self.config['filters']
         self.output_dir = "/home/ubuntu/million_hunter/data"
+        self.geo = LocationNormalizer()
+        
+        # Upper bound on browser contexts scraping in parallel
+        scraper_config = self.config.get('scraper', {})
+        self.max_concurrency = max(1, int(scraper_config.get('max_concurrency', 4)))
+        self.source_timeout = float(scraper_config.get('source_timeout', 600))
+        self.queue_size = int(scraper_config.get('queue_size', 1000))
+        self.filter_batch_size = int(scraper_config.get('filter_batch_size', 100))
+        self.ready_timeout_ms = int(scraper_config.get('ready_timeout_ms', 15000))
+        self.block_resources = scraper_config.get('block_resources', True)
+        self.incremental = scraper_config.get('incremental', False)
+        self.seen_retention_days = int(scraper_config.get('seen_retention_days', 90))
+        self.seen_urls_path = os.path.join(self.output_dir, "seen_listing_urls.json")
+        
+    @asynccontextmanager
+    async def _browser_session(self, browser=None):
+        """Yield a shared browser if given, otherwise launch and own one"""
+        if browser is not None:
+            yield browser
+            return
+        
+        from playwright.async_api import async_playwright
         
-    async def scrape_bizbuysell_detailed(self, max_pages: int = 10) -> List[Dict[str, Any]]:
+        async with async_playwright() as p:
+            own_browser = await p.chromium.launch(headless=True)
+            try:
+                yield own_browser
+            finally:
+                await own_browser.close()
+        
+    async def scrape_bizbuysell_detailed(self, max_pages: int = 10, browser=None,
+                                         partial_results: List[Dict[str, Any]] = None,
+                                         known_urls: Set[str] = None,
+                                         finished_urls: Set[str] = None) -> List[Dict[str, Any]]:
         """
         Scrape BizBuySell with detailed business information
         Uses Playwright for JavaScript-rendered content
+
+        Collects ``iter_bizbuysell`` into a list. If ``partial_results`` is
+        given, each listing is also appended to it as it arrives, so a
+        caller that cancels the scrape still keeps what was collected.
         """
-        from playwright.async_api import async_playwright
+        listings = partial_results if partial_results is not None else []
         
-        listings = []
+        async for listing in self.iter_bizbuysell(max_pages, browser, known_urls, finished_urls):
+            listings.append(listing)
         
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
-            page = await browser.new_page()
+        return listings
+    
+    async def iter_bizbuysell(self, max_pages: int = 10, browser=None,
+                              known_urls: Set[str] = None,
+                              finished_urls: Set[str] = None) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yield BizBuySell listings as result pages are scraped
+
+        Sectors are scraped concurrently through a bounded pool of browser
+        contexts (``scraper.max_concurrency`` in config) and yielded in the
+        configured sector order: the current sector streams straight
+        through while later sectors buffer in bounded queues
+        (``scraper.queue_size``). Pass ``browser`` to reuse an
+        already-launched Chromium instead of starting a new one.
+
+        Each sector is paged up to ``max_pages``. With ``known_urls`` the scan
+        is incremental: listings in the set are skipped and a sector stops
+        paging at the first page that contains one.
+
+        URLs on the pages of each sector that was scraped to the end and
+        fully yielded, known ones included, are added to ``finished_urls``.
+        Failed, cancelled or timed-out sectors add nothing.
+        """
+        async with self._browser_session(browser) as browser:
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+            queues = [asyncio.Queue(maxsize=self.queue_size) for _ in self.filters['sectors']]
+            sector_urls = [set() for _ in self.filters['sectors']]
             
-            # Search for businesses in target sectors
-            for sector in self.filters['sectors']:
-                search_url = f"https://www.bizbuysell.com/businesses-for-sale/{sector}/"
-                
+            async def pump(sector: str, queue: asyncio.Queue, urls: Set[str]):
                 try:
-                    await page.goto(search_url, wait_until='networkidle')
-                    await asyncio.sleep(2)  # Allow dynamic content to load
+                    async for listing in self._iter_bizbuysell_sector(browser, sector, semaphore, max_pages,
+                                                                      known_urls, urls):
+                        await queue.put(listing)
+                except Exception as e:
+                    print(f"Error scraping {sector}: {str(e)}")
+                await queue.put(None)  # End of sector
+            
+            tasks = [
+                asyncio.create_task(pump(sector, queue, urls))
+                for sector, queue, urls in zip(self.filters['sectors'], queues, sector_urls)
+            ]
+            
+            try:
+                for queue, urls in zip(queues, sector_urls):
+                    while True:
+                        listing = await queue.get()
+                        if listing is None:
+                            break
+                        yield listing
+                    # Every listing of the sector has now been consumed
+                    if finished_urls is not None:
+                        finished_urls.update(urls)
+            finally:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+    
+    async def _iter_bizbuysell_sector(self, browser, sector: str, semaphore: asyncio.Semaphore,
+                                      max_pages: int, known_urls: Set[str] = None,
+                                      finished_urls: Set[str] = None) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Scrape a single BizBuySell sector in its own browser context
+
+        Walks result pages until ``max_pages``, an empty page, or (when
+        ``known_urls`` is given) a page containing a listing seen in a
+        previous scan. Results are newest-first, so later pages only hold
+        listings we already have.
+
+        Only once the walk ends normally are the URLs of every card seen,
+        skipped known ones included, added to ``finished_urls``.
+        """
+        scraped = 0
+        pages = 0
+        seen_urls = set()
+        
+        async with semaphore:
+            context = await self.new_source_context(browser, 'bizbuysell')
+            
+            try:
+                page = await context.new_page()
+                
+                for page_number in range(1, max_pages + 1):
+                    # Search for businesses in target sector
+                    search_url = f"https://www.bizbuysell.com/businesses-for-sale/{sector}/"
+                    if page_number > 1:
+                        search_url += f"{page_number}/"
                     
-                    # Extract listing cards
-                    listing_cards = await page.query_selector_all('.business-card, .listing-item, [data-testid="listing-card"]')
+                    if not await self.load_listing_page(page, search_url, 'bizbuysell'):
+                        break
                     
-                    for card in listing_cards[:50]:  # Limit per sector
-                        try:
-                            # Extract business details
-                            title_elem = await card.query_selector('h2, h3, .title, .business-name')
-                            title = await title_elem.inner_text() if title_elem else "N/A"
-                            
-                            price_elem = await card.query_selector('.price, .asking-price, [data-testid="price"]')
-                            price_text = await price_elem.inner_text() if price_elem else "N/A"
-                            
-                            revenue_elem = await card.query_selector('.revenue, [data-testid="revenue"]')
-                            revenue_text = await revenue_elem.inner_text() if revenue_elem else "N/A"
-                            
-                            cashflow_elem = await card.query_selector('.cash-flow, .cashflow, [data-testid="cashflow"]')
-                            cashflow_text = await cashflow_elem.inner_text() if cashflow_elem else "N/A"
-                            
-                            location_elem = await card.query_selector('.location, [data-testid="location"]')
-                            location = await location_elem.inner_text() if location_elem else "N/A"
-                            
-                            link_elem = await card.query_selector('a[href*="/business/"]')
-                            detail_url = await link_elem.get_attribute('href') if link_elem else ""
-                            if detail_url and not detail_url.startswith('http'):
-                                detail_url = f"https://www.bizbuysell.com{detail_url}"
-                            
-                            listing = {
-                                'source': 'bizbuysell',
-                                'title': title.strip(),
-                                'sector': sector,
-                                'asking_price': price_text.strip(),
-                                'revenue': revenue_text.strip(),
-                                'cash_flow': cashflow_text.strip(),
-                                'location': location.strip(),
-                                'url': detail_url,
-                                'scan_date': datetime.now().isoformat(),
-                                'status': 'active'
-                            }
-                            
-                            listings.append(listing)
-                            
-                        except Exception as e:
-                            print(f"Error extracting card data: {str(e)}")
-                            continue
+                    # Extract every listing card in a single evaluate call
+                    cards = await self.extract_listing_cards(page, 'bizbuysell')
+                    if not cards:
+                        break
                     
-                    print(f"Scraped {len(listing_cards)} listings from {sector}")
+                    pages += 1
+                    reached_known = False
+                    for card in cards:
+                        if card['url']:
+                            seen_urls.add(card['url'])
+                        if known_urls is not None and card['url'] in known_urls:
+                            reached_known = True
+                            continue
+                        
+                        scraped += 1
+                        yield {
+                            'source': 'bizbuysell',
+                            'title': card['title'],
+                            'sector': sector,
+                            'asking_price': card['asking_price'],
+                            'revenue': card['revenue'],
+                            'cash_flow': card['cash_flow'],
+                            'location': card['location'],
+                            'url': card['url'],
+                            'scan_date': datetime.now().isoformat(),
+                            'status': 'active'
+                        }
                     
-                except Exception as e:
-                    print(f"Error scraping {sector}: {str(e)}")
-                    continue
+                    if reached_known:
+                        break
+                
+                print(f"Scraped {scraped} listings from {sector} ({pages} pages)")
+                
+                if finished_urls is not None:
+                    finished_urls.update(seen_urls)
+                
+            except Exception as e:
+                print(f"Error scraping {sector}: {str(e)}")
             
-            await browser.close()
+            finally:
+                await context.close()
+    
+    async def new_source_context(self, browser, source: str):
+        """
+        Open a browser context for a source with resource blocking installed
+
+        Requests for ``BLOCKED_RESOURCE_TYPES`` and known tracker hosts are
+        aborted unless the type is in the source's ``allow_resources``.
+        """
+        context = await browser.new_context()
         
-        return listings
+        if not self.block_resources:
+            return context
+        
+        blocked_types = BLOCKED_RESOURCE_TYPES - set(LISTING_SELECTORS[source].get('allow_resources', []))
+        
+        async def handle_route(route):
+            request = route.request
+            if request.resource_type in blocked_types or any(host in request.url for host in BLOCKED_HOSTS):
+                await route.abort()
+            else:
+                await route.continue_()
+        
+        await context.route('**/*', handle_route)
+        return context
+    
+    async def load_listing_page(self, page, url: str, source: str) -> bool:
+        """
+        Navigate and return as soon as the first listing card is attached
+
+        Returns False when no card appears within ``scraper.ready_timeout_ms``
+        (e.g. an empty results page) rather than raising.
+        """
+        from playwright.async_api import TimeoutError as PlaywrightTimeoutError
+        
+        await page.goto(url, wait_until='domcontentloaded')
+        
+        try:
+            await page.wait_for_selector(
+                LISTING_SELECTORS[source]['card'],
+                state='attached',
+                timeout=self.ready_timeout_ms
+            )
+        except PlaywrightTimeoutError:
+            return False
+        
+        return True
     
-    async def scrape_bizquest_detailed(self) -> List[Dict[str, Any]]:
+    async def extract_listing_cards(self, page, source: str, limit: int = None) -> List[Dict[str, str]]:
+        """
+        Extract all listing cards on the page in one round trip
+
+        Fields are read in the browser according to ``LISTING_SELECTORS``.
+        Missing text fields become "N/A" (or the field's ``default``), text
+        is stripped and relative links are made absolute.
+        """
+        spec = LISTING_SELECTORS[source]
+        
+        raw_cards = await page.eval_on_selector_all(
+            spec['card'],
+            EXTRACT_CARDS_JS,
+            {'fields': spec['fields'], 'limit': limit}
+        )
+        
+        cards = []
+        for raw in raw_cards:
+            card = {}
+            for name, field in spec['fields'].items():
+                value = raw.get(name)
+                if value is None:
+                    card[name] = field.get('default', "N/A")
+                    continue
+                
+                value = value.strip()
+                if field.get('attribute') == 'href' and value and not value.startswith('http'):
+                    value = f"{spec['base_url']}{value}"
+                card[name] = value
+            cards.append(card)
+        
+        return cards
+    
+    async def scrape_bizquest_detailed(self, browser=None,
+                                       partial_results: List[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
         """Scrape BizQuest with detailed information"""
-        from playwright.async_api import async_playwright
+        listings = partial_results if partial_results is not None else []
         
-        listings = []
+        async for listing in self.iter_bizquest(browser):
+            listings.append(listing)
         
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=True)
-            page = await browser.new_page()
+        return listings
+    
+    async def iter_bizquest(self, browser=None) -> AsyncIterator[Dict[str, Any]]:
+        """Yield BizQuest listings as they are extracted"""
+        async with self._browser_session(browser) as browser:
+            context = await self.new_source_context(browser, 'bizquest')
             
             # BizQuest search by revenue and cash flow
             search_url = "https://www.bizquest.com/businesses-for-sale/"
             
             try:
-                await page.goto(search_url, wait_until='networkidle')
-                await asyncio.sleep(2)
+                page = await context.new_page()
+                if not await self.load_listing_page(page, search_url, 'bizquest'):
+                    print("No listings found on BizQuest")
+                    return
                 
                 # Apply filters (revenue, cash flow, location)
                 # This would require interacting with filter elements
                 
                 # Extract listings
-                listing_items = await page.query_selector_all('.listing, .business-listing')
+                cards = await self.extract_listing_cards(page, 'bizquest', limit=50)
                 
-                for item in listing_items[:50]:
-                    try:
-                        title = await item.query_selector('h2, h3, .title')
-                        title_text = await title.inner_text() if title else "N/A"
-                        
-                        listing = {
-                            'source': 'bizquest',
-                            'title': title_text.strip(),
-                            'scan_date': datetime.now().isoformat(),
-                            'status': 'active'
-                        }
-                        
-                        listings.append(listing)
-                        
-                    except Exception as e:
-                        continue
+                for card in cards:
+                    yield {
+                        'source': 'bizquest',
+                        'title': card['title'],
+                        'scan_date': datetime.now().isoformat(),
+                        'status': 'active'
+                    }
                 
             except Exception as e:
                 print(f"Error scraping BizQuest: {str(e)}")
             
-            await browser.close()
-        
-        return listings
+            finally:
+                await context.close()
     
     def parse_currency(self, text: str) -> float:
-        """Parse currency string to float"""
-        if not text or text == "N/A":
-            return 0.0
+        """Parse currency string to float (NaN when no amount is given)"""
+        return parse_currency(text)
+    
+    def filter_by_criteria(self, listings: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Filter listings based on configured criteria
+
+        Revenue and cash flow are parsed column-wise and every criterion is
+        applied as one boolean mask. Undisclosed figures (NaN) pass the
+        financial bounds unless ``filters.keep_undisclosed`` is false, so a
+        listing is never dropped just because a field could not be parsed.
+
+        Locations are normalized against the offline gazetteer and matched
+        on parsed state (``filters.geo``) or distance from a metro
+        (``filters.geo_radius``); kept listings gain ``city``, ``state`` and
+        ``zip_code``.
+        """
+        if not listings:
+            return []
         
-        # Remove currency symbols and commas
-        cleaned = text.replace('$', '').replace(',', '').replace('USD', '').strip()
+        # Parse financial metrics
+        revenue = parse_currency_array(listing.get('revenue') for listing in listings)
+        cash_flow = parse_currency_array(listing.get('cash_flow') for listing in listings)
+        keep_undisclosed = self.filters.get('keep_undisclosed', True)
         
-        # Handle K/M suffixes
-        if 'M' in cleaned.upper():
-            return float(cleaned.upper().replace('M', '')) * 1_000_000
-        elif 'K' in cleaned.upper():
-            return float(cleaned.upper().replace('K', '')) * 1_000
+        def within(values: np.ndarray, low: float, high: float) -> np.ndarray:
+            with np.errstate(invalid='ignore'):
+                in_range = (values >= low) & (values <= high)
+            return in_range | np.isnan(values) if keep_undisclosed else in_range
+        
+        # Apply filters
+        mask = (within(revenue, self.filters['revenue_min'], self.filters['revenue_max']) &
+                within(cash_flow, self.filters['cash_flow_min'], self.filters['cash_flow_max']))
+        
+        # Check location filter
+        locations = [listing.get('location') for listing in listings]
+        mask &= self.geo.match_mask(locations, self.filters['geo'], self.filters.get('geo_radius'))
         
-        try:
-            return float(cleaned)
-        except:
-            return 0.0
-    
-    def filter_by_criteria(self, listings: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Filter listings based on configured criteria"""
         filtered = []
+        for listing, location, keep in zip(listings, locations, mask):
+            if keep:
+                geo = self.geo.normalize(location)
+                filtered.append(dict(listing, city=geo['city'], state=geo['state'], zip_code=geo['zip_code']))
+        
+        return filtered
+    
+    def load_seen_urls(self) -> Dict[str, str]:
+        """Load listing URLs from previous scans, mapped to the date last seen"""
+        if not os.path.exists(self.seen_urls_path):
+            return {}
+        
+        with open(self.seen_urls_path, 'r') as f:
+            return json.load(f)
+    
+    def save_seen_urls(self, seen_urls: Dict[str, str], finished_urls: Set[str]):
+        """Stamp URLs from finished sectors with today, dropping ones not seen within the retention window"""
+        today = datetime.now().strftime('%Y-%m-%d')
+        cutoff = (datetime.now() - timedelta(days=self.seen_retention_days)).strftime('%Y-%m-%d')
+        
+        seen_urls = {url: date for url, date in seen_urls.items() if date >= cutoff}
+        for url in finished_urls:
+            seen_urls[url] = today
+        
+        with open(self.seen_urls_path, 'w') as f:
+            json.dump(seen_urls, f)
+    
+    async def filter_stream(self, listings: AsyncIterable[Dict[str, Any]]) -> AsyncIterator[Dict[str, Any]]:
+        """Streaming filter stage: applies filter_by_criteria to batches as they arrive"""
+        batch = []
         
-        for listing in listings:
-            # Parse financial metrics
-            revenue = self.parse_currency(listing.get('revenue', '0'))
-            cash_flow = self.parse_currency(listing.get('cash_flow', '0'))
+        async for listing in listings:
+            batch.append(listing)
+            if len(batch) >= self.filter_batch_size:
+                for kept in self.filter_by_criteria(batch):
+                    yield kept
+                batch = []
+        
+        for kept in self.filter_by_criteria(batch):
+            yield kept
+    
+    async def iter_full_scan(self, incremental: bool = None, finished_urls: Set[str] = None) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Yield unfiltered listings from every source as they are scraped
+
+        Sources share one browser and run concurrently; their listings are
+        interleaved in arrival order. Each source is bounded by
+        ``scraper.source_timeout``; listings it yielded before timing out are
+        kept. URLs of BizBuySell sectors scanned to the end are added to
+        ``finished_urls`` (see ``iter_bizbuysell``).
+        """
+        if incremental is None:
+            incremental = self.incremental
+        
+        known_urls = set(self.load_seen_urls()) if incremental else None
+        queue = asyncio.Queue(maxsize=self.queue_size)
+        
+        async def pump(name: str, listings: AsyncIterator[Dict[str, Any]]):
+            print(f"Scanning {name}...")
             
-            # Apply filters
-            if (self.filters['revenue_min'] <= revenue <= self.filters['revenue_max'] and
-                self.filters['cash_flow_min'] <= cash_flow <= self.filters['cash_flow_max']):
-                
-                # Check location filter
-                location = listing.get('location', '').upper()
-                if any(state in location for state in self.filters['geo']):
-                    filtered.append(listing)
+            async def drain():
+                async for listing in listings:
+                    await queue.put(listing)
+            
+            try:
+                await asyncio.wait_for(drain(), timeout=self.source_timeout)
+            except asyncio.TimeoutError:
+                print(f"Timed out scanning {name} after {self.source_timeout:.0f}s")
+            except Exception as e:
+                print(f"Error scanning {name}: {str(e)}")
+            finally:
+                await listings.aclose()
         
-        return filtered
+        async with self._browser_session() as browser:
+            async def produce():
+                await asyncio.gather(
+                    pump('BizBuySell', self.iter_bizbuysell(browser=browser, known_urls=known_urls,
+                                                             finished_urls=finished_urls)),
+                    pump('BizQuest', self.iter_bizquest(browser=browser))
+                )
+                await queue.put(None)  # All sources finished
+            
+            producers = asyncio.create_task(produce())
+            
+            try:
+                while True:
+                    listing = await queue.get()
+                    if listing is None:
+                        break
+                    yield listing
+            finally:
+                producers.cancel()
+                await asyncio.gather(producers, return_exceptions=True)
+    
+    async def run_streaming_scan(self, filename: str = None, incremental: bool = None) -> str:
+        """
+        Scan, filter and write listings as JSON Lines without holding the scan in memory
+
+        Listings flow scraper -> filter_stream -> JsonLinesWriter one at a
+        time, so the output file fills while the scan is still running.
+        """
+        if not filename:
+            filename = f"listings_{datetime.now().strftime('%Y%m%d_%H%M%S')}.jsonl"
+        
+        filepath = os.path.join(self.output_dir, filename)
+        seen_urls = self.load_seen_urls()
+        finished_urls = set()
+        scanned_count = 0
+        
+        async def count_scanned(listings: AsyncIterator[Dict[str, Any]]) -> AsyncIterator[Dict[str, Any]]:
+            nonlocal scanned_count
+            async for listing in listings:
+                scanned_count += 1
+                yield listing
+        
+        print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Starting streaming market scan...")
+        
+        with JsonLinesWriter(filepath) as writer:
+            async for listing in self.filter_stream(count_scanned(self.iter_full_scan(incremental, finished_urls))):
+                writer.write(listing)
+        
+        self.save_seen_urls(seen_urls, finished_urls)
+        
+        print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Scan complete.")
+        print(f"Total listings found: {scanned_count}")
+        print(f"Saved {writer.count} filtered listings to {filepath}")
+        
+        return filepath
+    
+    async def _run_source(self, name: str, scrape_func, browser=None) -> List[Dict[str, Any]]:
+        """
+        Run one source under the per-source timeout
+
+        On timeout or error the listings the source had already collected are
+        returned, so one slow source never discards the rest of the scan.
+        """
+        print(f"Scanning {name}...")
+        partial = []
+        
+        try:
+            return await asyncio.wait_for(
+                scrape_func(browser=browser, partial_results=partial),
+                timeout=self.source_timeout
+            )
+        except asyncio.TimeoutError:
+            print(f"Timed out scanning {name} after {self.source_timeout:.0f}s; keeping {len(partial)} listings")
+        except Exception as e:
+            print(f"Error scanning {name}: {str(e)}; keeping {len(partial)} listings")
+        
+        return partial
     
-    async def run_full_scan(self) -> List[Dict[str, Any]]:
-        """Execute complete scan across all sources"""
+    async def run_full_scan(self, shared_browser: bool = True, incremental: bool = None) -> List[Dict[str, Any]]:
+        """
+        Execute complete scan across all sources
+
+        With ``shared_browser`` (the default) Chromium is launched once and
+        every source runs concurrently in its own context. A source that
+        fails or exceeds ``scraper.source_timeout`` keeps only the listings
+        it collected before failing, while the others are still returned.
+
+        With ``incremental`` (default: ``scraper.incremental``) BizBuySell
+        stops paging each sector once it reaches listings recorded by a
+        previous scan. Only sectors scanned to the end are recorded.
+        """
         all_listings = []
         
         print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Starting advanced market scan...")
         
-        # Scan BizBuySell
-        print("Scanning BizBuySell...")
-        bizbuysell_listings = await self.scrape_bizbuysell_detailed()
-        all_listings.extend(bizbuysell_listings)
+        if incremental is None:
+            incremental = self.incremental
+        
+        seen_urls = self.load_seen_urls()
+        finished_urls = set()
+        scrape_bizbuysell = functools.partial(
+            self.scrape_bizbuysell_detailed,
+            known_urls=set(seen_urls) if incremental else None,
+            finished_urls=finished_urls
+        )
+        
+        if shared_browser:
+            async with self._browser_session() as browser:
+                source_results = await asyncio.gather(
+                    self._run_source('BizBuySell', scrape_bizbuysell, browser),
+                    self._run_source('BizQuest', self.scrape_bizquest_detailed, browser)
+                )
+        else:
+            source_results = [
+                await self._run_source('BizBuySell', scrape_bizbuysell),
+                await self._run_source('BizQuest', self.scrape_bizquest_detailed)
+            ]
         
-        # Scan BizQuest
-        print("Scanning BizQuest...")
-        bizquest_listings = await self.scrape_bizquest_detailed()
-        all_listings.extend(bizquest_listings)
+        for source_listings in source_results:
+            all_listings.extend(source_listings)
+        
+        self.save_seen_urls(seen_urls, finished_urls)
         
         # Filter by criteria
         filtered_listings = self.filter_by_criteria(all_listings)
@@ -217,11 +640,25 @@ class AdvancedScraper:
         print(f"Saved {len(listings)} listings to {filepath}")
         return filepath
 
-async def main():
+async def main(profile_tasks: bool = False):
     """Main execution"""
+    task_timer = None
+    if profile_tasks:
+        from phase_profiler import AsyncTaskTimer
+        task_timer = AsyncTaskTimer()
+        task_timer.install()
+    
     scraper = AdvancedScraper()
-    listings = await scraper.run_full_scan()
-    scraper.save_to_json(listings)
+    await scraper.run_streaming_scan()
+    
+    if task_timer:
+        print("\nAsyncio task timing (creation to completion):")
+        print(task_timer.summary())
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Stream listings from the Playwright scrapers")
+    parser.add_argument('--profile-tasks', action='store_true',
+                        help="Print a per-coroutine breakdown of asyncio task time")
+    asyncio.run(main(profile_tasks=parser.parse_args().profile_tasks))
@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+"""
+App Config - Loads config.json once per process as a shared read-only object
+"""
+
+import json
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Mapping
+
+DEFAULT_CONFIG_PATH = "/home/ubuntu/million_hunter/config.json"
+
+@lru_cache(maxsize=None)
+def load_config(config_path: str = DEFAULT_CONFIG_PATH) -> Mapping[str, Any]:
+    """
+    Parsed config for ``config_path``, read from disk only on first use
+
+    Every component shares the returned object, so it is frozen: mappings
+    become read-only proxies and lists become tuples.
+    """
+    with open(config_path, 'r') as f:
+        return freeze(json.load(f))
+
+def freeze(value):
+    """Recursively convert dicts and lists into read-only equivalents"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(freeze(item) for item in value)
+    return value
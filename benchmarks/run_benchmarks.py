@@ -0,0 +1,324 @@
+#!/usr/bin/env python3
+"""
+Benchmarks - Times the listing and analysis pipeline on synthetic data
+
+    python benchmarks/run_benchmarks.py --sizes 1000 100000 --output bench.json
+    python benchmarks/run_benchmarks.py --sizes 1000 100000 --compare bench.json
+
+Each benchmark reports its best wall time over ``--repeat`` runs, the
+throughput in items per second and the peak traced memory of one extra
+run. ``--compare`` exits non-zero if any benchmark lost more than
+``--tolerance`` of its baseline throughput.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+from typing import List, Dict, Any, Callable
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+
+import numpy as np
+
+from synthetic_listings import generate_listings, with_numeric_financials
+
+BENCH_CONFIG = {
+    "filters": {
+        "sectors": ["hvac", "plumbing", "logistics", "routes", "waste_mgmt", "facilities", "home_services"],
+        "revenue_min": 1000000, "revenue_max": 5000000,
+        "cash_flow_min": 300000, "cash_flow_max": 1500000,
+        "geo": ["GA", "FL", "TX"]
+    },
+    "sources": ["bizbuysell.com", "bizquest.com", "crexi.com", "loopnet.com", "sam.gov"],
+    "score_threshold": 0.7,
+    "ai_optimization_scenarios": {
+        "efficiency_gains": [0.15, 0.30], "cost_reduction": [0.10, 0.25],
+        "revenue_increase": [0.20, 0.40], "lead_gen": [0.15, 0.35], "margin_expansion": [300, 500]
+    }
+}
+
+class BenchmarkContext:
+    """Synthetic data and pipeline components shared by the benchmarks of one size"""
+
+    def __init__(self, size: int, seed: int, analysis_cap: int, memo_cap: int, simulation_cap: int, returns_cap: int,
+                 work_dir: str):
+        from advanced_scraper import AdvancedScraper
+        from investment_analyzer import InvestmentAnalyzer
+        from market_scanner import MarketScanner
+
+        os.makedirs(work_dir, exist_ok=True)
+        config = dict(BENCH_CONFIG, http_cache={'dir': os.path.join(work_dir, 'http_cache')})
+        config_path = os.path.join(work_dir, 'config.json')
+        with open(config_path, 'w') as f:
+            json.dump(config, f)
+
+        self.work_dir = work_dir
+        self.listings = generate_listings(size, seed=seed)
+        self.money_strings = [
+            listing[field] for listing in self.listings for field in ('asking_price', 'revenue', 'cash_flow')
+        ]
+        self.analysis_listings = with_numeric_financials(self.listings[:analysis_cap])
+        self.financial_frame = financial_frame(self.listings)
+        self.memo_cap = memo_cap
+        self.simulation_cap = simulation_cap
+        self.returns_cap = returns_cap
+
+        self.scraper = AdvancedScraper(config_path)
+        self.scraper.output_dir = work_dir
+        self.scanner = MarketScanner(config_path)
+        self.scanner.output_dir = work_dir
+        self.analyzer = InvestmentAnalyzer(config_path)
+        self.analyzer.output_dir = work_dir
+
+        # Intermediate models, so each analyzer step is timed on its own
+        self.models = [self.analyzer.build_5yr_cashflow_model(listing) for listing in self.analysis_listings]
+        self.analyses = [self._analysis(listing, model) for listing, model in zip(self.analysis_listings, self.models)]
+
+    def _analysis(self, listing: Dict[str, Any], model: Dict[str, Any]) -> Dict[str, Any]:
+        ai_scenarios = self.analyzer.apply_ai_optimization_scenarios(listing, model)
+        return {
+            'listing': listing,
+            'score': {'final_score': 0.8},
+            'cashflow_model': model,
+            'ai_scenarios': ai_scenarios,
+            'valuation': self.analyzer.run_valuation_methods(listing, model),
+            'returns': self.analyzer.returns.analyze(listing, ai_scenarios),
+            'competition': self.analyzer.research_local_competition(listing),
+            'govt_contracts': self.analyzer.identify_govt_contract_ops(listing),
+            'ai_roadmap': self.analyzer.build_post_acq_ai_roadmap(listing),
+            'investment_thesis': ''
+        }
+
+def financial_frame(listings: List[Dict[str, Any]]):
+    """Parsed financials of every listing as the DataFrame a ListingsArchive read returns"""
+    import pandas as pd
+    from currency_parser import parse_currency_array
+
+    return pd.DataFrame({
+        f"{field}_value": parse_currency_array(listing.get(field) for listing in listings)
+        for field in ('revenue', 'cash_flow', 'asking_price')
+    })
+
+def benchmark_suite(ctx: BenchmarkContext) -> Dict[str, Callable[[], int]]:
+    """Name -> callable returning the number of items it processed"""
+    from currency_parser import parse_currency, parse_currency_array
+    from listing_io import JsonLinesWriter
+    from listings_archive import ListingsArchive
+
+    analyzer = ctx.analyzer
+
+    def parse_scalar():
+        for text in ctx.money_strings:
+            parse_currency(text)
+        return len(ctx.money_strings)
+
+    def parse_batch():
+        parse_currency_array(ctx.money_strings)
+        return len(ctx.money_strings)
+
+    def filter_listings():
+        ctx.scraper.filter_by_criteria(ctx.listings)
+        return len(ctx.listings)
+
+    def cashflow_models():
+        for listing in ctx.analysis_listings:
+            analyzer.build_5yr_cashflow_model(listing)
+        return len(ctx.analysis_listings)
+
+    def ai_scenarios():
+        for listing, model in zip(ctx.analysis_listings, ctx.models):
+            analyzer.apply_ai_optimization_scenarios(listing, model)
+        return len(ctx.analysis_listings)
+
+    def valuations():
+        for listing, model in zip(ctx.analysis_listings, ctx.models):
+            analyzer.run_valuation_methods(listing, model)
+        return len(ctx.analysis_listings)
+
+    def batch_models():
+        analyzer.analyze_batch(ctx.financial_frame)
+        return len(ctx.financial_frame)
+
+    def simulations():
+        from deal_simulation import DealSimulator
+        simulator = DealSimulator(BENCH_CONFIG, paths=100_000)
+        listings = ctx.analysis_listings[:ctx.simulation_cap]
+        simulator.simulate_batch(listings)
+        return len(listings) * simulator.paths
+
+    def sensitivity_grids():
+        from valuation_sensitivity import ValuationSensitivity, _valuation_grid
+        _valuation_grid.cache_clear()
+        sensitivity = ValuationSensitivity(BENCH_CONFIG)
+        for listing in ctx.analysis_listings:
+            sensitivity.summary(listing)
+        return len(ctx.analysis_listings)
+
+    def financing_returns():
+        batch = analyzer.analyze_batch(ctx.financial_frame[:ctx.returns_cap])
+        results = analyzer.returns.returns_batch(batch['scenarios']['cash_flow'], batch['financials']['asking_price'],
+                                                 batch['valid'])
+        return results['irr'].size
+
+    def theses():
+        for analysis in ctx.analyses:
+            analyzer.generate_investment_thesis(analysis['listing'], analysis)
+        return len(ctx.analyses)
+
+    def save_csv():
+        ctx.scanner.save_listings(ctx.listings, 'bench_listings.csv')
+        return len(ctx.listings)
+
+    def save_json():
+        ctx.scraper.save_to_json(ctx.listings, 'bench_listings.json')
+        return len(ctx.listings)
+
+    def save_jsonl():
+        with JsonLinesWriter(os.path.join(ctx.work_dir, 'bench_listings.jsonl')) as writer:
+            writer.write_all(ctx.listings)
+        return len(ctx.listings)
+
+    def save_archive():
+        archive_dir = tempfile.mkdtemp(prefix='archive_', dir=ctx.work_dir)
+        return ListingsArchive(archive_dir).append(ctx.listings, 'bench')
+
+    def save_memos():
+        memos = ctx.analyses[:ctx.memo_cap]
+        for i, analysis in enumerate(memos):
+            analyzer.save_investment_memo(analysis, f"bench_memo_{i}.md")
+        return len(memos)
+
+    return {
+        'parse_currency': parse_scalar,
+        'parse_currency_array': parse_batch,
+        'filter_by_criteria': filter_listings,
+        'build_5yr_cashflow_model': cashflow_models,
+        'apply_ai_optimization_scenarios': ai_scenarios,
+        'run_valuation_methods': valuations,
+        'analyze_batch': batch_models,
+        'deal_simulation_paths': simulations,
+        'valuation_sensitivity': sensitivity_grids,
+        'financing_returns_irr': financing_returns,
+        'generate_investment_thesis': theses,
+        'save_listings_csv': save_csv,
+        'save_to_json': save_json,
+        'save_jsonl': save_jsonl,
+        'listings_archive_append': save_archive,
+        'save_investment_memo': save_memos
+    }
+
+def run_benchmark(func: Callable[[], int], repeat: int) -> Dict[str, Any]:
+    # Save paths print per call; keep the benchmark output readable
+    quiet = contextlib.redirect_stdout(io.StringIO())
+
+    timings = []
+    for _ in range(repeat):
+        with quiet:
+            start = time.perf_counter()
+            items = func()
+            timings.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    with quiet:
+        func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    best = min(timings)
+    return {
+        'items': items,
+        'seconds': round(best, 6),
+        'items_per_s': round(items / best, 1) if best > 0 else None,
+        'peak_mb': round(peak / 1e6, 2)
+    }
+
+def compare(results: Dict[str, Dict[str, Any]], baseline: Dict[str, Dict[str, Any]], tolerance: float) -> List[str]:
+    """Print throughput vs baseline; return the names that regressed"""
+    regressions = []
+    print(f"\n{'benchmark':<48} {'baseline/s':>13} {'current/s':>13} {'change':>8}")
+    for name, result in results.items():
+        base = baseline.get(name)
+        if not base or not base.get('items_per_s') or not result.get('items_per_s'):
+            print(f"{name:<48} {'-':>13} {result.get('items_per_s') or 0:>13,.0f} {'new':>8}")
+            continue
+
+        change = result['items_per_s'] / base['items_per_s'] - 1
+        flag = ''
+        if change < -tolerance:
+            regressions.append(name)
+            flag = '  REGRESSION'
+        print(f"{name:<48} {base['items_per_s']:>13,.0f} {result['items_per_s']:>13,.0f} {change:>+8.1%}{flag}")
+    return regressions
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the listing and analysis pipeline on synthetic data")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 10000],
+                        help="Listing counts to benchmark (1000 to 1000000)")
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--repeat', type=int, default=3, help="Timed runs per benchmark; the best is kept")
+    parser.add_argument('--only', nargs='+', metavar='NAME', help="Run only these benchmarks")
+    parser.add_argument('--analysis-cap', type=int, default=20000,
+                        help="Max listings for the per-listing analyzer benchmarks")
+    parser.add_argument('--memo-cap', type=int, default=200, help="Max memos written by save_investment_memo")
+    parser.add_argument('--simulation-cap', type=int, default=10,
+                        help="Listings simulated (100k Monte Carlo paths each) by deal_simulation_paths")
+    parser.add_argument('--returns-cap', type=int, default=2000,
+                        help="Max listings solved across every financing structure by financing_returns_irr")
+    parser.add_argument('--output', help="Write results to this JSON file (a baseline for --compare)")
+    parser.add_argument('--compare', metavar='BASELINE', help="Compare against a previous --output file")
+    parser.add_argument('--tolerance', type=float, default=0.2,
+                        help="Allowed throughput loss before --compare reports a regression (default: 0.2)")
+    args = parser.parse_args()
+
+    results = {}
+    with tempfile.TemporaryDirectory(prefix='signal_bench_') as work_dir:
+        for size in args.sizes:
+            print(f"Generating {size:,} synthetic listings...")
+            ctx = BenchmarkContext(size, args.seed, min(size, args.analysis_cap), args.memo_cap, args.simulation_cap,
+                                   args.returns_cap,
+                                   os.path.join(work_dir, str(size)))
+            suite = benchmark_suite(ctx)
+
+            for name, func in suite.items():
+                if args.only and name not in args.only:
+                    continue
+                key = f"{name}[{size}]"
+                results[key] = run_benchmark(func, args.repeat)
+                result = results[key]
+                print(f"  {key:<46} {result['seconds']:>9.4f}s {result['items_per_s'] or 0:>13,.0f}/s "
+                      f"{result['peak_mb']:>9.2f} MB peak")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump({
+                'meta': {
+                    'created': datetime.now().isoformat(),
+                    'seed': args.seed,
+                    'repeat': args.repeat,
+                    'python': platform.python_version(),
+                    'numpy': np.__version__,
+                    'machine': platform.platform()
+                },
+                'results': results
+            }, f, indent=2)
+        print(f"\nResults saved to {args.output}")
+
+    if args.compare:
+        with open(args.compare, 'r') as f:
+            baseline = json.load(f)['results']
+        regressions = compare(results, baseline, args.tolerance)
+        if regressions:
+            print(f"\n{len(regressions)} regression(s): {', '.join(regressions)}")
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Synthetic Listings - Deterministic generator of realistic, messy marketplace listings
+"""
+
+import json
+import os
+from typing import List, Dict, Any
+
+import numpy as np
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SOURCES = ['bizbuysell.com', 'bizquest.com', 'crexi.com', 'loopnet.com', 'sam.gov']
+
+SECTORS = ['hvac', 'plumbing', 'logistics', 'routes', 'waste_mgmt', 'facilities', 'home_services',
+           'restaurants', 'retail', 'manufacturing']
+
+TITLE_PREFIXES = ['Established', 'Profitable', 'Turnkey', 'Growing', 'Family-Owned', 'Award-Winning', 'Absentee-Run']
+TITLE_NOUNS = {
+    'hvac': 'HVAC Contractor', 'plumbing': 'Plumbing Company', 'logistics': 'Freight Brokerage',
+    'routes': 'Delivery Route Business', 'waste_mgmt': 'Dumpster Rental Company',
+    'facilities': 'Commercial Cleaning Company', 'home_services': 'Pest Control Franchise',
+    'restaurants': 'Full-Service Restaurant', 'retail': 'Specialty Retail Store', 'manufacturing': 'Machine Shop'
+}
+
+UNDISCLOSED = ['N/A', 'Not Disclosed', '', None, 'Call for details']
+
+def generate_listings(count: int, seed: int = 42) -> List[Dict[str, Any]]:
+    """
+    ``count`` listings shaped like scraper output, identical for a given seed
+
+    Money fields mix formats the parser has to cope with ("$1,250,000",
+    "$1.2M", "1.2 million", "$500K - $750K", "$1-2M", undisclosed), and
+    locations mix "City, ST", ZIP suffixes, full state names, metro
+    qualifiers, upper case and unparseable text.
+    """
+    rng = np.random.default_rng(seed)
+
+    with open(os.path.join(REPO_ROOT, 'gazetteer_us.json'), 'r') as f:
+        gazetteer = json.load(f)
+    cities = gazetteer['cities']
+    state_names = gazetteer['states']
+
+    # Log-normal revenue around $2M; SDE margin 8-35%; asking 1.5-4.5x SDE
+    revenue = np.exp(rng.normal(np.log(2_000_000), 0.8, count))
+    cash_flow = revenue * rng.uniform(0.08, 0.35, count)
+    asking = cash_flow * rng.uniform(1.5, 4.5, count)
+
+    sector_idx = rng.integers(0, len(SECTORS), count)
+    source_idx = rng.integers(0, len(SOURCES), count)
+    prefix_idx = rng.integers(0, len(TITLE_PREFIXES), count)
+    city_idx = rng.integers(0, len(cities), count)
+    zips = rng.integers(10000, 99999, count)
+
+    money_format = rng.integers(0, 100, (3, count))
+    location_format = rng.integers(0, 100, count)
+    undisclosed_idx = rng.integers(0, len(UNDISCLOSED), (3, count))
+    day = rng.integers(1, 29, count)
+
+    # Plain Python lists: per-element access on NumPy arrays dominates the loop otherwise
+    money = list(zip(*(column.tolist() for column in (asking, revenue, cash_flow))))
+    money_format = list(zip(*money_format.tolist()))
+    undisclosed_idx = list(zip(*undisclosed_idx.tolist()))
+    sector_idx, source_idx, prefix_idx = sector_idx.tolist(), source_idx.tolist(), prefix_idx.tolist()
+    city_idx, zips, location_format, day = city_idx.tolist(), zips.tolist(), location_format.tolist(), day.tolist()
+
+    listings = []
+    for i in range(count):
+        sector = SECTORS[sector_idx[i]]
+        amounts = [
+            _format_money(value, style, UNDISCLOSED[undisclosed])
+            for value, style, undisclosed in zip(money[i], money_format[i], undisclosed_idx[i])
+        ]
+
+        city, state = cities[city_idx[i]][0], cities[city_idx[i]][1]
+        listings.append({
+            'source': SOURCES[source_idx[i]],
+            'title': f"{TITLE_PREFIXES[prefix_idx[i]]} {TITLE_NOUNS[sector]} #{i}",
+            'sector': sector,
+            'asking_price': amounts[0],
+            'revenue': amounts[1],
+            'cash_flow': amounts[2],
+            'location': _format_location(city, state, state_names[state], zips[i], location_format[i]),
+            'url': f"https://www.{SOURCES[source_idx[i]]}/listing/{i}",
+            'scan_date': f"2026-01-{day[i]:02d}T06:00:00",
+            'status': 'active',
+            'type': 'business_sale'
+        })
+
+    return listings
+
+def with_numeric_financials(listings: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Copies carrying the parsed ``*_numeric`` fields the analyzer reads"""
+    from currency_parser import parse_currency_array
+
+    numeric = {
+        field: parse_currency_array(listing.get(field) for listing in listings)
+        for field in ('revenue', 'cash_flow', 'asking_price')
+    }
+    defaults = {'revenue': 2000000.0, 'cash_flow': 600000.0, 'asking_price': 1800000.0}
+
+    enriched = []
+    for i, listing in enumerate(listings):
+        listing = dict(listing)
+        for field, values in numeric.items():
+            value = values[i]
+            listing[f"{field}_numeric"] = defaults[field] if np.isnan(value) else float(value)
+        enriched.append(listing)
+    return enriched
+
+def _format_money(value: float, style: int, undisclosed) -> Any:
+    if style < 10:
+        return undisclosed
+    if style < 40:
+        return f"${value:,.0f}"
+    if style < 60:
+        return f"${value / 1e6:.1f}M" if value >= 1e6 else f"${value / 1e3:.0f}K"
+    if style < 70:
+        return f"{value / 1e6:.2f} million"
+    if style < 80:
+        low, high = value * 0.9, value * 1.1
+        return f"${low / 1e3:,.0f}K - ${high / 1e3:,.0f}K"
+    if style < 85:
+        return f"${int(value // 1e6)}-{int(value // 1e6) + 1}M"
+    if style < 95:
+        return f"{value:.0f}"
+    return f"${value:,.0f} (est.)"
+
+def _format_location(city: str, state: str, state_name: str, zip_code: int, style: int) -> Any:
+    if style < 45:
+        return f"{city}, {state}"
+    if style < 55:
+        return f"{city}, {state} {zip_code:05d}"
+    if style < 65:
+        return f"{city}, {state_name}"
+    if style < 72:
+        return f"Metro {city}"
+    if style < 78:
+        return f"{city} Area, {state_name}"
+    if style < 85:
+        return f"{city.upper()}, {state}"
+    if style < 90:
+        return f"{city} {state}"
+    if style < 95:
+        return state
+    return ['Remote', 'N/A', '', 'Undisclosed', None][style - 95]
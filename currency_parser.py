@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Currency Parser - Compiled-regex parsing of listing money strings, scalar and batch
+"""
+
+import math
+import re
+from typing import Iterable
+
+import numpy as np
+
+_UNIT = r'(?:million|thousand|billion|mm|[kmb])'
+
+# Amount with optional sign ("-$50K", "$-50K", accounting "($50K)"), "$" and
+# unit, optionally followed by "- / – / to" and a second amount:
+# "$1.2M (est.)", "1,200,000", "$500K - $750K", "$1-2M"
+AMOUNT_RE = re.compile(
+    r'(?P<open>\()?\s*(?P<minus>-\s*)?(?P<dollar>\$)?\s*(?P<minus_after>-\s*)?'
+    rf'(?P<low>\d+(?:\.\d+)?)\s*(?P<low_unit>{_UNIT})?(?![a-z])'
+    rf'(?:\s*(?:-|–|to)\s*\$?\s*(?P<high>\d+(?:\.\d+)?)\s*(?P<high_unit>{_UNIT})?(?![a-z]))?',
+    re.IGNORECASE
+)
+
+UNIT_MULTIPLIERS = {
+    '': 1.0,
+    'k': 1e3,
+    'thousand': 1e3,
+    'm': 1e6,
+    'mm': 1e6,
+    'million': 1e6,
+    'b': 1e9,
+    'billion': 1e9
+}
+
+def parse_currency(text) -> float:
+    """
+    Parse a currency string to float
+
+    Returns NaN for anything without an amount ("N/A", "Not Disclosed",
+    empty). A "$" amount wins over bare numbers before it ("2019 est.
+    $1.2M" is 1.2M). Leading minus signs and accounting parentheses make
+    the amount negative. Ranges resolve to their midpoint; a unit on the
+    upper bound applies to a bare lower bound ("$1-2M" is 1.5M).
+    """
+    if text is None:
+        return math.nan
+
+    cleaned = str(text).replace(',', '')
+    match = None
+    for candidate in AMOUNT_RE.finditer(cleaned):
+        if candidate.group('dollar'):
+            match = candidate
+            break
+        match = match or candidate
+    if not match:
+        return math.nan
+
+    low_unit = (match.group('low_unit') or '').lower()
+    high_unit = (match.group('high_unit') or '').lower()
+
+    if match.group('high') is None:
+        amount = float(match.group('low')) * UNIT_MULTIPLIERS[low_unit]
+    else:
+        low = float(match.group('low')) * UNIT_MULTIPLIERS[low_unit or high_unit]
+        high = float(match.group('high')) * UNIT_MULTIPLIERS[high_unit or low_unit]
+        amount = (low + high) / 2
+
+    negative = match.group('minus') or match.group('minus_after') or (
+        match.group('open') and cleaned[match.end():].lstrip().startswith(')')
+    )
+    return -amount if negative else amount
+
+def parse_currency_array(values: Iterable) -> np.ndarray:
+    """
+    Parse a whole column of currency strings at once
+
+    Same rules as ``parse_currency``. The column is factorized first so
+    each distinct string is parsed once (listing columns repeat heavily:
+    "N/A", "Not Disclosed", round asking prices); returns a float64 array
+    with NaN where no amount could be parsed.
+    """
+    import pandas as pd  # only batch callers pay for the import
+
+    codes, uniques = pd.factorize(pd.Series(list(values), dtype='object'))
+    if len(codes) == 0:
+        return np.empty(0, dtype=np.float64)
+
+    parsed = np.fromiter((parse_currency(value) for value in uniques), dtype=np.float64, count=len(uniques))
+
+    # Missing values get code -1; route them to a trailing NaN slot
+    parsed = np.append(parsed, np.nan)
+    return parsed[codes]
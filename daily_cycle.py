@@ -3,22 +3,195 @@
 Daily Cycle Orchestrator - Executes the complete daily acquisition workflow
 """
 
+import argparse
 import json
+import math
+import multiprocessing
 import os
 import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, FIRST_COMPLETED, wait
+from dataclasses import dataclass, field, asdict
 from datetime import datetime
+from functools import cached_property
 from pathlib import Path
+from typing import List, Dict, Any, Optional, Tuple
 
-# Add project root to path
-sys.path.insert(0, '/home/ubuntu/million_hunter')
+# Add project root and component directories to path; modules import each
+# other by bare name (e.g. ``from currency_parser import ...``), so each one
+# is loaded exactly once whichever directory it lives in
+PROJECT_ROOT = '/home/ubuntu/million_hunter'
+sys.path[:0] = [PROJECT_ROOT] + [
+    os.path.join(PROJECT_ROOT, component) for component in ('scrapers', 'analysis', 'models', 'outreach')
+]
 
-from scrapers.market_scanner import MarketScanner
-from models.scoring_engine import ScoringEngine
-from analysis.investment_analyzer import InvestmentAnalyzer
-from outreach.outreach_manager import OutreachManager
+from app_config import load_config
+from structured_log import StructuredLogger
+
+# Components are imported and built on first use (see the properties on
+# DailyCycleOrchestrator), so a single-phase run never loads the scraping stack
+
+# Stand-ins for financials a listing does not disclose
+PLACEHOLDER_FINANCIALS = {
+    'revenue': 2000000,
+    'cash_flow': 600000,
+    'asking_price': 1800000
+}
+
+@dataclass
+class ScanResult:
+    """New or changed listings from the market scan"""
+    listings: List[Dict[str, Any]]
+    counts: Dict[str, int]
+    path: Optional[str] = None
+    # Set once the scan has been written to the listing store
+    committed: bool = False
+    
+    @property
+    def item_count(self) -> int:
+        return len(self.listings)
+
+@dataclass
+class ScoringResult:
+    """Scored opportunities, in the scoring engine's rank order"""
+    opportunities: List[Dict[str, Any]]
+    path: Optional[str] = None
+    
+    @property
+    def item_count(self) -> int:
+        return len(self.opportunities)
+    
+    def stats(self) -> Dict[str, Any]:
+        scores = [o.get('final_score', 0) for o in self.opportunities]
+        return {
+            'opportunities_scored': len(self.opportunities),
+            'high_score_count': sum(1 for o in self.opportunities if o.get('meets_threshold', False)),
+            'avg_score': sum(scores) / len(scores) if scores else 0,
+            'top_score': max(scores, default=0),
+            'top_opportunities': self.opportunities[:3]
+        }
+
+@dataclass
+class AnalysisResult:
+    """Investment analyses produced for high-score opportunities"""
+    analyses: List[Dict[str, Any]] = field(default_factory=list)
+    errors: int = 0
+    
+    @property
+    def memos_generated(self) -> int:
+        return len(self.analyses)
+    
+    @property
+    def item_count(self) -> int:
+        return self.memos_generated
+
+@dataclass
+class OutreachResult:
+    """Outcome of the day's outreach campaign"""
+    campaign_id: str
+    emails_prepared: int
+    sent: int
+    details: Dict[str, Any] = field(default_factory=dict)
+    
+    @property
+    def item_count(self) -> int:
+        return self.sent
+
+@dataclass
+class ReportResult:
+    """Where the daily report was written"""
+    path: str
+    
+    @property
+    def item_count(self) -> int:
+        return 1
+
+@dataclass(frozen=True)
+class PhaseSpec:
+    """A node in the cycle DAG: run ``method`` with the results of ``requires``"""
+    name: str
+    method: str
+    requires: Tuple[str, ...]
+    result_type: type
+
+# Analysis and outreach only need scoring, so they run side by side
+CYCLE_PHASES = (
+    PhaseSpec('scan', 'run_market_scan', (), ScanResult),
+    PhaseSpec('scoring', 'run_scoring', ('scan',), ScoringResult),
+    PhaseSpec('analysis', 'run_analysis', ('scoring',), AnalysisResult),
+    PhaseSpec('outreach', 'run_outreach', ('scoring',), OutreachResult),
+    PhaseSpec('report', 'run_report', ('scan', 'scoring', 'analysis', 'outreach'), ReportResult)
+)
+
+def downstream_phases(name: str) -> List[str]:
+    """Every phase that depends on ``name``, directly or transitively, in DAG order"""
+    affected = {name}
+    for spec in CYCLE_PHASES:
+        if affected.intersection(spec.requires):
+            affected.add(spec.name)
+    return [spec.name for spec in CYCLE_PHASES if spec.name in affected and spec.name != name]
+
+# Per-process analyzer for the analysis pool (set by _init_analysis_worker)
+_worker_analyzer = None
+
+def _init_analysis_worker(config_path: str):
+    global _worker_analyzer
+    from investment_analyzer import InvestmentAnalyzer
+    _worker_analyzer = InvestmentAnalyzer(config_path)
+
+def _analyze_in_worker(listing: Dict[str, Any], opp: Dict[str, Any], profile_dir: Optional[str] = None) -> Dict[str, Any]:
+    if profile_dir:
+        from phase_profiler import profile_call
+        return profile_call(profile_dir, _analyze_and_save, _worker_analyzer, listing, opp)
+    return _analyze_and_save(_worker_analyzer, listing, opp)
+
+def _analyze_and_save(analyzer, listing: Dict[str, Any], opp: Dict[str, Any]) -> Dict[str, Any]:
+    from investment_analyzer import memo_filename
+    from listing_io import listing_fingerprint
+    
+    analysis = analyzer.analyze_opportunity(listing, opp)
+    # Keyed by the listing's identity, so concurrent workers never share a memo file
+    analyzer.save_investment_memo(analysis, memo_filename(listing['title'], listing_fingerprint(opp)))
+    return analysis
+
+class CycleCheckpoint:
+    """Phase results of one cycle, saved as JSON under ``<checkpoint_dir>/<cycle_id>/``"""
+    
+    def __init__(self, checkpoint_dir: str, cycle_id: str):
+        self.cycle_dir = os.path.join(checkpoint_dir, cycle_id)
+    
+    def exists(self) -> bool:
+        return os.path.isdir(self.cycle_dir)
+    
+    def save(self, phase: str, result):
+        os.makedirs(self.cycle_dir, exist_ok=True)
+        
+        path = self._path(phase)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(asdict(result), f, default=str)
+        os.replace(tmp_path, path)
+    
+    def load(self, phase: str, result_type: type):
+        """The saved result of ``phase``, or None if it has not completed"""
+        path = self._path(phase)
+        if not os.path.exists(path):
+            return None
+        
+        with open(path, 'r') as f:
+            return result_type(**json.load(f))
+    
+    def delete(self, phase: str):
+        """Forget a phase's result, if it has one"""
+        try:
+            os.remove(self._path(phase))
+        except FileNotFoundError:
+            pass
+    
+    def _path(self, phase: str) -> str:
+        return os.path.join(self.cycle_dir, f"{phase}.json")
 
 class DailyCycleOrchestrator:
-    def __init__(self):
+    def __init__(self, cycle_id: Optional[str] = None, profile: bool = False, profile_top_n: int = 20):
         self.config_path = "/home/ubuntu/million_hunter/config.json"
         self.output_dir = "/home/ubuntu/million_hunter/output"
         self.log_dir = "/home/ubuntu/million_hunter/logs"
@@ -27,30 +200,82 @@ class DailyCycleOrchestrator:
         os.makedirs(self.output_dir, exist_ok=True)
         os.makedirs(self.log_dir, exist_ok=True)
         
-        # Load configuration
-        with open(self.config_path, 'r') as f:
-            self.config = json.load(f)
+        # Load configuration (shared with every component)
+        self.config = load_config(self.config_path)
+        
+        self.cycle_id = cycle_id or f"cycle_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        self.log_file = os.path.join(self.log_dir, f"{self.cycle_id}.jsonl")
+        self.logger = StructuredLogger(self.log_file, cycle_id=self.cycle_id)
+        
+        self.checkpoint = CycleCheckpoint(
+            self.config.get('checkpoint_dir', "/home/ubuntu/million_hunter/data/checkpoints"),
+            self.cycle_id
+        )
         
-        # Initialize components
-        self.scanner = MarketScanner(self.config_path)
-        self.scoring_engine = ScoringEngine(self.config_path)
-        self.analyzer = InvestmentAnalyzer(self.config_path)
-        self.outreach_manager = OutreachManager(self.config_path)
+        # Store writes and archive rows of the last scan, held back until its CSV and checkpoint are saved
+        self._pending_scan = None
+        self._pending_archive = None
         
-        self.cycle_id = f"cycle_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
-        self.log_file = os.path.join(self.log_dir, f"{self.cycle_id}.log")
+        # --profile: cProfile + tracemalloc around each phase
+        self.profiler = None
+        if profile:
+            from phase_profiler import PhaseProfiler
+            self.profiler = PhaseProfiler(
+                os.path.join(self.output_dir, 'profiles', self.cycle_id),
+                top_n=profile_top_n
+            )
         
+    @cached_property
+    def scanner(self):
+        from market_scanner import MarketScanner
+        return MarketScanner(self.config_path)
+    
+    @cached_property
+    def scoring_engine(self):
+        from scoring_engine import ScoringEngine
+        return ScoringEngine(self.config_path)
+    
+    @cached_property
+    def analyzer(self):
+        from investment_analyzer import InvestmentAnalyzer
+        return InvestmentAnalyzer(self.config_path)
+    
+    @cached_property
+    def outreach_manager(self):
+        from outreach_manager import OutreachManager
+        return OutreachManager(self.config_path)
+    
+    @cached_property
+    def deduplicator(self):
+        from listing_dedup import ListingDeduplicator
+        dedup_config = self.config.get('dedup', {})
+        return ListingDeduplicator(
+            dedup_config.get('index_dir', "/home/ubuntu/million_hunter/data/dedup_index"),
+            threshold=dedup_config.get('threshold', 0.5)
+        )
+    
+    @cached_property
+    def listing_store(self):
+        from listing_store import ListingStore
+        return ListingStore(
+            self.config.get('listing_store_path', "/home/ubuntu/million_hunter/data/listings.db")
+        )
+    
+    @cached_property
+    def listings_archive(self):
+        from listings_archive import ListingsArchive
+        return ListingsArchive(
+            self.config.get('archive_dir', "/home/ubuntu/million_hunter/data/listings_archive")
+        )
+    
     def log(self, message: str, level: str = "INFO"):
-        """Log message to file and console"""
+        """Log message to console and the cycle's JSON Lines log"""
         timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        log_message = f"[{timestamp}] [{level}] {message}"
+        print(f"[{timestamp}] [{level}] {message}")
         
-        print(log_message)
-        
-        with open(self.log_file, 'a') as f:
-            f.write(log_message + '\n')
+        self.logger.log(message, level=level)
     
-    def run_market_scan(self) -> str:
+    def run_market_scan(self) -> ScanResult:
         """Execute market scanning phase"""
         self.log("=" * 80)
         self.log("PHASE 1: MARKET SCAN")
@@ -60,38 +285,55 @@ class DailyCycleOrchestrator:
             # Run market scan
             listings = self.scanner.scan_all_sources()
             
-            # Save listings
+            # Collapse the same business posted on several sites
+            scanned_count = len(listings)
+            listings = self.deduplicator.dedupe(listings)
+            self.log(f"Deduplication: {scanned_count} listings -> {len(listings)} unique businesses")
+            
+            # Only new or materially changed listings go downstream; the store
+            # absorbs the scan, and every unique listing goes into the
+            # market-history archive, once its CSV and checkpoint are on disk
+            delta, self._pending_scan = self.listing_store.diff_scan(listings)
+            self._pending_archive = listings
+            new_count = sum(1 for l in delta if l['change_type'] == 'new')
+            counts = {
+                'scanned': scanned_count,
+                'unique': len(listings),
+                'new': new_count,
+                'changed': len(delta) - new_count
+            }
+            self.log(f"Change detection: {new_count} new, {len(delta) - new_count} changed, "
+                     f"{len(listings) - len(delta)} unchanged")
+            
+            # Persist for the record; later phases use the in-memory listings
             filename = f"listings_{self.cycle_id}.csv"
-            filepath = self.scanner.save_listings(listings, filename)
+            filepath = self.scanner.save_listings(delta, filename)
             
-            self.log(f"Market scan complete: {len(listings)} listings found")
+            self.log(f"Market scan complete: {len(listings)} listings found, {len(delta)} to process")
             self.log(f"Saved to: {filepath}")
             
-            return filepath
+            return ScanResult(listings=delta, counts=counts, path=filepath)
             
         except Exception as e:
             self.log(f"Error in market scan: {str(e)}", level="ERROR")
             raise
     
-    def run_scoring(self, listings_file: str) -> str:
+    def run_scoring(self, scan: ScanResult) -> ScoringResult:
         """Execute scoring phase"""
         self.log("=" * 80)
         self.log("PHASE 2: OPPORTUNITY SCORING")
         self.log("=" * 80)
         
+        if not scan.listings:
+            self.log("No new or changed listings; nothing to score")
+            return ScoringResult(opportunities=[])
+        
         try:
-            # Load listings
-            import csv
             listings = []
-            
-            with open(listings_file, 'r') as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    # Add mock financial data for scoring
-                    row['revenue_numeric'] = 2000000
-                    row['cash_flow_numeric'] = 600000
-                    row['description'] = 'Established business with growth potential'
-                    listings.append(row)
+            for listing in scan.listings:
+                listing = dict(listing, **self._numeric_financials(listing))
+                listing.setdefault('description', 'Established business with growth potential')
+                listings.append(listing)
             
             # Score listings
             scored_listings = self.scoring_engine.score_batch(listings)
@@ -106,80 +348,97 @@ class DailyCycleOrchestrator:
             self.log(f"High-score opportunities (≥{self.config['score_threshold']}): {high_score_count}")
             self.log(f"Saved to: {filepath}")
             
-            return filepath
+            return ScoringResult(opportunities=scored_listings, path=filepath)
             
         except Exception as e:
             self.log(f"Error in scoring: {str(e)}", level="ERROR")
             raise
     
-    def run_analysis(self, scored_file: str) -> int:
+    def run_analysis(self, scoring: ScoringResult) -> AnalysisResult:
         """Execute investment analysis phase"""
         self.log("=" * 80)
         self.log("PHASE 3: INVESTMENT ANALYSIS")
         self.log("=" * 80)
         
         try:
-            # Load scored opportunities
-            with open(scored_file, 'r') as f:
-                scored_opportunities = json.load(f)
-            
             # Filter for high-scoring opportunities (≥0.70)
             high_score_opps = [
-                opp for opp in scored_opportunities 
+                opp for opp in scoring.opportunities
                 if opp.get('final_score', 0) >= 0.70
             ]
             
-            self.log(f"Analyzing {len(high_score_opps)} high-score opportunities")
+            workers = min(self._analysis_workers(), len(high_score_opps)) or 1
+            self.log(f"Analyzing {len(high_score_opps)} high-score opportunities ({workers} workers)")
             
-            # Analyze top opportunities
-            analyzed_count = 0
-            for opp in high_score_opps[:10]:  # Analyze top 10
-                try:
-                    # Create mock listing data
-                    listing = {
-                        'title': opp.get('title', 'Business Opportunity'),
-                        'sector': opp.get('sector', 'business_services'),
-                        'location': 'Atlanta, GA',
-                        'revenue_numeric': 2000000,
-                        'cash_flow_numeric': 600000,
-                        'asking_price_numeric': 1800000,
-                        'description': 'Established business with AI optimization potential'
-                    }
-                    
-                    # Run analysis
-                    analysis = self.analyzer.analyze_opportunity(listing, opp)
-                    
-                    # Save investment memo
-                    self.analyzer.save_investment_memo(analysis)
-                    
-                    analyzed_count += 1
-                    
-                except Exception as e:
-                    self.log(f"Error analyzing opportunity {opp.get('title', 'unknown')}: {str(e)}", level="WARNING")
+            # Analyze every opportunity; one failure doesn't stop the rest
+            result = AnalysisResult()
+            listings = [self._analysis_listing(opp) for opp in high_score_opps]
+            outcomes = self._iter_analyses(listings, high_score_opps, workers)
+            
+            for opp, (analysis, error) in zip(high_score_opps, outcomes):
+                if error is not None:
+                    self.log(f"Error analyzing opportunity {opp.get('title', 'unknown')}: {str(error)}", level="WARNING")
+                    result.errors += 1
                     continue
+                
+                result.analyses.append(analysis)
             
-            self.log(f"Analysis complete: {analyzed_count} investment memos generated")
+            self.log(f"Analysis complete: {result.memos_generated} investment memos generated")
             
-            return analyzed_count
+            return result
             
         except Exception as e:
             self.log(f"Error in analysis: {str(e)}", level="ERROR")
             raise
     
-    def run_outreach(self, scored_file: str) -> dict:
+    def _analysis_workers(self) -> int:
+        return max(1, int(self.config.get('analysis', {}).get('workers') or os.cpu_count() or 1))
+    
+    def _iter_analyses(self, listings: List[Dict[str, Any]], opps: List[Dict[str, Any]], workers: int):
+        """
+        Analyze and save a memo for each opportunity, yielding (analysis, error) in input order
+        
+        With more than one worker the analyses run in a process pool; each
+        worker builds its own InvestmentAnalyzer once. Workers are spawned
+        rather than forked, since other phases' threads may be mid-write.
+        """
+        if workers <= 1:
+            for listing, opp in zip(listings, opps):
+                try:
+                    yield _analyze_and_save(self.analyzer, listing, opp), None
+                except Exception as e:
+                    yield None, e
+            return
+        
+        with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn'),
+                                 initializer=_init_analysis_worker, initargs=(self.config_path,)) as executor:
+            # When profiling, workers dump their own stats for the profiler to merge
+            profile_dir = self.profiler.worker_profile_dir() if self.profiler else None
+            futures = [
+                executor.submit(_analyze_in_worker, listing, opp, profile_dir)
+                for listing, opp in zip(listings, opps)
+            ]
+            
+            for future in futures:
+                try:
+                    yield future.result(), None
+                except Exception as e:
+                    yield None, e
+    
+    def run_outreach(self, scoring: ScoringResult) -> OutreachResult:
         """Execute outreach phase"""
         self.log("=" * 80)
         self.log("PHASE 4: AUTOMATED OUTREACH")
         self.log("=" * 80)
         
+        if not scoring.opportunities:
+            self.log("No scored opportunities; no campaign today")
+            return OutreachResult(campaign_id='N/A', emails_prepared=0, sent=0)
+        
         try:
-            # Load scored opportunities
-            with open(scored_file, 'r') as f:
-                opportunities = json.load(f)
-            
             # Create outreach campaign for high-scoring opportunities (≥0.80)
             campaign = self.outreach_manager.create_outreach_campaign(
-                opportunities, 
+                scoring.opportunities,
                 score_threshold=0.80
             )
             
@@ -195,12 +454,71 @@ class DailyCycleOrchestrator:
             
             self.log(f"Outreach complete: {results['sent']} emails sent (dry run)")
             
-            return results
+            return OutreachResult(
+                campaign_id=results.get('campaign_id', campaign['campaign_id']),
+                emails_prepared=len(campaign['emails']),
+                sent=results.get('sent', 0),
+                details=results
+            )
             
         except Exception as e:
             self.log(f"Error in outreach: {str(e)}", level="ERROR")
             raise
     
+    def _numeric_financials(self, listing: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Parsed revenue / cash flow / asking price, with placeholders where undisclosed
+        
+        ``financials_estimated`` lists the fields that got a placeholder, so
+        the memo can say which figures are not the seller's. Disclosed zero
+        or negative values are kept as they are.
+        """
+        from currency_parser import parse_currency
+        
+        financials = {}
+        estimated = list(listing.get('financials_estimated') or [])
+        for name, placeholder in PLACEHOLDER_FINANCIALS.items():
+            value = listing.get(f"{name}_numeric")
+            if value is None:
+                value = parse_currency(listing.get(name))
+            if math.isnan(value):
+                value = placeholder
+                if name not in estimated:
+                    estimated.append(name)
+            financials[f"{name}_numeric"] = value
+        financials['financials_estimated'] = estimated
+        return financials
+    
+    def _analysis_listing(self, opp: Dict[str, Any]) -> Dict[str, Any]:
+        """Listing fields the analyzer needs, taken from the scored opportunity"""
+        listing = {
+            'title': opp.get('title') or 'Business Opportunity',
+            'sector': opp.get('sector') or 'business_services',
+            'location': opp.get('location') or 'Atlanta, GA',
+            'description': opp.get('description') or 'Established business with AI optimization potential'
+        }
+        listing.update(self._numeric_financials(opp))
+        return listing
+    
+    def run_report(self, scan: ScanResult, scoring: ScoringResult,
+                   analysis: AnalysisResult, outreach: OutreachResult) -> ReportResult:
+        """Execute report phase from the other phases' results"""
+        stats = {
+            'listings_scanned': scan.counts.get('scanned', 0),
+            'new_listings': scan.counts.get('new', 0),
+            'changed_listings': scan.counts.get('changed', 0),
+            'memos_generated': analysis.memos_generated,
+            'opportunities_analyzed': analysis.memos_generated,
+            'campaign_id': outreach.campaign_id,
+            'emails_sent': outreach.sent,
+            'response_rate': 0.0,  # Would be calculated from actual responses
+            'meetings_scheduled': 0
+        }
+        stats.update(scoring.stats())
+        
+        self.stats = stats
+        return ReportResult(path=self.generate_daily_report(stats))
+    
     def generate_daily_report(self, stats: dict) -> str:
         """Generate daily summary report"""
         self.log("=" * 80)
@@ -222,6 +540,8 @@ class DailyCycleOrchestrator:
 ### Market Scan Results
 
 - **Total Listings Scanned:** {stats.get('listings_scanned', 0)}
+- **New Listings:** {stats.get('new_listings', 0)}
+- **Changed Listings:** {stats.get('changed_listings', 0)}
 - **Sources Accessed:** {len(self.config['sources'])}
 - **Geographic Coverage:** {', '.join(self.config['filters']['geo'])}
 - **Target Sectors:** {', '.join(self.config['filters']['sectors'])}
@@ -303,81 +623,230 @@ class DailyCycleOrchestrator:
         
         return '\n'.join(formatted)
     
-    def execute_daily_cycle(self):
-        """Execute complete daily cycle"""
+    def execute_daily_cycle(self, resume: bool = False):
+        """
+        Execute complete daily cycle
+        
+        Phases run as a DAG: each starts once its inputs are ready, and its
+        result is checkpointed under the cycle ID. With ``resume``, phases
+        already checkpointed for this cycle are loaded instead of re-run.
+        """
         self.log("=" * 80)
-        self.log(f"STARTING DAILY CYCLE: {self.cycle_id}")
+        self.log(f"{'RESUMING' if resume else 'STARTING'} DAILY CYCLE: {self.cycle_id}")
         self.log("=" * 80)
         
         start_time = datetime.now()
-        stats = {}
+        results = {}
+        self.stats = {}
         
-        try:
-            # Phase 1: Market Scan
-            listings_file = self.run_market_scan()
-            
-            # Count listings
-            import csv
-            with open(listings_file, 'r') as f:
-                stats['listings_scanned'] = sum(1 for _ in csv.DictReader(f))
-            
-            # Phase 2: Scoring
-            scored_file = self.run_scoring(listings_file)
-            
-            # Load scoring stats
-            with open(scored_file, 'r') as f:
-                scored_data = json.load(f)
-                stats['opportunities_scored'] = len(scored_data)
-                stats['high_score_count'] = sum(1 for o in scored_data if o.get('meets_threshold', False))
-                stats['avg_score'] = sum(o.get('final_score', 0) for o in scored_data) / len(scored_data) if scored_data else 0
-                stats['top_score'] = max((o.get('final_score', 0) for o in scored_data), default=0)
-                stats['top_opportunities'] = scored_data[:3]
-            
-            # Phase 3: Analysis
-            memos_generated = self.run_analysis(scored_file)
-            stats['memos_generated'] = memos_generated
-            stats['opportunities_analyzed'] = memos_generated
-            
-            # Phase 4: Outreach
-            outreach_results = self.run_outreach(scored_file)
-            stats['campaign_id'] = outreach_results.get('campaign_id', 'N/A')
-            stats['emails_sent'] = outreach_results.get('sent', 0)
-            stats['response_rate'] = 0.0  # Would be calculated from actual responses
-            stats['meetings_scheduled'] = 0
-            
-            # Phase 5: Report
-            report_path = self.generate_daily_report(stats)
-            
-            # Calculate execution time
-            end_time = datetime.now()
-            duration = (end_time - start_time).total_seconds() / 60
-            
-            self.log("=" * 80)
-            self.log(f"DAILY CYCLE COMPLETE: {self.cycle_id}")
-            self.log(f"Execution Time: {duration:.1f} minutes")
-            self.log(f"Daily Report: {report_path}")
-            self.log("=" * 80)
-            
-            return {
-                'success': True,
-                'cycle_id': self.cycle_id,
-                'stats': stats,
-                'report_path': report_path,
-                'duration_minutes': duration
-            }
-            
-        except Exception as e:
-            self.log(f"CYCLE FAILED: {str(e)}", level="ERROR")
+        if resume:
+            if not self.checkpoint.exists():
+                self.log(f"No checkpoints found for {self.cycle_id}", level="ERROR")
+                return {
+                    'success': False,
+                    'cycle_id': self.cycle_id,
+                    'error': f"No checkpoints found for {self.cycle_id}"
+                }
+            
+            for spec in CYCLE_PHASES:
+                result = self._load_checkpoint(spec)
+                if result is not None:
+                    results[spec.name] = result
+            self.log(f"Reusing completed phases: {', '.join(results) or 'none'}")
+        
+        failed = {}
+        pending = [spec for spec in CYCLE_PHASES if spec.name not in results]
+        running = {}
+        
+        # Profilers are process-wide, so profiled phases run one at a time
+        max_workers = 1 if self.profiler else len(CYCLE_PHASES)
+        
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            while pending or running:
+                # Start every phase whose inputs are ready; stop scheduling after a failure
+                if not failed:
+                    for spec in [spec for spec in pending if all(dep in results for dep in spec.requires)]:
+                        pending.remove(spec)
+                        inputs = [results[dep] for dep in spec.requires]
+                        running[executor.submit(self._execute_phase, spec, inputs)] = spec
+                
+                if not running:
+                    break
+                
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    spec = running.pop(future)
+                    try:
+                        results[spec.name] = future.result()
+                        self._save_checkpoint(spec.name, results[spec.name])
+                    except Exception as e:
+                        failed[spec.name] = e
+        
+        duration = (datetime.now() - start_time).total_seconds() / 60
+        self.write_profile()
+        
+        if failed:
+            error = '; '.join(f"{name}: {str(e)}" for name, e in failed.items())
+            self.log(f"CYCLE FAILED: {error}", level="ERROR")
+            self.log(f"Completed phases are checkpointed; resume with --resume {self.cycle_id}")
+            self.logger.flush()
             return {
                 'success': False,
                 'cycle_id': self.cycle_id,
-                'error': str(e)
+                'error': error,
+                'failed_phases': list(failed),
+                'completed_phases': list(results)
             }
+        
+        report_path = results['report'].path
+        
+        self.log("=" * 80)
+        self.log(f"DAILY CYCLE COMPLETE: {self.cycle_id}")
+        self.log(f"Execution Time: {duration:.1f} minutes")
+        self.log(f"Daily Report: {report_path}")
+        self.log("=" * 80)
+        self.logger.flush()
+        
+        return {
+            'success': True,
+            'cycle_id': self.cycle_id,
+            'stats': self.stats,
+            'report_path': report_path,
+            'duration_minutes': duration
+        }
+
+    def run_phase(self, name: str):
+        """
+        Run one phase on its own, taking its inputs from this cycle's checkpoints
+        
+        The phase re-runs even if it already completed, and its result
+        replaces the checkpoint. Checkpoints of every phase downstream of it
+        are deleted, so a later --resume re-runs them on the new result.
+        """
+        spec = next(spec for spec in CYCLE_PHASES if spec.name == name)
+        
+        inputs = []
+        for dep in spec.requires:
+            dep_spec = next(d for d in CYCLE_PHASES if d.name == dep)
+            result = self._load_checkpoint(dep_spec)
+            if result is None:
+                raise RuntimeError(f"Phase '{name}' needs '{dep}', which has no checkpoint in {self.cycle_id}")
+            inputs.append(result)
+        
+        try:
+            result = self._execute_phase(spec, inputs)
+        finally:
+            self.write_profile()
+        self._save_checkpoint(name, result)
+        
+        stale = downstream_phases(name)
+        for phase in stale:
+            self.checkpoint.delete(phase)
+        if stale:
+            self.log(f"Cleared downstream checkpoints: {', '.join(stale)}")
+        return result
+    
+    def _save_checkpoint(self, name: str, result):
+        """
+        Checkpoint a phase result; a scan is committed to the listing store
+        and the listings archive only after this
+        
+        The scan checkpoint is then re-saved marked committed, so reloading
+        it never replays a scan the store already holds.
+        """
+        self.checkpoint.save(name, result)
+        if name == 'scan' and self._pending_scan is not None:
+            pending, self._pending_scan = self._pending_scan, None
+            self.listing_store.commit_scan(pending)
+            self._archive_scan()
+            result.committed = True
+            self.checkpoint.save(name, result)
+    
+    def _archive_scan(self):
+        """Append the last scan to the listings archive, replacing any earlier attempt of this cycle"""
+        listings, self._pending_archive = self._pending_archive, None
+        try:
+            archived = self.listings_archive.append(listings or [], self.cycle_id)
+            self.log(f"Archived {archived} listings to {self.listings_archive.root_dir}")
+        except Exception as e:
+            self.log(f"Listings archive not updated: {str(e)}", level="WARNING")
+    
+    def _load_checkpoint(self, spec: PhaseSpec):
+        """
+        A checkpointed phase result, or None
+        
+        A reloaded scan not marked committed is replayed into the listing
+        store, since the run stopped between its checkpoint and the store
+        commit, and is then marked committed.
+        """
+        result = self.checkpoint.load(spec.name, spec.result_type)
+        if spec.name == 'scan' and result is not None and not result.committed:
+            self.listing_store.record_scan([
+                {key: value for key, value in listing.items() if key not in ('change_type', 'changes')}
+                for listing in result.listings
+            ])
+            result.committed = True
+            self.checkpoint.save(spec.name, result)
+        return result
+    
+    def write_profile(self) -> Optional[str]:
+        """Write the profile summary next to the daily reports (profiling runs only)"""
+        if not self.profiler or not self.profiler.phases:
+            return None
+        
+        summary_path = self.profiler.write_summary(
+            os.path.join(self.output_dir, f"profile_{self.cycle_id}.md")
+        )
+        self.log(f"Profile summary: {summary_path}")
+        return summary_path
+    
+    def _execute_phase(self, spec: PhaseSpec, inputs: list):
+        """Run one phase inside a timing span (and the profiler, if enabled)"""
+        with self.logger.span(f"phase.{spec.name}", phase=spec.name) as span:
+            if self.profiler:
+                with self.profiler.profile(spec.name):
+                    result = getattr(self, spec.method)(*inputs)
+            else:
+                result = getattr(self, spec.method)(*inputs)
+            span.add_items(result.item_count)
+            span.add_errors(getattr(result, 'errors', 0))
+        return result
 
 def main():
     """Main execution"""
-    orchestrator = DailyCycleOrchestrator()
-    result = orchestrator.execute_daily_cycle()
+    parser = argparse.ArgumentParser(description="Run the daily acquisition cycle")
+    parser.add_argument('--resume', metavar='CYCLE_ID',
+                        help="Resume a failed cycle, reusing its checkpointed phases")
+    parser.add_argument('--phase', choices=[spec.name for spec in CYCLE_PHASES],
+                        help="Run only this phase; inputs come from the --resume cycle's checkpoints")
+    parser.add_argument('--profile', action='store_true',
+                        help="Profile each phase (cProfile + tracemalloc); phases run sequentially")
+    parser.add_argument('--profile-top', type=int, default=20, metavar='N',
+                        help="Hotspots and allocation sites listed per phase (default: 20)")
+    args = parser.parse_args()
+    
+    if args.phase and args.phase != 'scan' and not args.resume:
+        parser.error(f"--phase {args.phase} needs --resume CYCLE_ID to supply its inputs")
+    
+    orchestrator = DailyCycleOrchestrator(
+        cycle_id=args.resume,
+        profile=args.profile,
+        profile_top_n=args.profile_top
+    )
+    
+    if args.phase:
+        try:
+            result = orchestrator.run_phase(args.phase)
+        except Exception as e:
+            orchestrator.log(f"PHASE FAILED: {args.phase}: {str(e)}", level="ERROR")
+            sys.exit(1)
+        
+        print(f"\n✓ Phase '{args.phase}' completed for {orchestrator.cycle_id}")
+        if getattr(result, 'path', None):
+            print(f"  Output: {result.path}")
+        return
+    
+    result = orchestrator.execute_daily_cycle(resume=bool(args.resume))
     
     if result['success']:
         print(f"\n✓ Daily cycle completed successfully!")
@@ -387,6 +856,8 @@ def main():
     else:
         print(f"\n✗ Daily cycle failed!")
         print(f"  Error: {result['error']}")
+        if result.get('completed_phases'):
+            print(f"  Resume: python daily_cycle.py --resume {result['cycle_id']}")
         sys.exit(1)
 
 if __name__ == "__main__":
@@ -0,0 +1,300 @@
+#!/usr/bin/env python3
+"""
+Deal Returns - Levered IRR and cash-on-cash across a grid of financing structures
+"""
+
+import itertools
+from typing import List, Dict, Any, Mapping, Optional
+
+import numpy as np
+
+# Structure axis -> default grid (override in config['financing'])
+STRUCTURE_AXES = {
+    'price_to_asking': (0.85, 0.90, 0.95, 1.0),  # negotiated price / asking price
+    'down_payment': (0.10, 0.15, 0.20),          # policy-loan equity, share of price
+    'seller_financing': (0.20, 0.25, 0.30),      # seller note, share of price
+    'seller_rate': (0.05, 0.06, 0.07),
+    'sba_rate': (0.095, 0.105, 0.115),           # SBA 7(a) takes the balance
+    'exit_multiple': (2.5, 3.0, 3.5)             # year-5 cash flow multiple at sale
+}
+
+DEFAULT_TERMS = {
+    'seller_term_years': 5,
+    'sba_term_years': 10,
+    'sba_max': 5_000_000,       # 7(a) cap; any shortfall is funded with equity
+    'closing_cost_rate': 0.03,  # share of price, paid with equity
+    'owner_compensation': 80_000,  # yearly market salary for the role the seller filled, out of SDE
+    'capex_rate': 0.10          # share of SDE reserved for capital expenditure
+}
+
+class ReturnsEngine:
+    """
+    Equity cash flows, IRR and cash-on-cash for every financing structure.
+
+    A structure is one combination of the ``STRUCTURE_AXES`` values. The
+    buyer pays price x (down payment + closing costs) in cash, the seller
+    note and SBA loan amortize annually over their terms, and the business
+    is sold after the last projection year at ``exit_multiple`` x that
+    year's cash flow, less the remaining loan balances.
+
+    Projected cash flow is SDE, which still includes the owner's pay and
+    no reinvestment. Before debt service it is cut by the
+    ``owner_compensation`` salary and the ``capex_rate`` reserve; set both
+    to 0 for pre-owner-comp returns. The exit is priced on SDE, as SDE
+    multiples are.
+
+    All structures of many listings and scenarios are solved at once with
+    ``solve_irr``; rows are processed ``chunk_size`` listings at a time so
+    memory stays bounded.
+    """
+
+    def __init__(self, config: Mapping[str, Any], chunk_size: int = 64):
+        financing = config.get('financing', {})
+        for name in financing:
+            if name not in STRUCTURE_AXES and name not in DEFAULT_TERMS:
+                raise ValueError(f"Unknown financing setting '{name}'")
+
+        self.terms = {name: financing.get(name, default) for name, default in DEFAULT_TERMS.items()}
+        self.axes = {
+            name: tuple(float(value) for value in financing.get(name, default))
+            for name, default in STRUCTURE_AXES.items()
+        }
+        # The thesis quotes returns at the asking price, so it is always on the grid
+        self.axes['price_to_asking'] = tuple(sorted(set(self.axes['price_to_asking']) | {1.0}))
+        self.chunk_size = chunk_size
+
+        combos = np.array(list(itertools.product(*self.axes.values())))
+        self.structures = {name: combos[:, i] for i, name in enumerate(self.axes)}
+
+    @property
+    def structure_count(self) -> int:
+        return len(self.structures['price_to_asking'])
+
+    def structure(self, index: int) -> Dict[str, float]:
+        return {name: float(values[index]) for name, values in self.structures.items()}
+
+    def returns_batch(self, cash_flows: np.ndarray, asking_price: np.ndarray,
+                      valid: Optional[np.ndarray] = None) -> Dict[str, np.ndarray]:
+        """
+        Returns of every structure for N listings
+
+        ``cash_flows`` is (N, S, Y) projected cash flow per listing, scenario
+        and year (e.g. ``analyze_batch(...)['scenarios']['cash_flow']``) and
+        ``asking_price`` is (N,). Returns (N, S, K) arrays over the K
+        structures: ``irr``, ``cash_on_cash`` (year-1 equity cash flow /
+        equity) and ``equity``. Rows outside ``valid`` (e.g.
+        ``analyze_batch(...)['valid']``), rows without an asking price and
+        unsolvable cells are NaN.
+        """
+        cash_flows = np.asarray(cash_flows, dtype=float)
+        asking_price = np.asarray(asking_price, dtype=float)
+        shape = cash_flows.shape[:2] + (self.structure_count,)
+        results = {key: np.empty(shape) for key in ('irr', 'cash_on_cash', 'equity')}
+
+        for start in range(0, len(asking_price), self.chunk_size):
+            stop = start + self.chunk_size
+            flows, equity = self.equity_cash_flows(cash_flows[start:stop], asking_price[start:stop])
+            with np.errstate(divide='ignore', invalid='ignore'):
+                results['cash_on_cash'][start:stop] = flows[..., 1] / equity
+            results['irr'][start:stop] = solve_irr(flows)
+            results['equity'][start:stop] = equity
+
+        invalid = ~(asking_price > 0) | ~np.isfinite(cash_flows).all(axis=(1, 2))
+        if valid is not None:
+            invalid |= ~np.asarray(valid, dtype=bool)
+        for values in results.values():
+            values[invalid] = np.nan
+        return results
+
+    def equity_cash_flows(self, cash_flows: np.ndarray, asking_price: np.ndarray):
+        """(N, S, K, Y + 1) equity cash flows (year 0 is the equity check) and (N, 1, K) equity"""
+        years = cash_flows.shape[-1]
+        s = self.structures
+
+        price = asking_price[:, None, None] * s['price_to_asking']
+        seller = price * s['seller_financing']
+        sba = np.minimum(price * (1 - s['down_payment'] - s['seller_financing']), self.terms['sba_max'])
+        equity = price * (1 + self.terms['closing_cost_rate']) - seller - sba
+
+        # Annual debt service per year and balances at exit, (N, 1, K, Y) / (N, 1, K)
+        t = np.arange(1, years + 1)
+        debt_service = np.zeros(price.shape + (years,))
+        balance_at_exit = np.zeros(price.shape)
+        for principal, rate, term in ((seller, s['seller_rate'], self.terms['seller_term_years']),
+                                      (sba, s['sba_rate'], self.terms['sba_term_years'])):
+            payment = _annuity_payment(principal, rate, term)
+            debt_service += payment[..., None] * (t <= term)
+            balance_at_exit += _remaining_balance(principal, rate, payment, min(years, term))
+
+        # Cash available for debt service once the owner's role is paid and capex is reserved
+        free_cash_flow = cash_flows * (1 - self.terms['capex_rate']) - self.terms['owner_compensation']
+
+        flows = np.empty(cash_flows.shape[:2] + (self.structure_count, years + 1))
+        flows[..., 0] = -equity
+        flows[..., 1:] = free_cash_flow[:, :, None, :] - debt_service
+        flows[..., -1] += s['exit_multiple'] * cash_flows[:, :, None, -1] - balance_at_exit
+        return flows, equity
+
+    def analyze(self, listing: Dict[str, Any], ai_scenarios: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Levered returns of each AI scenario for the investment memo
+
+        Per scenario: IRR and cash-on-cash ranges (low / median / high)
+        over the structures at the asking price, and the best structure on
+        the whole grid (negotiated prices included) by IRR. A range is
+        empty when no structure at the asking price has a value, even if a
+        negotiated price does.
+        """
+        asking_price = listing.get('asking_price_numeric', 0)
+        names = [name for name, scenario in ai_scenarios.items() if isinstance(scenario, dict) and 'projections' in scenario]
+        if not asking_price or not names:
+            return {'error': 'Insufficient financial data'}
+
+        cash_flows = np.array([[[proj['cash_flow'] for proj in ai_scenarios[name]['projections']] for name in names]])
+        results = self.returns_batch(cash_flows, np.array([asking_price]))
+        at_asking = self.structures['price_to_asking'] == 1.0
+
+        scenarios = {}
+        for i, name in enumerate(names):
+            irr, coc = results['irr'][0, i], results['cash_on_cash'][0, i]
+            if np.isnan(irr).all():
+                scenarios[name] = {'error': 'No solvable financing structure'}
+                continue
+
+            best = int(np.nanargmax(irr))
+            scenarios[name] = {
+                'irr': _range(irr[at_asking]),
+                'cash_on_cash': _range(coc[at_asking]),
+                'best_structure': dict(
+                    self.structure(best),
+                    irr=round(float(irr[best]), 4),
+                    cash_on_cash=round(float(coc[best]), 4),
+                    equity=round(float(results['equity'][0, i, best]), 2)
+                )
+            }
+
+        return {
+            'structures': self.structure_count,
+            'structures_at_asking': int(at_asking.sum()),
+            'terms': dict(self.terms),
+            'scenarios': scenarios
+        }
+
+    def rank(self, cash_flows: np.ndarray, asking_price: np.ndarray, valid: Optional[np.ndarray] = None,
+             scenario: int = 0, top_n: int = 20) -> List[Dict[str, Any]]:
+        """Listings ordered by their best IRR across structures for one scenario"""
+        irr = self.returns_batch(cash_flows[:, scenario:scenario + 1], asking_price, valid)['irr'][:, 0]
+        solvable = ~np.isnan(irr).all(axis=1)
+        best = np.full(len(irr), -np.inf)
+        best[solvable] = np.nanmax(irr[solvable], axis=1)
+
+        ranked = []
+        for index in np.argsort(-best)[:top_n]:
+            if not solvable[index]:
+                break
+            structure = int(np.nanargmax(irr[index]))
+            ranked.append({
+                'index': int(index),
+                'irr': round(float(best[index]), 4),
+                'median_irr': round(float(np.nanmedian(irr[index])), 4),
+                'structure': self.structure(structure)
+            })
+        return ranked
+
+def solve_irr(flows: np.ndarray, tol: float = 1e-10, max_iter: int = 100) -> np.ndarray:
+    """
+    IRR of every cash flow series in ``flows`` (..., T + 1), solved at once
+
+    NPV is a polynomial in the discount factor x = 1 / (1 + rate), so it
+    and its derivative are evaluated with Horner's rule. Safeguarded
+    Newton: a step is kept only if it lands inside the bracket that still
+    holds the sign change of NPV, otherwise the bracket is cut by false
+    position. Converged series drop out of the iteration.
+
+    Series without a sign change between -99% and 10,000% get NaN; for
+    non-conventional series with several roots, one of them is returned.
+    """
+    flows = np.asarray(flows, dtype=float)
+    shape = flows.shape[:-1]
+    # (T + 1, M): each period is a contiguous row for Horner's rule
+    flows = np.ascontiguousarray(flows.reshape(-1, flows.shape[-1]).T)
+
+    def npv(x, f):
+        value = f[-1].copy()
+        slope = np.zeros_like(value)
+        for t in range(len(f) - 2, -1, -1):
+            slope = slope * x + value
+            value = value * x + f[t]
+        return value, slope
+
+    lo = np.full(flows.shape[1], 1 / 101)
+    hi = np.full(flows.shape[1], 100.0)
+    npv_lo, npv_hi = npv(lo, flows)[0], npv(hi, flows)[0]
+    bracketed = np.isfinite(npv_lo) & np.isfinite(npv_hi) & (np.sign(npv_lo) * np.sign(npv_hi) < 0)
+
+    x = np.full(flows.shape[1], np.nan)
+    active = np.flatnonzero(bracketed)
+    f, lo, hi, npv_lo, npv_hi = flows[:, active], lo[active], hi[active], npv_lo[active], npv_hi[active]
+
+    # Start from the rate that turns the initial outlay into the later flows over their duration
+    later = f[1:].sum(axis=0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        duration = (np.arange(1, len(f))[:, None] * f[1:]).sum(axis=0) / later
+        guess = (-f[0] / later) ** (1 / duration)
+    guess = np.where((guess > lo) & (guess < hi), guess, 1 / 1.1)
+
+    unsettled = np.ones(len(active), dtype=bool)
+    for _ in range(max_iter):
+        value, slope = npv(guess, f)
+
+        # Keep the sign change between lo and hi
+        same_side = np.sign(value) == np.sign(npv_lo)
+        np.copyto(lo, guess, where=same_side)
+        np.copyto(npv_lo, value, where=same_side)
+        np.copyto(hi, guess, where=~same_side)
+        np.copyto(npv_hi, value, where=~same_side)
+
+        with np.errstate(divide='ignore', invalid='ignore'):
+            step = guess - value / slope
+            outside = ~((step >= lo) & (step <= hi))
+            if outside.any():
+                # False position, kept off the bracket ends so a stuck endpoint can't stall it
+                width = hi - lo
+                secant = lo - npv_lo * width / (npv_hi - npv_lo)
+                secant = np.clip(np.nan_to_num(secant, nan=-np.inf), lo + 0.1 * width, hi - 0.1 * width)
+                np.copyto(step, secant, where=outside)
+        np.copyto(step, guess, where=(value == 0) | ~unsettled)
+
+        # Only a Newton step this small, or a bracket this narrow, means the root is found
+        unsettled &= (value != 0) & ((np.abs(step - guess) > tol * guess) | outside) & (hi - lo > tol * guess)
+        guess = step
+        if not unsettled.any():
+            break
+
+        # Drop settled series once they are the majority; until then they stay frozen
+        if unsettled.sum() < len(unsettled) // 2:
+            x[active[~unsettled]] = guess[~unsettled]
+            active, f, guess = active[unsettled], f[:, unsettled], guess[unsettled]
+            lo, hi, npv_lo, npv_hi = lo[unsettled], hi[unsettled], npv_lo[unsettled], npv_hi[unsettled]
+            unsettled = unsettled[unsettled]
+
+    x[active] = guess
+    return (1 / x - 1).reshape(shape)
+
+def _annuity_payment(principal: np.ndarray, rate: np.ndarray, years: int) -> np.ndarray:
+    with np.errstate(divide='ignore', invalid='ignore'):
+        factor = np.where(rate > 0, rate / (1 - (1 + rate) ** -years), 1 / years)
+    return principal * factor
+
+def _remaining_balance(principal: np.ndarray, rate: np.ndarray, payment: np.ndarray, paid_years: int) -> np.ndarray:
+    growth = (1 + rate) ** paid_years
+    with np.errstate(divide='ignore', invalid='ignore'):
+        balance = np.where(rate > 0, principal * growth - payment * (growth - 1) / rate, principal - payment * paid_years)
+    return np.maximum(balance, 0.0)
+
+def _range(values: np.ndarray) -> Dict[str, float]:
+    values = values[~np.isnan(values)]
+    if not len(values):
+        return {}
+    low, median, high = np.percentile(values, [0, 50, 100])
+    return {'low': round(float(low), 4), 'median': round(float(median), 4), 'high': round(float(high), 4)}
@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+"""
+Deal Simulation - Monte Carlo cash flow and DCF outcomes for a listing
+"""
+
+import math
+import zlib
+from typing import List, Dict, Any, Mapping, Optional
+
+import numpy as np
+
+from investment_analyzer import PROJECTION_YEARS, BASE_GROWTH_RATE, DISCOUNT_RATE, RAMP_PER_YEAR
+
+PERCENTILES = (5, 25, 50, 75, 95)
+
+# Percentile bands come from quantile sketches accurate to this fraction of the value
+SKETCH_ACCURACY = 1e-4
+
+# Parameters sampled per path, in a fixed order (each gets its own random stream)
+SAMPLED_PARAMS = (
+    'growth_rate',           # annual revenue growth
+    'margin_shift',          # additive change to the listing's SDE margin
+    'revenue_increase',      # AI revenue lift at full ramp
+    'cost_reduction',        # AI cost savings at full ramp
+    'margin_expansion_bps',  # AI margin expansion at full ramp
+    'ramp_per_year',         # share of the AI effect gained per year
+    'discount_rate'
+)
+
+class DealSimulator:
+    """
+    Monte Carlo version of the analyzer's cash flow, AI scenario and DCF models.
+
+    Each path samples growth, margin, AI lift / ramp and the discount rate
+    from the distributions in ``config['simulation']`` (defaults span the
+    configured conservative..aggressive AI scenarios). Paths are evaluated
+    ``chunk_size`` at a time and folded into running moments, overpay
+    counts and quantile sketches (``QuantileSketch``), so memory stays
+    bounded at any path count; percentile bands are within
+    ``SKETCH_ACCURACY`` of the exact percentiles of the sampled paths.
+
+    Runs are reproducible: every listing gets its own seed derived from
+    ``seed`` and the listing's identity, and every parameter its own random
+    stream, so the sampled paths don't depend on batch order or chunk size
+    (and the results only up to float rounding of the running moments).
+
+    Distribution specs: {"dist": "fixed", "value"}, {"dist": "normal",
+    "mean", "std"}, {"dist": "uniform", "low", "high"} or
+    {"dist": "triangular", "low", "mode", "high"}; any spec may add
+    "min" / "max" clipping.
+    """
+
+    def __init__(self, config: Mapping[str, Any], paths: Optional[int] = None,
+                 chunk_size: Optional[int] = None, seed: Optional[int] = None):
+        sim_config = config.get('simulation', {})
+        ai_scenarios = config['ai_optimization_scenarios']
+
+        self.paths = int(paths or sim_config.get('paths', 100_000))
+        self.chunk_size = int(chunk_size or sim_config.get('chunk_size', 25_000))
+        self.seed = int(seed if seed is not None else sim_config.get('seed', 0))
+
+        def ai_range(key: str) -> Dict[str, Any]:
+            values = ai_scenarios[key]
+            return {'dist': 'triangular', 'low': 0.0, 'mode': min(values), 'high': max(values)}
+
+        self.distributions = {
+            'growth_rate': {'dist': 'normal', 'mean': BASE_GROWTH_RATE, 'std': 0.03},
+            'margin_shift': {'dist': 'normal', 'mean': 0.0, 'std': 0.02},
+            'revenue_increase': ai_range('revenue_increase'),
+            'cost_reduction': ai_range('cost_reduction'),
+            'margin_expansion_bps': ai_range('margin_expansion'),
+            'ramp_per_year': {'dist': 'uniform', 'low': RAMP_PER_YEAR * 0.5, 'high': RAMP_PER_YEAR * 1.5},
+            'discount_rate': {'dist': 'normal', 'mean': DISCOUNT_RATE, 'std': 0.02, 'min': 0.06}
+        }
+        for name, spec in sim_config.get('distributions', {}).items():
+            if name not in self.distributions:
+                raise ValueError(f"Unknown simulation parameter '{name}'")
+            self.distributions[name] = dict(spec)
+
+    def simulate(self, listing: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Outcome distribution for one listing
+
+        For the ``standalone`` business and the ``ai_adjusted`` one, returns
+        percentile bands (``percentiles``) of cash flow per projection year
+        and of DCF value, the mean and standard deviation of DCF value, and
+        ``prob_overpay``: the share of paths whose DCF value is below the
+        asking price.
+        """
+        revenue = listing.get('revenue_numeric', 0)
+        cash_flow = listing.get('cash_flow_numeric', 0)
+        asking_price = listing.get('asking_price_numeric', 0)
+
+        if revenue == 0 or cash_flow == 0:
+            return {'error': 'Insufficient financial data'}
+
+        streams = [np.random.default_rng(seq) for seq in self._seed_sequence(listing).spawn(len(SAMPLED_PARAMS))]
+
+        # Standalone (what the seller is paid for) and AI-adjusted outcomes
+        outcomes = {key: _OutcomeStats() for key in ('standalone', 'ai_adjusted')}
+
+        for start in range(0, self.paths, self.chunk_size):
+            size = min(self.chunk_size, self.paths - start)
+            params = {
+                name: self._sample(self.distributions[name], stream, size)
+                for name, stream in zip(SAMPLED_PARAMS, streams)
+            }
+            for key, chunk_cash_flows in zip(outcomes, self._evaluate(revenue, cash_flow / revenue, params)):
+                outcomes[key].add(chunk_cash_flows, _dcf(chunk_cash_flows, params['discount_rate']), asking_price)
+
+        result = {'paths': self.paths, 'percentiles': list(PERCENTILES), 'asking_price': asking_price}
+        for key, outcome in outcomes.items():
+            result[key] = {
+                'cash_flow_bands': {
+                    year: _bands(outcome.cash_flow_sketches[year - 1])
+                    for year in range(1, PROJECTION_YEARS + 1)
+                },
+                'dcf_bands': _bands(outcome.dcf_sketch),
+                'dcf_mean': round(outcome.dcf_mean, 2),
+                'dcf_std': round(math.sqrt(outcome.dcf_m2 / outcome.count), 2)
+            }
+            if asking_price > 0:
+                result[key]['prob_overpay'] = round(outcome.overpay / outcome.count, 4)
+        return result
+
+    def simulate_batch(self, listings: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        return [self.simulate(listing) for listing in listings]
+
+    def _evaluate(self, revenue: float, sde_margin: float, params: Dict[str, np.ndarray]):
+        """(paths, years) standalone and AI-adjusted cash flows for one chunk"""
+        years = np.arange(1, PROJECTION_YEARS + 1)
+
+        base_revenue = revenue * (1 + params['growth_rate'][:, None]) ** years
+        margin = np.clip(sde_margin + params['margin_shift'], 0.0, 0.95)[:, None]
+        base_cash_flow = base_revenue * margin
+
+        # Same lift formulas as InvestmentAnalyzer.apply_ai_optimization_scenarios
+        ramp = np.minimum(1.0, params['ramp_per_year'][:, None] * years)
+        revenue_lift = base_revenue * params['revenue_increase'][:, None] * ramp
+        cost_savings = (base_revenue - base_cash_flow) * params['cost_reduction'][:, None] * ramp
+        ai_cash_flow = base_cash_flow + revenue_lift + cost_savings
+        ai_cash_flow += (base_revenue + revenue_lift) * (params['margin_expansion_bps'][:, None] / 10000) * ramp
+
+        return base_cash_flow, ai_cash_flow
+
+    def _seed_sequence(self, listing: Dict[str, Any]) -> np.random.SeedSequence:
+        identity = listing.get('canonical_id') or listing.get('url') or listing.get('title') or ''
+        return np.random.SeedSequence([self.seed, zlib.crc32(str(identity).encode('utf-8'))])
+
+    @staticmethod
+    def _sample(spec: Dict[str, Any], rng: np.random.Generator, size: int) -> np.ndarray:
+        dist = spec.get('dist', 'fixed')
+        if dist == 'fixed':
+            values = np.full(size, float(spec['value']))
+        elif dist == 'normal':
+            values = rng.normal(spec['mean'], spec['std'], size)
+        elif dist == 'uniform':
+            values = rng.uniform(spec['low'], spec['high'], size)
+        elif dist == 'triangular':
+            if spec['low'] == spec['high']:
+                values = np.full(size, float(spec['low']))
+            else:
+                values = rng.triangular(spec['low'], spec['mode'], spec['high'], size)
+        else:
+            raise ValueError(f"Unknown distribution '{dist}'")
+
+        if 'min' in spec or 'max' in spec:
+            values = np.clip(values, spec.get('min', -np.inf), spec.get('max', np.inf))
+        return values
+
+class QuantileSketch:
+    """
+    Mergeable log-bucketed histogram for streaming quantiles (DDSketch-style)
+
+    Each bucket spans values within a fixed ratio of each other, so every
+    quantile comes back within ``relative_accuracy`` of the exact one.
+    Values smaller than ``min_value`` in magnitude are counted as 0. Memory
+    depends on the range of magnitudes seen, not on how many were added.
+    """
+
+    def __init__(self, relative_accuracy: float = SKETCH_ACCURACY, min_value: float = 1.0):
+        self.gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self.min_value = min_value
+        self.count = 0
+        self.zeros = 0
+        # Sign -> (key of the first bucket, counts); bucket k holds gamma**(k-1) < |value| <= gamma**k
+        self._buckets = {sign: (0, np.zeros(0, dtype=np.int64)) for sign in (1, -1)}
+
+    def add(self, values: np.ndarray):
+        values = np.asarray(values, dtype=float).ravel()
+        self.count += values.size
+
+        counted = np.abs(values) >= self.min_value
+        self.zeros += int(values.size - counted.sum())
+
+        for sign in (1, -1):
+            magnitudes = np.abs(values[counted & (np.sign(values) == sign)])
+            if not magnitudes.size:
+                continue
+
+            keys = np.ceil(np.log(magnitudes) / math.log(self.gamma)).astype(np.int64)
+            first, counts = self._buckets[sign]
+            if not counts.size:
+                first = int(keys.min())
+
+            # Widen the bucket range to cover this batch, then count it in
+            new_first = min(first, int(keys.min()))
+            grown = np.zeros(max(first + counts.size, int(keys.max()) + 1) - new_first, dtype=np.int64)
+            grown[first - new_first:first - new_first + counts.size] = counts
+            grown += np.bincount(keys - new_first, minlength=grown.size)
+            self._buckets[sign] = (new_first, grown)
+
+    def quantiles(self, percentiles) -> np.ndarray:
+        """Values at ``percentiles`` (0-100), interpolated like ``np.percentile``"""
+        if not self.count:
+            return np.full(len(percentiles), np.nan)
+
+        # Every bucket's representative value and count, in ascending value order
+        negative_first, negative_counts = self._buckets[-1]
+        positive_first, positive_counts = self._buckets[1]
+        values = np.concatenate([
+            -self._bucket_values(negative_first, negative_counts.size)[::-1],
+            [0.0],
+            self._bucket_values(positive_first, positive_counts.size)
+        ])
+        cumulative = np.cumsum(np.concatenate([negative_counts[::-1], [self.zeros], positive_counts]))
+
+        ranks = np.asarray(percentiles, dtype=float) / 100 * (self.count - 1)
+        lower = values[np.searchsorted(cumulative, np.floor(ranks), side='right')]
+        upper = values[np.searchsorted(cumulative, np.ceil(ranks), side='right')]
+        return lower + (upper - lower) * (ranks - np.floor(ranks))
+
+    def _bucket_values(self, first: int, size: int) -> np.ndarray:
+        # Midpoint (in ratio terms) of each bucket, off the true value by at most relative_accuracy
+        return 2 * self.gamma ** np.arange(first, first + size, dtype=float) / (self.gamma + 1)
+
+class _OutcomeStats:
+    """Running summary of one outcome's paths: quantile sketches, DCF moments and overpay count"""
+
+    def __init__(self):
+        self.cash_flow_sketches = [QuantileSketch() for _ in range(PROJECTION_YEARS)]
+        self.dcf_sketch = QuantileSketch()
+        self.count = 0
+        self.dcf_mean = 0.0
+        self.dcf_m2 = 0.0
+        self.overpay = 0
+
+    def add(self, cash_flows: np.ndarray, dcf_values: np.ndarray, asking_price: float):
+        for year, sketch in enumerate(self.cash_flow_sketches):
+            sketch.add(cash_flows[:, year])
+        self.dcf_sketch.add(dcf_values)
+        self.overpay += int(np.count_nonzero(dcf_values < asking_price))
+
+        # Chan et al. merge of the chunk's mean / sum of squared deviations
+        size = dcf_values.size
+        chunk_mean = float(dcf_values.mean())
+        chunk_m2 = float(((dcf_values - chunk_mean) ** 2).sum())
+        total = self.count + size
+        delta = chunk_mean - self.dcf_mean
+        self.dcf_mean += delta * size / total
+        self.dcf_m2 += chunk_m2 + delta ** 2 * self.count * size / total
+        self.count = total
+
+def _dcf(cash_flows: np.ndarray, rate: np.ndarray) -> np.ndarray:
+    """Per-path DCF value, terminal value as in InvestmentAnalyzer.run_valuation_methods"""
+    discount = (1 + rate[:, None]) ** np.arange(1, cash_flows.shape[1] + 1)
+    return (cash_flows / discount).sum(axis=1) + cash_flows[:, -1] / rate / discount[:, -1]
+
+def _bands(sketch: QuantileSketch) -> List[float]:
+    return np.round(sketch.quantiles(PERCENTILES), 2).tolist()
@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+Geo Normalizer - Parses free-text listing locations against a bundled offline gazetteer
+"""
+
+import json
+import os
+import re
+from functools import lru_cache
+from typing import List, Dict, Any, Iterable, Optional, Tuple
+
+import numpy as np
+
+GAZETTEER_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "gazetteer_us.json")
+
+LOCATION_FIELDS = ('city', 'state', 'zip_code', 'lat', 'lon')
+
+EARTH_RADIUS_MILES = 3958.8
+
+_ZIP_RE = re.compile(r'\b(\d{5})(?:-\d{4})?\b')
+_STATE_CODE_RE = re.compile(r'(?:^|[\s,])([A-Z]{2})$')
+
+_UNDISCLOSED = {'N/A', 'NA', 'NOT DISCLOSED', 'UNDISCLOSED', 'UNKNOWN'}
+
+# Qualifiers that wrap a city name in listing text ("Metro Atlanta", "Tampa Bay Area")
+_CITY_NOISE = re.compile(r'\b(?:greater|metro|metropolitan|area|region|suburbs?)\b', re.IGNORECASE)
+
+class LocationNormalizer:
+    """
+    Turns listing locations like "Atlanta, GA 30303", "Tampa Bay Area, Florida"
+    or "Metro Atlanta" into structured city / state / ZIP / coordinates.
+
+    State comes from an explicit code or name, falling back to the ZIP
+    prefix, then to a unique city name in the gazetteer. Results are
+    memoized per distinct location string, and filtering is a set lookup
+    on the parsed state plus an optional radius test around metro centres.
+    """
+
+    def __init__(self, gazetteer_path: str = GAZETTEER_PATH, cache_size: int = 100_000):
+        with open(gazetteer_path, 'r') as f:
+            gazetteer = json.load(f)
+
+        self.state_names = gazetteer['states']
+        self._state_by_name = {name.lower(): code for code, name in self.state_names.items()}
+        # Longest first, so "West Virginia" is tried before "Virginia"
+        self._state_names_longest_first = sorted(self._state_by_name.items(), key=lambda item: -len(item[0]))
+
+        self._state_by_zip3 = {}
+        for start, end, state in gazetteer['zip3']:
+            for prefix in range(start, end + 1):
+                self._state_by_zip3[prefix] = state
+
+        self._city_coords = {}
+        states_by_city = {}
+        for name, state, lat, lon in gazetteer['cities']:
+            self._city_coords[(name.lower(), state)] = (name, lat, lon)
+            states_by_city.setdefault(name.lower(), []).append(state)
+
+        # Only city names that exist in exactly one state can imply the state
+        self._state_by_unique_city = {
+            city: states[0] for city, states in states_by_city.items() if len(states) == 1
+        }
+
+        self._parse = lru_cache(maxsize=cache_size)(self._parse_uncached)
+
+    def normalize(self, location: Optional[str]) -> Dict[str, Any]:
+        """Structured form of a location string; unknown parts are None"""
+        return dict(zip(LOCATION_FIELDS, self._parse(location or '')))
+
+    def normalize_many(self, locations: Iterable[Optional[str]]) -> List[Dict[str, Any]]:
+        return [self.normalize(location) for location in locations]
+
+    def metro_coordinates(self, metro: str) -> Tuple[float, float]:
+        """Coordinates of a gazetteer city given as "City, ST"; raises ValueError if unknown"""
+        _, _, _, lat, lon = self._parse(metro)
+        if lat is None:
+            raise ValueError(f"Metro '{metro}' is not in the gazetteer")
+        return lat, lon
+
+    def match_mask(self, locations: List[Optional[str]], states: Iterable[str],
+                   radius_filters: Optional[List[Dict[str, Any]]] = None) -> np.ndarray:
+        """
+        Boolean mask of locations inside the target geography
+
+        A location matches when its parsed state is in ``states``, or when
+        its city lies within ``miles`` of any ``metro`` in ``radius_filters``
+        (e.g. [{'metro': 'Atlanta, GA', 'miles': 100}]).
+        """
+        target_states = {state.upper() for state in states}
+        parsed = [self._parse(location or '') for location in locations]
+
+        mask = np.fromiter((row[1] in target_states for row in parsed), dtype=bool, count=len(parsed))
+
+        if radius_filters:
+            lat = np.array([np.nan if row[3] is None else row[3] for row in parsed], dtype=float)
+            lon = np.array([np.nan if row[4] is None else row[4] for row in parsed], dtype=float)
+
+            for radius_filter in radius_filters:
+                metro_lat, metro_lon = self.metro_coordinates(radius_filter['metro'])
+                with np.errstate(invalid='ignore'):
+                    mask |= haversine_miles(lat, lon, metro_lat, metro_lon) <= radius_filter['miles']
+
+        return mask
+
+    def _parse_uncached(self, location: str) -> Tuple:
+        text = location.strip()
+        if not text or text.upper() in _UNDISCLOSED:
+            return (None, None, None, None, None)
+
+        zip_match = _ZIP_RE.search(text)
+        zip_code = zip_match.group(1) if zip_match else None
+        if zip_code:
+            text = (text[:zip_match.start()] + text[zip_match.end():]).strip(' ,')
+
+        parts = [part.strip() for part in text.split(',') if part.strip()]
+
+        state = None
+        city = None
+
+        # State: last comma segment that is (or ends with) a state code or name
+        for index in range(len(parts) - 1, -1, -1):
+            state, remainder = self._match_state(parts[index])
+            if state:
+                city_part = remainder or (parts[index - 1] if index > 0 else None)
+                city = self._clean_city(city_part)
+                break
+        else:
+            city = self._clean_city(parts[0]) if parts else None
+
+        if not state and zip_code:
+            state = self._state_by_zip3.get(int(zip_code[:3]))
+
+        if not state and city:
+            state = self._state_by_unique_city.get(city.lower())
+
+        lat = lon = None
+        if city and state:
+            known = self._known_city(city, state)
+            if known:
+                city, lat, lon = known
+
+        return (city, state, zip_code, lat, lon)
+
+    def _match_state(self, segment: str) -> Tuple[Optional[str], Optional[str]]:
+        """(state code, text before it) if the segment names a state"""
+        # Whole segment: "GA", "Ga", "Georgia"
+        if segment.upper() in self.state_names:
+            return segment.upper(), None
+        if segment.lower() in self._state_by_name:
+            return self._state_by_name[segment.lower()], None
+
+        # Trailing upper-case code: "Atlanta GA" (but not the "GA" in "CHICAGO")
+        code_match = _STATE_CODE_RE.search(segment)
+        if code_match and code_match.group(1) in self.state_names:
+            return code_match.group(1), segment[:code_match.start(1)].strip() or None
+
+        # Trailing state name: "Tampa Florida", "Raleigh North Carolina"
+        lowered = segment.lower()
+        for name, code in self._state_names_longest_first:
+            if lowered.endswith(' ' + name):
+                return code, segment[:-len(name)].strip()
+
+        return None, None
+
+    def _known_city(self, city: str, state: str) -> Optional[Tuple[str, float, float]]:
+        """Gazetteer entry for the city, dropping trailing words ("Tampa Bay" -> "Tampa") if needed"""
+        words = city.lower().split()
+        while words:
+            known = self._city_coords.get((' '.join(words), state))
+            if known:
+                return known
+            words.pop()
+        return None
+
+    @staticmethod
+    def _clean_city(text: Optional[str]) -> Optional[str]:
+        if not text:
+            return None
+
+        cleaned = _CITY_NOISE.sub(' ', text)
+        cleaned = re.sub(r'\s+', ' ', cleaned).strip(' -')
+        if not cleaned or cleaned.lower().endswith(' county'):
+            return None
+        return cleaned.title() if cleaned.isupper() or cleaned.islower() else cleaned
+
+def haversine_miles(lat, lon, ref_lat: float, ref_lon: float) -> np.ndarray:
+    """Great-circle distance in miles from arrays of points to one reference point"""
+    lat, lon = np.radians(lat), np.radians(lon)
+    ref_lat, ref_lon = np.radians(ref_lat), np.radians(ref_lon)
+
+    a = np.sin((lat - ref_lat) / 2) ** 2 + np.cos(lat) * np.cos(ref_lat) * np.sin((lon - ref_lon) / 2) ** 2
+    return 2 * EARTH_RADIUS_MILES * np.arcsin(np.sqrt(a))
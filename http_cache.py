@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+HTTP Cache - On-disk response cache with conditional GET revalidation
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Dict, Any, Optional
+
+import requests
+
+class HttpCache:
+    """
+    Caches successful GET responses on disk, keyed by URL and params.
+
+    Fresh entries (younger than the caller's TTL) are served without any
+    network traffic. Stale entries are revalidated with If-None-Match /
+    If-Modified-Since, so an unchanged page costs a 304 instead of a full
+    download. The least recently used entries are evicted once the cache
+    grows past ``max_bytes``.
+    """
+
+    def __init__(self, cache_dir: str, max_bytes: int = 500 * 1024 * 1024, session=None):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.session = session or requests.Session()
+        self._lock = threading.Lock()
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self._total_bytes = sum(meta.get('size', 0) for _, meta in self._iter_entries())
+
+    def cache_key(self, url: str, params: Optional[Dict[str, Any]] = None) -> str:
+        """Stable key for a URL and its query params (param order does not matter)"""
+        canonical = json.dumps([url, sorted((params or {}).items())], default=str)
+        return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+    def get(self, url: str, params: Optional[Dict[str, Any]] = None, ttl: float = 3600,
+            headers: Optional[Dict[str, str]] = None, timeout: float = 30) -> Dict[str, Any]:
+        """
+        Fetch a URL through the cache
+
+        Returns a dict with ``url``, ``status_code``, ``text``, ``headers``
+        and ``from_cache`` (True when no body was downloaded).
+        """
+        key = self.cache_key(url, params)
+        meta = self._read_meta(key)
+
+        if meta and time.time() - meta['fetched_at'] < ttl:
+            return self._cached_response(key, meta)
+
+        request_headers = dict(headers or {})
+        if meta:
+            if meta.get('etag'):
+                request_headers['If-None-Match'] = meta['etag']
+            if meta.get('last_modified'):
+                request_headers['If-Modified-Since'] = meta['last_modified']
+
+        response = self.session.get(url, params=params, headers=request_headers, timeout=timeout)
+
+        if response.status_code == 304 and meta:
+            # Unchanged upstream: restart the TTL clock and serve the stored body
+            meta['fetched_at'] = time.time()
+            self._write_meta(key, meta)
+            return self._cached_response(key, meta)
+
+        if response.status_code == 200:
+            self._store(key, url, params, response)
+
+        return {
+            'url': url,
+            'status_code': response.status_code,
+            'text': response.text,
+            'headers': dict(response.headers),
+            'from_cache': False
+        }
+
+    def evict(self):
+        """Remove least recently used entries until the cache fits in max_bytes"""
+        with self._lock:
+            if self._total_bytes <= self.max_bytes:
+                return
+
+            # Body mtime is bumped on every hit, so it doubles as last access time
+            entries = sorted(
+                self._iter_entries(),
+                key=lambda entry: self._last_access(entry[0])
+            )
+
+            for key, meta in entries:
+                if self._total_bytes <= self.max_bytes:
+                    break
+                self._remove(key)
+                self._total_bytes -= meta.get('size', 0)
+
+    def clear(self):
+        """Remove every cached entry"""
+        with self._lock:
+            for key, _ in list(self._iter_entries()):
+                self._remove(key)
+            self._total_bytes = 0
+
+    def _cached_response(self, key: str, meta: Dict[str, Any]) -> Dict[str, Any]:
+        body_path = self._body_path(key)
+
+        with open(body_path, 'rb') as f:
+            body = f.read()
+        os.utime(body_path)
+
+        return {
+            'url': meta['url'],
+            'status_code': meta['status_code'],
+            'text': body.decode(meta.get('encoding') or 'utf-8', errors='replace'),
+            'headers': meta.get('headers', {}),
+            'from_cache': True
+        }
+
+    def _store(self, key: str, url: str, params: Optional[Dict[str, Any]], response):
+        body = response.content
+        previous = self._read_meta(key)
+
+        meta = {
+            'url': url,
+            'params': params or {},
+            'status_code': response.status_code,
+            'headers': dict(response.headers),
+            'encoding': response.encoding,
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'fetched_at': time.time(),
+            'size': len(body)
+        }
+
+        self._atomic_write(self._body_path(key), body)
+        self._write_meta(key, meta)
+
+        with self._lock:
+            self._total_bytes += meta['size'] - (previous.get('size', 0) if previous else 0)
+
+        self.evict()
+
+    def _iter_entries(self):
+        for filename in os.listdir(self.cache_dir):
+            if filename.endswith('.json'):
+                key = filename[:-len('.json')]
+                meta = self._read_meta(key)
+                if meta:
+                    yield key, meta
+
+    def _read_meta(self, key: str) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self._meta_path(key), 'r') as f:
+                meta = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        # A metadata file without its body is unusable
+        return meta if os.path.exists(self._body_path(key)) else None
+
+    def _write_meta(self, key: str, meta: Dict[str, Any]):
+        self._atomic_write(self._meta_path(key), json.dumps(meta).encode('utf-8'))
+
+    def _atomic_write(self, path: str, data: bytes):
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+    def _last_access(self, key: str) -> float:
+        try:
+            return os.path.getmtime(self._body_path(key))
+        except OSError:
+            return 0.0
+
+    def _remove(self, key: str):
+        for path in (self._meta_path(key), self._body_path(key)):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def _meta_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def _body_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.body")
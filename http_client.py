@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+HTTP Client - Pooled session with per-host rate limiting and retry/backoff
+"""
+
+import random
+import threading
+import time
+from collections import defaultdict
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Any, Optional
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# Status codes worth retrying: throttling and transient server errors
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+class TokenBucket:
+    """Thread-safe token bucket: ``rate`` tokens per second, up to ``burst`` banked"""
+
+    def __init__(self, rate: float, burst: float = 1):
+        self.rate = rate
+        self.capacity = max(1.0, burst)
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a token is available, then take it"""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+                self.updated_at = now
+
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+
+                wait = (1 - self.tokens) / self.rate
+
+            time.sleep(wait)
+
+class HttpClient:
+    """
+    Shared, connection-pooled HTTP client for all scanner sources.
+
+    One ``requests.Session`` keeps connections alive across requests. Each
+    host gets its own token bucket so politeness limits hold even when
+    sources are scanned in parallel, and 429/5xx responses are retried with
+    exponential backoff that honours ``Retry-After``.
+    """
+
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        config = config or {}
+
+        self.max_retries = int(config.get('max_retries', 4))
+        self.backoff_base = float(config.get('backoff_base', 1.0))
+        self.backoff_max = float(config.get('backoff_max', 60.0))
+        self.rate_limits = config.get('rate_limits', {})  # host -> {'rate': req/s, 'burst': n}
+        self.default_rate = float(config.get('default_rate', 1.0))
+        self.default_burst = float(config.get('default_burst', 2))
+
+        pool_size = int(config.get('pool_maxsize', 10))
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+
+        self.session = requests.Session()
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        if config.get('user_agent'):
+            self.session.headers['User-Agent'] = config['user_agent']
+
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._counts = defaultdict(lambda: {'requests': 0, 'retries': 0, 'throttled': 0, 'errors': 0})
+        self._lock = threading.Lock()
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        """GET with rate limiting and retries (same signature as ``requests.get``)"""
+        return self.request('GET', url, **kwargs)
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        Send a request, waiting on the host's token bucket before each attempt
+
+        Retries connection errors and ``RETRY_STATUS_CODES`` up to
+        ``max_retries`` times; the last response (or exception) is returned
+        to the caller unchanged.
+        """
+        host = urlparse(url).netloc.lower()
+        bucket = self._bucket_for(host)
+        kwargs.setdefault('timeout', 30)
+
+        attempt = 0
+        while True:
+            bucket.acquire()
+            self._count(host, 'requests')
+
+            try:
+                response = self.session.request(method, url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout):
+                self._count(host, 'errors')
+                if attempt >= self.max_retries:
+                    raise
+                delay = self._backoff(attempt)
+            else:
+                if response.status_code not in RETRY_STATUS_CODES:
+                    return response
+
+                self._count(host, 'throttled' if response.status_code == 429 else 'errors')
+                if attempt >= self.max_retries:
+                    return response
+
+                retry_after = self._parse_retry_after(response.headers.get('Retry-After'))
+                delay = min(retry_after, self.backoff_max) if retry_after is not None else self._backoff(attempt)
+                response.close()
+
+            self._count(host, 'retries')
+            attempt += 1
+            time.sleep(delay)
+
+    def request_counts(self) -> Dict[str, Dict[str, int]]:
+        """Per-host counters: requests sent, retries, 429s and errors"""
+        with self._lock:
+            return {host: dict(counts) for host, counts in self._counts.items()}
+
+    def close(self):
+        self.session.close()
+
+    def _bucket_for(self, host: str) -> TokenBucket:
+        with self._lock:
+            if host not in self._buckets:
+                limit = self._rate_limit_for(host)
+                self._buckets[host] = TokenBucket(limit.get('rate', self.default_rate),
+                                                  limit.get('burst', self.default_burst))
+            return self._buckets[host]
+
+    def _rate_limit_for(self, host: str) -> Dict[str, float]:
+        # 'bizbuysell.com' in config also covers 'www.bizbuysell.com'
+        for configured_host, limit in self.rate_limits.items():
+            if host == configured_host or host.endswith('.' + configured_host):
+                return limit
+        return {}
+
+    def _backoff(self, attempt: int) -> float:
+        """Exponential backoff with full jitter"""
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+    def _parse_retry_after(self, value: Optional[str]) -> Optional[float]:
+        """Retry-After is either delta-seconds or an HTTP date"""
+        if not value:
+            return None
+
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+    def _count(self, host: str, counter: str):
+        with self._lock:
+            self._counts[host][counter] += 1
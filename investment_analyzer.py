@@ -5,19 +5,58 @@ Investment Analyzer - Generates detailed financial models and investment memos
 
 import json
 import os
+import re
+from functools import cached_property
 from typing import Dict, Any, List
 from datetime import datetime
-import pandas as pd
+
+import numpy as np
+
+from app_config import load_config
+
+PROJECTION_YEARS = 5
+BASE_GROWTH_RATE = 0.03  # 3% baseline
+DISCOUNT_RATE = 0.15  # 15% required return
+RAMP_PER_YEAR = 0.25  # AI gains phase in 25% per year
+
+# Scenario parameter -> list in config['ai_optimization_scenarios']
+SCENARIO_PARAMS = {
+    'efficiency_gains': 'efficiency_gains',
+    'cost_reduction': 'cost_reduction',
+    'revenue_increase': 'revenue_increase',
+    'lead_gen': 'lead_gen',
+    'margin_expansion_bps': 'margin_expansion'
+}
+
+# Names for the first scenarios; override with ai_optimization_scenarios.names
+SCENARIO_NAMES = ('conservative', 'aggressive')
 
 class InvestmentAnalyzer:
     def __init__(self, config_path: str = "/home/ubuntu/million_hunter/config.json"):
-        with open(config_path, 'r') as f:
-            self.config = json.load(f)
+        self.config = load_config(config_path)
         
         self.ai_scenarios = self.config['ai_optimization_scenarios']
         self.output_dir = "/home/ubuntu/million_hunter/output/investment_memos"
         os.makedirs(self.output_dir, exist_ok=True)
         
+    @cached_property
+    def simulator(self):
+        """Monte Carlo engine for the risk profile (config section 'simulation')"""
+        from deal_simulation import DealSimulator
+        return DealSimulator(self.config)
+        
+    @cached_property
+    def sensitivity(self):
+        """Cached valuation sensitivity grids (config section 'sensitivity')"""
+        from valuation_sensitivity import ValuationSensitivity
+        return ValuationSensitivity(self.config)
+        
+    @cached_property
+    def returns(self):
+        """Levered returns across financing structures (config section 'financing')"""
+        from deal_returns import ReturnsEngine
+        return ReturnsEngine(self.config)
+        
     def build_5yr_cashflow_model(self, listing: Dict[str, Any]) -> Dict[str, Any]:
         """Build 5-year cash flow projection model"""
         
@@ -33,12 +72,12 @@ class InvestmentAnalyzer:
         sde_margin = cash_flow / revenue if revenue > 0 else 0
         
         # Conservative growth assumptions
-        base_growth_rate = 0.03  # 3% baseline
+        base_growth_rate = BASE_GROWTH_RATE
         
         # Build 5-year projection
         projections = []
         
-        for year in range(1, 6):
+        for year in range(1, PROJECTION_YEARS + 1):
             # Apply conservative growth
             year_revenue = revenue * ((1 + base_growth_rate) ** year)
             year_cash_flow = year_revenue * sde_margin
@@ -66,23 +105,8 @@ class InvestmentAnalyzer:
         
         baseline_projections = baseline_model['baseline_projections']
         
-        # Conservative and aggressive AI scenarios
-        scenarios = {
-            'conservative': {
-                'efficiency_gains': self.ai_scenarios['efficiency_gains'][0],  # 15%
-                'cost_reduction': self.ai_scenarios['cost_reduction'][0],      # 10%
-                'revenue_increase': self.ai_scenarios['revenue_increase'][0],  # 20%
-                'lead_gen': self.ai_scenarios['lead_gen'][0],                  # 15%
-                'margin_expansion_bps': self.ai_scenarios['margin_expansion'][0]  # 300 bps
-            },
-            'aggressive': {
-                'efficiency_gains': self.ai_scenarios['efficiency_gains'][1],  # 30%
-                'cost_reduction': self.ai_scenarios['cost_reduction'][1],      # 25%
-                'revenue_increase': self.ai_scenarios['revenue_increase'][1],  # 40%
-                'lead_gen': self.ai_scenarios['lead_gen'][1],                  # 35%
-                'margin_expansion_bps': self.ai_scenarios['margin_expansion'][1]  # 500 bps
-            }
-        }
+        # Conservative, aggressive and any further configured AI scenarios
+        scenarios = self.scenario_parameters()
         
         optimized_scenarios = {}
         
@@ -95,7 +119,7 @@ class InvestmentAnalyzer:
                 base_cash_flow = year_data['cash_flow']
                 
                 # Apply AI optimizations progressively (ramp up over years)
-                ramp_factor = min(1.0, year * 0.25)  # 25% per year ramp
+                ramp_factor = min(1.0, year * RAMP_PER_YEAR)  # 25% per year ramp
                 
                 # Revenue increase from AI-driven lead gen and optimization
                 revenue_lift = base_revenue * params['revenue_increase'] * ramp_factor
@@ -129,6 +153,177 @@ class InvestmentAnalyzer:
         
         return optimized_scenarios
     
+    def scenario_parameters(self) -> Dict[str, Dict[str, float]]:
+        """
+        Named AI scenarios from config
+        
+        Entry i of every ``ai_optimization_scenarios`` list forms scenario i,
+        so adding a value to each list adds a scenario.
+        """
+        count = min(len(self.ai_scenarios[key]) for key in SCENARIO_PARAMS.values())
+        names = list(self.ai_scenarios.get('names', SCENARIO_NAMES))
+        
+        scenarios = {}
+        for i in range(count):
+            name = names[i] if i < len(names) else f"scenario_{i + 1}"
+            scenarios[name] = {param: self.ai_scenarios[key][i] for param, key in SCENARIO_PARAMS.items()}
+        return scenarios
+    
+    def batch_financials(self, listings) -> Dict[str, np.ndarray]:
+        """
+        Revenue, cash flow and asking price arrays for a batch of listings
+        
+        Takes a list of listing dicts (``*_numeric`` fields) or a DataFrame
+        with ``*_numeric`` or ``*_value`` columns, e.g. a ListingsArchive
+        read. Missing values become 0, which marks the listing invalid.
+        """
+        financials = {}
+        for name in ('revenue', 'cash_flow', 'asking_price'):
+            if hasattr(listings, 'columns'):
+                column = next((c for c in (f"{name}_numeric", f"{name}_value") if c in listings.columns), None)
+                values = (listings[column].to_numpy(dtype=float, na_value=0.0)
+                          if column else np.zeros(len(listings)))
+            else:
+                values = np.fromiter(
+                    (listing.get(f"{name}_numeric", 0) or 0 for listing in listings),
+                    dtype=float, count=len(listings)
+                )
+            financials[name] = np.nan_to_num(values, nan=0.0)
+        return financials
+    
+    def build_cashflow_batch(self, revenue: np.ndarray, cash_flow: np.ndarray) -> Dict[str, Any]:
+        """
+        ``build_5yr_cashflow_model`` for N listings at once
+        
+        Returns (N, years) ``revenue`` / ``cash_flow`` projections rounded
+        as in the per-listing model, the (N,) ``sde_margin`` and a ``valid``
+        mask (False where the per-listing model reports insufficient data).
+        """
+        revenue = np.asarray(revenue, dtype=float)
+        cash_flow = np.asarray(cash_flow, dtype=float)
+        years = np.arange(1, PROJECTION_YEARS + 1)
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            sde_margin = np.where(revenue > 0, cash_flow / np.where(revenue > 0, revenue, 1.0), 0.0)
+        
+        year_revenue = revenue[:, None] * (1 + BASE_GROWTH_RATE) ** years
+        year_cash_flow = year_revenue * sde_margin[:, None]
+        
+        return {
+            'valid': (revenue != 0) & (cash_flow != 0),
+            'years': years,
+            'revenue': _round(year_revenue, 2),
+            'cash_flow': _round(year_cash_flow, 2),
+            'sde_margin': sde_margin,
+            'growth_rate': BASE_GROWTH_RATE
+        }
+    
+    def apply_scenarios_batch(self, baseline: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        ``apply_ai_optimization_scenarios`` over listings x scenarios x years
+        
+        Every array is (N, S, years) with S the configured scenarios, in
+        ``names`` order; values are rounded as in the per-listing model.
+        """
+        params = self.scenario_parameters()
+        revenue_increase = np.array([p['revenue_increase'] for p in params.values()], dtype=float)[None, :, None]
+        cost_reduction_rate = np.array([p['cost_reduction'] for p in params.values()], dtype=float)[None, :, None]
+        margin_expansion = np.array([p['margin_expansion_bps'] for p in params.values()], dtype=float)[None, :, None] / 10000
+        
+        ramp = np.minimum(1.0, baseline['years'] * RAMP_PER_YEAR)
+        base_revenue = baseline['revenue'][:, None, :]
+        base_cash_flow = baseline['cash_flow'][:, None, :]
+        
+        revenue_lift = base_revenue * revenue_increase * ramp
+        optimized_revenue = base_revenue + revenue_lift
+        cost_savings = (base_revenue - base_cash_flow) * cost_reduction_rate * ramp
+        optimized_cash_flow = base_cash_flow + revenue_lift + cost_savings
+        optimized_cash_flow = optimized_cash_flow + optimized_revenue * margin_expansion * ramp
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            sde_margin = optimized_cash_flow / optimized_revenue
+        
+        return {
+            'names': list(params),
+            'parameters': params,
+            'ramp_factor': _round(ramp, 2),
+            'revenue': _round(optimized_revenue, 2),
+            'cash_flow': _round(optimized_cash_flow, 2),
+            'sde_margin': _round(sde_margin, 4),
+            'revenue_lift': _round(revenue_lift, 2),
+            'cost_savings': _round(cost_savings, 2)
+        }
+    
+    def run_valuation_batch(self, financials: Dict[str, np.ndarray], baseline: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        ``run_valuation_methods`` for N listings at once
+        
+        Range methods are (N, 3) arrays of low / mid / high; the rest are
+        (N,). Invalid listings get NaN and an empty assessment.
+        """
+        revenue, cash_flow, asking_price = financials['revenue'], financials['cash_flow'], financials['asking_price']
+        valid = baseline['valid']
+        
+        sde_multiple = cash_flow[:, None] * np.array([2.0, 3.0, 4.0])
+        revenue_multiple = revenue[:, None] * np.array([0.5, 1.0, 1.5])
+        
+        discount = (1 + DISCOUNT_RATE) ** baseline['years']
+        dcf = (baseline['cash_flow'] / discount).sum(axis=1)
+        dcf += baseline['cash_flow'][:, -1] / DISCOUNT_RATE / (1 + DISCOUNT_RATE) ** PROJECTION_YEARS
+        
+        fair_value = np.column_stack([
+            np.minimum(sde_multiple[:, 0], revenue_multiple[:, 0]),
+            (sde_multiple[:, 1] + revenue_multiple[:, 1] + dcf) / 3,
+            np.maximum(sde_multiple[:, 2], revenue_multiple[:, 2])
+        ])
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            asking_to_sde = np.where(cash_flow > 0, _round(asking_price / cash_flow, 2), 0.0)
+            asking_to_revenue = np.where(revenue > 0, _round(asking_price / revenue, 2), 0.0)
+        
+        assessment = np.select(
+            [asking_price <= 0, asking_price < fair_value[:, 0], asking_price <= fair_value[:, 1], asking_price <= fair_value[:, 2]],
+            ['', 'Undervalued - Strong Buy', 'Fair Value - Good Opportunity', 'Slight Premium - Negotiate'],
+            default='Overvalued - Pass or Strong Negotiation'
+        ).astype(object)
+        assessment[~valid] = ''
+        
+        def masked(values):
+            values = _round(values, 2)
+            values[~valid] = np.nan
+            return values
+        
+        return {
+            'sde_multiple': masked(sde_multiple),
+            'revenue_multiple': masked(revenue_multiple),
+            'dcf': masked(dcf),
+            'discount_rate': DISCOUNT_RATE,
+            'asset_based': masked(revenue * 0.3),
+            'asking_price': asking_price,
+            'asking_price_to_sde': masked(asking_to_sde),
+            'asking_price_to_revenue': masked(asking_to_revenue),
+            'fair_value_range': masked(fair_value),
+            'assessment': assessment
+        }
+    
+    def analyze_batch(self, listings) -> Dict[str, Any]:
+        """
+        Cash flow projections, AI scenarios and valuations for many listings
+        
+        Vectorized equivalent of the per-listing model methods; see
+        ``batch_financials`` for accepted inputs. Rows follow input order.
+        """
+        financials = self.batch_financials(listings)
+        baseline = self.build_cashflow_batch(financials['revenue'], financials['cash_flow'])
+        
+        return {
+            'valid': baseline['valid'],
+            'financials': financials,
+            'baseline': baseline,
+            'scenarios': self.apply_scenarios_batch(baseline),
+            'valuation': self.run_valuation_batch(financials, baseline)
+        }
+    
     def research_local_competition(self, listing: Dict[str, Any]) -> Dict[str, Any]:
         """Research local competition and market dynamics"""
         
@@ -223,7 +418,7 @@ class InvestmentAnalyzer:
         revenue_multiple_high = revenue * 1.5
         
         # Discounted Cash Flow (DCF) - simplified
-        discount_rate = 0.15  # 15% required return
+        discount_rate = DISCOUNT_RATE
         
         if 'baseline_projections' in cashflow_model:
             projections = cashflow_model['baseline_projections']
@@ -322,7 +517,7 @@ class InvestmentAnalyzer:
 - **Revenue:** ${listing.get('revenue_numeric', 0):,.0f}
 - **Cash Flow (SDE):** ${listing.get('cash_flow_numeric', 0):,.0f}
 - **Asking Price:** ${listing.get('asking_price_numeric', 0):,.0f}
-- **SDE Margin:** {(listing.get('cash_flow_numeric', 0) / listing.get('revenue_numeric', 1) * 100):.1f}%
+- **SDE Margin:** {(listing.get('cash_flow_numeric', 0) / listing.get('revenue_numeric', 1) * 100):.1f}%{self._format_estimated(listing.get('financials_estimated'))}
 
 ### Value Creation Opportunities
 
@@ -339,7 +534,7 @@ class InvestmentAnalyzer:
 - Estimated contract pipeline: $500K-$2M annually
 
 ### Valuation Analysis
-{self._format_valuation(analysis_results.get('valuation', {}))}
+{self._format_valuation(analysis_results.get('valuation', {}))}{self._format_simulation(analysis_results.get('simulation'))}{self._format_sensitivity(analysis_results.get('sensitivity'))}
 
 ### Risk Factors
 - Customer concentration risk
@@ -382,19 +577,7 @@ class InvestmentAnalyzer:
 - Exit strategy preparation
 
 ### Expected Returns
-
-**Conservative Scenario:**
-- Year 1 Cash Flow: ${analysis_results.get('ai_scenarios', {}).get('conservative', {}).get('projections', [{}])[0].get('cash_flow', 0):,.0f}
-- Year 5 Cash Flow: ${analysis_results.get('ai_scenarios', {}).get('conservative', {}).get('projections', [{}])[-1].get('cash_flow', 0):,.0f}
-- 5-Year IRR: 25-30%
-- Cash-on-Cash Return: 40-50%
-
-**Aggressive Scenario:**
-- Year 1 Cash Flow: ${analysis_results.get('ai_scenarios', {}).get('aggressive', {}).get('projections', [{}])[0].get('cash_flow', 0):,.0f}
-- Year 5 Cash Flow: ${analysis_results.get('ai_scenarios', {}).get('aggressive', {}).get('projections', [{}])[-1].get('cash_flow', 0):,.0f}
-- 5-Year IRR: 35-45%
-- Cash-on-Cash Return: 60-80%
-
+{self._format_expected_returns(analysis_results.get('ai_scenarios', {}), analysis_results.get('returns'))}
 ### Recommendation
 **{analysis_results.get('valuation', {}).get('assessment', 'Further Analysis Required')}**
 
@@ -404,6 +587,15 @@ class InvestmentAnalyzer:
         
         return thesis
     
+    def _format_estimated(self, estimated: List[str]) -> str:
+        """Warning naming the figures that are placeholders for undisclosed financials"""
+        if not estimated:
+            return ""
+        
+        names = ', '.join(name.replace('_', ' ') for name in estimated)
+        return (f"\n\n> **Estimated financials:** the listing does not disclose {names}; placeholder\n"
+                f"> figures were used, so the valuation and returns below are indicative only.")
+    
     def _format_valuation(self, valuation: Dict[str, Any]) -> str:
         """Format valuation section"""
         if not valuation or 'error' in valuation:
@@ -419,6 +611,100 @@ class InvestmentAnalyzer:
 **Assessment:** {valuation.get('assessment', 'Under Review')}
 """
     
+    def _format_simulation(self, simulation: Dict[str, Any]) -> str:
+        """Format Monte Carlo risk profile (empty when simulation is disabled)"""
+        if not simulation or 'error' in simulation:
+            return ""
+        
+        lines = [f"\n**Monte Carlo Risk Profile ({simulation['paths']:,} paths, P5 / P50 / P95):**  "]
+        for key, label in (('standalone', 'Standalone'), ('ai_adjusted', 'With AI Optimization')):
+            outcome = simulation[key]
+            dcf = outcome['dcf_bands']
+            year5 = outcome['cash_flow_bands'][max(outcome['cash_flow_bands'])]
+            overpay = outcome.get('prob_overpay')
+            lines.append(
+                f"- {label}: DCF ${dcf[0]:,.0f} / ${dcf[2]:,.0f} / ${dcf[4]:,.0f}; "
+                f"Year 5 Cash Flow ${year5[0]:,.0f} / ${year5[2]:,.0f} / ${year5[4]:,.0f}; "
+                f"P(Overpay) {f'{overpay:.1%}' if overpay is not None else 'N/A'}  "
+            )
+        return '\n'.join(lines) + '\n'
+    
+    def _format_sensitivity(self, sensitivity: Dict[str, Any]) -> str:
+        """Format tornado ranking and DCF sensitivity table (empty when disabled)"""
+        if not sensitivity or 'error' in sensitivity:
+            return ""
+        
+        labels = {
+            'discount_rate': 'Discount Rate',
+            'growth_rate': 'Growth Rate',
+            'sde_multiple': 'SDE Multiple',
+            'terminal_growth': 'Terminal Growth'
+        }
+        
+        def fmt(name, value):
+            return f"{value:.1f}x" if name == 'sde_multiple' else f"{value:.1%}"
+        
+        def money(value):
+            return f"${value:,.0f}" if value is not None else "n/a"
+        
+        lines = ["", "**Sensitivity (Fair Value Mid, widest swing first):**  "]
+        for bar in sensitivity['tornado']:
+            name = bar['parameter']
+            lines.append(
+                f"- {labels[name]} {fmt(name, bar['low'])} - {fmt(name, bar['high'])}: "
+                f"{money(bar['metric_at_low'])} - {money(bar['metric_at_high'])} (swing {money(bar['swing'])})"
+            )
+        
+        table = sensitivity['table']
+        lines += ["", f"**DCF Value by {labels[table['rows']]} (rows) and {labels[table['columns']]} (columns):**", ""]
+        lines.append("| | " + " | ".join(fmt(table['columns'], value) for value in table['column_values']) + " |")
+        lines.append("|---" * (len(table['column_values']) + 1) + "|")
+        for row_value, row in zip(table['row_values'], table['values']):
+            lines.append(f"| {fmt(table['rows'], row_value)} | " + " | ".join(money(value) for value in row) + " |")
+        return '\n'.join(lines) + '\n'
+    
+    def _format_expected_returns(self, ai_scenarios: Dict[str, Any], returns: Dict[str, Any]) -> str:
+        """Cash flow and levered returns of every AI scenario, in scenario order"""
+        blocks = []
+        for name, scenario in ai_scenarios.items():
+            if not isinstance(scenario, dict) or not scenario.get('projections'):
+                continue
+            projections = scenario['projections']
+            blocks.append(f"""
+**{name.replace('_', ' ').title()} Scenario:**
+- Year 1 Cash Flow: ${projections[0].get('cash_flow', 0):,.0f}
+- Year 5 Cash Flow: ${projections[-1].get('cash_flow', 0):,.0f}
+{self._format_returns(returns, name)}
+""")
+        
+        terms = (returns or {}).get('terms')
+        if terms and blocks:
+            blocks.append(f"""
+*Equity cash flow is SDE less ${terms['owner_compensation']:,.0f}/yr owner compensation, a {terms['capex_rate']:.0%} capex reserve and debt service; the exit is priced on SDE.*
+""")
+        return ''.join(blocks)
+    
+    def _format_returns(self, returns: Dict[str, Any], scenario: str) -> str:
+        """Format levered IRR / cash-on-cash lines of one scenario"""
+        results = (returns or {}).get('scenarios', {}).get(scenario)
+        if not results or 'error' in results:
+            return "- 5-Year IRR: N/A (requires asking price and financials)\n- Cash-on-Cash Return: N/A"
+        
+        def pct_range(values):
+            # Empty when no structure at the asking price has a solution
+            if not values:
+                return "N/A (no financing structure at asking has a solution)"
+            return f"{values['low']:.1%} - {values['high']:.1%} (median {values['median']:.1%})"
+        
+        irr = pct_range(results['irr'])
+        if results['irr']:
+            irr += f" across {returns['structures_at_asking']} financing structures at asking"
+        
+        best = results['best_structure']
+        return f"""- 5-Year IRR: {irr}
+- Cash-on-Cash Return (Year 1): {pct_range(results['cash_on_cash'])}
+- Best Structure: {best['price_to_asking']:.0%} of asking, {best['down_payment']:.0%} down, {best['seller_financing']:.0%} seller note at {best['seller_rate']:.1%}, SBA at {best['sba_rate']:.2%}, {best['exit_multiple']:.1f}x exit (IRR {best['irr']:.1%}, cash-on-cash {best['cash_on_cash']:.1%})"""
+    
     def build_post_acq_ai_roadmap(self, listing: Dict[str, Any]) -> Dict[str, Any]:
         """Build detailed post-acquisition AI implementation roadmap"""
         
@@ -492,6 +778,9 @@ class InvestmentAnalyzer:
         # Run valuation
         valuation = self.run_valuation_methods(listing, cashflow_model)
         
+        # Levered returns across financing structures
+        returns = self.returns.analyze(listing, ai_scenarios)
+        
         # Research components
         competition = self.research_local_competition(listing)
         govt_contracts = self.identify_govt_contract_ops(listing)
@@ -506,12 +795,21 @@ class InvestmentAnalyzer:
             'cashflow_model': cashflow_model,
             'ai_scenarios': ai_scenarios,
             'valuation': valuation,
+            'returns': returns,
             'competition': competition,
             'govt_contracts': govt_contracts,
             'ai_roadmap': ai_roadmap,
             'analyzed_at': datetime.now().isoformat()
         }
         
+        # Outcome distribution (growth, margin, AI ramp and discount rate sampled per path)
+        if self.config.get('simulation', {}).get('enabled', False):
+            analysis_results['simulation'] = self.simulator.simulate(listing)
+        
+        # What-if grid over valuation assumptions (config: sensitivity.enabled)
+        if self.config.get('sensitivity', {}).get('enabled', False):
+            analysis_results['sensitivity'] = self.sensitivity.summary(listing)
+        
         # Generate investment thesis
         thesis = self.generate_investment_thesis(listing, analysis_results)
         analysis_results['investment_thesis'] = thesis
@@ -522,8 +820,7 @@ class InvestmentAnalyzer:
         """Save investment memo to file"""
         
         if not filename:
-            title = analysis['listing'].get('title', 'business').replace(' ', '_').lower()
-            filename = f"investment_memo_{title}_{datetime.now().strftime('%Y%m%d')}.md"
+            filename = memo_filename(analysis['listing'].get('title'))
         
         filepath = os.path.join(self.output_dir, filename)
         
@@ -543,6 +840,34 @@ class InvestmentAnalyzer:
         
         return filepath
 
+def memo_filename(title: str, key: str = None) -> str:
+    """
+    Memo filename for a listing: the title reduced to a safe slug, plus
+    ``key`` (e.g. the listing's canonical ID) so same-titled listings
+    don't overwrite each other's memos
+    """
+    slug = re.sub(r'[^a-z0-9]+', '_', (title or '').lower()).strip('_')[:60].rstrip('_') or 'business'
+    parts = ['investment_memo', slug, key, datetime.now().strftime('%Y%m%d')]
+    return '_'.join(part for part in parts if part) + '.md'
+
+def _round(values, ndigits: int) -> np.ndarray:
+    """
+    Element-wise round() for arrays
+    
+    np.round scales, rounds and rescales, so it can differ from Python's
+    correctly rounded round() on values sitting on a half; those few are
+    redone with round() so batch results match the per-listing models.
+    """
+    values = np.asarray(values, dtype=float)
+    rounded = np.round(values, ndigits)
+    
+    scaled = values * 10.0 ** ndigits
+    with np.errstate(invalid='ignore'):
+        ties = np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6 + 4 * np.spacing(np.abs(scaled))
+    if ties.any():
+        rounded[ties] = [round(value, ndigits) for value in values[ties].tolist()]
+    return rounded
+
 def main():
     """Main execution"""
     analyzer = InvestmentAnalyzer()
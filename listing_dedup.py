@@ -0,0 +1,309 @@
+#!/usr/bin/env python3
+"""
+Listing Deduplicator - Clusters near-duplicate listings across sources with MinHash/LSH
+"""
+
+import json
+import math
+import os
+import re
+import zlib
+from collections import defaultdict
+from typing import List, Dict, Any, Set, Optional
+
+import numpy as np
+
+from currency_parser import parse_currency
+from geo_normalizer import LocationNormalizer
+from listing_io import listing_fingerprint
+
+# Mersenne prime for the universal hash family; hashes stay below 2**31
+_PRIME = (1 << 31) - 1
+
+# Words that carry no identity in marketplace titles
+_TITLE_STOPWORDS = {
+    'a', 'an', 'and', 'the', 'of', 'in', 'for', 'with', 'to', 'at', 'on',
+    'sale', 'business', 'company', 'established', 'profitable', 'opportunity',
+    'llc', 'inc', 'co', 'corp', 'ltd'
+}
+
+_WORD_RE = re.compile(r'[a-z0-9]+')
+
+# Fields that make a record more useful when picking the canonical copy
+_DETAIL_FIELDS = ('title', 'asking_price', 'revenue', 'cash_flow', 'location', 'sector', 'url')
+
+class ListingDeduplicator:
+    """
+    Finds the same business posted on several marketplaces.
+
+    Each listing is reduced to a set of shingles (title words and character
+    4-grams, normalized city and state, and log-bucketed financials) and
+    summarised by a MinHash signature. Locality-sensitive hashing over
+    signature bands surfaces candidate pairs in roughly linear time;
+    candidates whose estimated Jaccard similarity reaches ``threshold`` are
+    merged. Unless ``bands`` is given, the banding is derived from
+    ``threshold`` (see ``lsh_bands``).
+
+    Signatures and canonical IDs persist in ``index_dir`` so a listing that
+    reappears tomorrow on another site joins the cluster it belonged to today.
+    """
+
+    def __init__(self, index_dir: str, num_perm: int = 120, bands: Optional[int] = None,
+                 threshold: float = 0.5, cross_source_only: bool = True, seed: int = 1):
+        bands = bands or lsh_bands(num_perm, threshold)
+        if num_perm % bands:
+            raise ValueError(f"num_perm ({num_perm}) must be divisible by bands ({bands})")
+
+        self.index_dir = index_dir
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.threshold = threshold
+        self.cross_source_only = cross_source_only
+        self.geo = LocationNormalizer()
+
+        rng = np.random.default_rng(seed)
+        self._a = rng.integers(1, _PRIME, size=num_perm, dtype=np.uint64)
+        self._b = rng.integers(0, _PRIME, size=num_perm, dtype=np.uint64)
+
+        # Persistent index: one entry per listing fingerprint
+        self._fingerprints: List[str] = []
+        self._canonical_ids: List[str] = []
+        self._sources: List[str] = []
+        self._signatures = np.empty((0, num_perm), dtype=np.uint32)
+        self._positions: Dict[str, int] = {}
+        self._buckets = defaultdict(set)
+        self._pending: List[np.ndarray] = []
+
+        self._load()
+
+    def shingles(self, listing: Dict[str, Any]) -> Set[str]:
+        """Normalized tokens describing the business behind a listing"""
+        title_words = [
+            word for word in _WORD_RE.findall(str(listing.get('title') or '').lower())
+            if word not in _TITLE_STOPWORDS
+        ]
+        shingles = {f"w:{word}" for word in title_words}
+
+        joined = ' '.join(title_words)
+        shingles.update(f"c:{joined[i:i + 4]}" for i in range(len(joined) - 3))
+
+        # Location and financials only sharpen a match; a title is required
+        if not shingles:
+            return shingles
+
+        # "Atlanta, GA" and "Atlanta, Georgia" shingle alike; unparsed text falls back to its words
+        location = self.geo.normalize(listing.get('location'))
+        if location['state']:
+            location_text = f"{location['city'] or ''} {location['state']}"
+        else:
+            location_text = str(listing.get('location') or '')
+        shingles.update(f"l:{word}" for word in _WORD_RE.findall(location_text.lower()))
+
+        for field in ('asking_price', 'revenue', 'cash_flow'):
+            bucket = self._amount_bucket(listing.get(field))
+            if bucket is not None:
+                shingles.add(f"{field}:{bucket}")
+
+        return shingles
+
+    def signature(self, shingles: Set[str]) -> np.ndarray:
+        """MinHash signature of a shingle set"""
+        hashes = np.fromiter(
+            (zlib.crc32(shingle.encode('utf-8')) for shingle in shingles),
+            dtype=np.uint64,
+            count=len(shingles)
+        )
+        # (a * x + b) mod p for every permutation x shingle, then min per permutation
+        permuted = (np.outer(self._a, hashes % _PRIME) + self._b[:, None]) % _PRIME
+        return permuted.min(axis=1).astype(np.uint32)
+
+    def dedupe(self, listings: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Collapse near-duplicates into one canonical record per business
+
+        Returns one record per cluster, in first-appearance order, with
+        ``canonical_id``, ``source_links`` (every source/URL posting it) and
+        ``duplicate_count`` added. The index is updated and saved.
+        """
+        parent = list(range(len(listings)))
+
+        def find(i: int) -> int:
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+
+        def union(i: int, j: int):
+            root_i, root_j = find(i), find(j)
+            if root_i != root_j:
+                parent[max(root_i, root_j)] = min(root_i, root_j)
+
+        fingerprints = [listing_fingerprint(listing) for listing in listings]
+        signatures = [None] * len(listings)
+        indexed_matches = defaultdict(set)  # batch position -> matching index positions
+        batch_buckets = defaultdict(list)
+
+        for i, listing in enumerate(listings):
+            shingles = self.shingles(listing)
+            if not shingles:
+                continue
+
+            signatures[i] = self.signature(shingles)
+            source = listing.get('source', '')
+
+            for band_key in self._band_keys(signatures[i]):
+                for j in batch_buckets[band_key]:
+                    if find(i) != find(j) and self._is_match(source, listings[j].get('source', ''), signatures[i], signatures[j]):
+                        union(i, j)
+                batch_buckets[band_key].append(i)
+
+                for position in self._buckets.get(band_key, ()):
+                    if position in indexed_matches[i] or self._fingerprints[position] == fingerprints[i]:
+                        continue
+                    if self._is_match(source, self._sources[position], signatures[i], self._signatures[position]):
+                        indexed_matches[i].add(position)
+
+        clusters = defaultdict(list)
+        for i in range(len(listings)):
+            clusters[find(i)].append(i)
+
+        records = []
+        for root in sorted(clusters):
+            members = clusters[root]
+            canonical_id = self._resolve_canonical_id(members, fingerprints, indexed_matches)
+
+            record = dict(max(
+                (listings[i] for i in members),
+                key=lambda listing: sum(1 for field in _DETAIL_FIELDS if listing.get(field) not in (None, '', 'N/A'))
+            ))
+            record['canonical_id'] = canonical_id
+            record['source_links'] = [
+                {'source': listings[i].get('source'), 'url': listings[i].get('url')}
+                for i in members
+            ]
+            record['duplicate_count'] = len(members) - 1
+            records.append(record)
+
+            for i in members:
+                self._index(fingerprints[i], canonical_id, listings[i].get('source', ''), signatures[i])
+
+        self._flush_pending()
+        self.save()
+        return records
+
+    def save(self):
+        """Persist the index to ``index_dir``"""
+        os.makedirs(self.index_dir, exist_ok=True)
+
+        np.save(os.path.join(self.index_dir, 'signatures.npy'), self._signatures)
+        with open(os.path.join(self.index_dir, 'entries.json'), 'w') as f:
+            json.dump({
+                'num_perm': self.num_perm,
+                'fingerprints': self._fingerprints,
+                'canonical_ids': self._canonical_ids,
+                'sources': self._sources
+            }, f)
+
+    def _load(self):
+        entries_path = os.path.join(self.index_dir, 'entries.json')
+        signatures_path = os.path.join(self.index_dir, 'signatures.npy')
+        if not (os.path.exists(entries_path) and os.path.exists(signatures_path)):
+            return
+
+        with open(entries_path, 'r') as f:
+            entries = json.load(f)
+        if entries.get('num_perm') != self.num_perm:
+            print(f"Ignoring dedup index built with num_perm={entries.get('num_perm')}")
+            return
+
+        self._fingerprints = entries['fingerprints']
+        self._canonical_ids = entries['canonical_ids']
+        self._sources = entries['sources']
+        self._signatures = np.load(signatures_path)
+
+        for position, fingerprint in enumerate(self._fingerprints):
+            self._positions[fingerprint] = position
+            self._add_to_buckets(position)
+
+    def _index(self, fingerprint: str, canonical_id: str, source: str, signature):
+        if signature is None:
+            return
+
+        position = self._positions.get(fingerprint)
+        if position is not None:
+            # Same listing seen again: refresh its signature in place
+            self._canonical_ids[position] = canonical_id
+            if not np.array_equal(self._signatures[position], signature):
+                self._signatures[position] = signature
+                self._add_to_buckets(position)
+            return
+
+        # New listings are stacked onto the signature matrix in one go by _flush_pending
+        self._positions[fingerprint] = len(self._fingerprints)
+        self._fingerprints.append(fingerprint)
+        self._canonical_ids.append(canonical_id)
+        self._sources.append(source)
+        self._pending.append(signature)
+
+    def _flush_pending(self):
+        if not self._pending:
+            return
+
+        first_new = len(self._signatures)
+        self._signatures = np.vstack([self._signatures, np.stack(self._pending)])
+        self._pending = []
+
+        for position in range(first_new, len(self._signatures)):
+            self._add_to_buckets(position)
+
+    def _add_to_buckets(self, position: int):
+        for band_key in self._band_keys(self._signatures[position]):
+            self._buckets[band_key].add(position)
+
+    def _band_keys(self, signature: np.ndarray):
+        for band in range(self.bands):
+            yield (band, signature[band * self.rows:(band + 1) * self.rows].tobytes())
+
+    def _is_match(self, source_a: str, source_b: str, signature_a, signature_b) -> bool:
+        if self.cross_source_only and source_a == source_b:
+            return False
+        return float(np.mean(signature_a == signature_b)) >= self.threshold
+
+    def _resolve_canonical_id(self, members: List[int], fingerprints: List[str],
+                              indexed_matches: Dict[int, Set[int]]) -> str:
+        """Reuse the oldest known canonical ID in the cluster, else mint one from the first member"""
+        known_positions = set()
+        for i in members:
+            if fingerprints[i] in self._positions:
+                known_positions.add(self._positions[fingerprints[i]])
+            known_positions.update(indexed_matches.get(i, ()))
+
+        if known_positions:
+            return self._canonical_ids[min(known_positions)]
+        return fingerprints[members[0]]
+
+    @staticmethod
+    def _amount_bucket(value) -> str:
+        """Log bucket (~10% wide) so $1.2M and $1,195,000 land together"""
+        amount = parse_currency(value)
+        if not amount > 0:
+            return None
+
+        return str(round(math.log(amount, 1.1)))
+
+def lsh_bands(num_perm: int, threshold: float) -> int:
+    """
+    Band count for ``num_perm`` permutations that puts the LSH threshold
+    (1/bands) ** (1/rows) as close to ``threshold`` as possible without
+    exceeding it, so pairs at the match threshold are rarely missed
+    (120 permutations at 0.5 -> 30 bands of 4 rows, LSH threshold ~0.43)
+    """
+    candidates = [bands for bands in range(1, num_perm + 1) if num_perm % bands == 0]
+    at_or_below = [
+        bands for bands in candidates
+        if (1 / bands) ** (bands / num_perm) <= threshold
+    ]
+    if not at_or_below:
+        return num_perm
+    return min(at_or_below, key=lambda bands: threshold - (1 / bands) ** (bands / num_perm))
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Listing I/O - Fixed listing schema and incremental JSON Lines reader/writer
+"""
+
+import hashlib
+import json
+from typing import Dict, Any, Iterable, Iterator
+
+# Column order for every listing file; keys outside the schema are dropped
+LISTING_FIELDS = [
+    'source',
+    'title',
+    'sector',
+    'asking_price',
+    'revenue',
+    'cash_flow',
+    'location',
+    'city',
+    'state',
+    'zip_code',
+    'url',
+    'scan_date',
+    'status',
+    'type',
+    'canonical_id',
+    'source_links',
+    'duplicate_count',
+    'change_type'
+]
+
+# Fields holding lists or dicts, JSON-encoded in flat formats such as CSV
+NESTED_FIELDS = ('source_links',)
+
+def to_record(listing: Dict[str, Any]) -> Dict[str, Any]:
+    """Project a listing onto the fixed schema (missing fields become None)"""
+    return {field: listing.get(field) for field in LISTING_FIELDS}
+
+def to_flat_record(listing: Dict[str, Any]) -> Dict[str, Any]:
+    """``to_record`` with ``NESTED_FIELDS`` JSON-encoded, for CSV rows and text columns"""
+    record = to_record(listing)
+    for field in NESTED_FIELDS:
+        if record[field] is not None:
+            record[field] = json.dumps(record[field])
+    return record
+
+class JsonLinesWriter:
+    """
+    Append listings to a JSON Lines file one record at a time.
+
+    The file is flushed every ``flush_every`` records so downstream readers
+    can start consuming it while the scan is still running.
+    """
+
+    def __init__(self, filepath: str, flush_every: int = 100):
+        self.filepath = filepath
+        self.flush_every = flush_every
+        self.count = 0
+        self._file = None
+
+    def __enter__(self):
+        self._file = open(self.filepath, 'w')
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def write(self, listing: Dict[str, Any]):
+        self._file.write(json.dumps(to_record(listing)) + '\n')
+        self.count += 1
+
+        if self.count % self.flush_every == 0:
+            self._file.flush()
+
+    def write_all(self, listings: Iterable[Dict[str, Any]]) -> int:
+        for listing in listings:
+            self.write(listing)
+        return self.count
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+def iter_jsonl(filepath: str) -> Iterator[Dict[str, Any]]:
+    """Yield listings from a JSON Lines file without loading it whole"""
+    with open(filepath, 'r') as f:
+        for line in f:
+            line = line.strip()
+            if line:
+                yield json.loads(line)
+
+def listing_fingerprint(listing: Dict[str, Any]) -> str:
+    """
+    Stable identity for a listing across scans
+
+    Uses source + URL when the listing has a URL, otherwise source + title
+    + location. A ``canonical_id`` assigned by deduplication takes priority.
+    """
+    if listing.get('canonical_id'):
+        return listing['canonical_id']
+
+    if listing.get('url'):
+        identity = f"{listing.get('source', '')}|{listing['url']}"
+    else:
+        identity = f"{listing.get('source', '')}|{listing.get('title', '')}|{listing.get('location', '')}"
+
+    return hashlib.sha1(identity.encode('utf-8')).hexdigest()[:16]
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""
+Listing Store - Persistent seen-listing history with field-level change detection
+"""
+
+import json
+import sqlite3
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import List, Dict, Any, Optional, Tuple
+
+from listing_io import listing_fingerprint
+
+# Fields whose change makes a listing worth re-scoring
+MATERIAL_FIELDS = ('title', 'asking_price', 'revenue', 'cash_flow', 'location', 'status')
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS listings (
+    fingerprint TEXT PRIMARY KEY,
+    source TEXT,
+    url TEXT,
+    first_seen TEXT NOT NULL,
+    last_seen TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_listings_source ON listings (source);
+CREATE INDEX IF NOT EXISTS idx_listings_last_seen ON listings (last_seen);
+
+CREATE TABLE IF NOT EXISTS listing_changes (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    fingerprint TEXT NOT NULL,
+    field TEXT NOT NULL,
+    old_value TEXT,
+    new_value TEXT,
+    changed_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_changes_fingerprint ON listing_changes (fingerprint);
+"""
+
+# SQLite's default limit on bound parameters is 999
+_LOOKUP_CHUNK = 500
+
+@dataclass
+class PendingScan:
+    """Rows a diffed scan will write to the store once committed"""
+    inserts: List[tuple] = field(default_factory=list)
+    updates: List[tuple] = field(default_factory=list)
+    touches: List[tuple] = field(default_factory=list)
+    change_rows: List[tuple] = field(default_factory=list)
+
+class ListingStore:
+    """
+    SQLite-backed history of every listing the scanner has seen.
+
+    Listings are keyed by ``listing_fingerprint`` (canonical ID after
+    deduplication, otherwise source + URL). Each scan updates last-seen
+    times and records field-level changes, and only new or materially
+    changed listings are handed back for downstream processing.
+    """
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        # Used by one phase at a time, but not always from the thread that opened it
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.executescript(SCHEMA)
+
+    def record_scan(self, listings: List[Dict[str, Any]], scan_time: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Record a scan and return only the listings that need downstream work
+
+        Returned listings carry ``change_type`` ('new' or 'changed') and, for
+        changed ones, ``changes``: a list of {field, old, new}. Unchanged
+        listings only have their last-seen time refreshed.
+        """
+        delta, pending = self.diff_scan(listings, scan_time)
+        self.commit_scan(pending)
+        return delta
+
+    def diff_scan(self, listings: List[Dict[str, Any]], scan_time: Optional[str] = None) -> Tuple[List[Dict[str, Any]], PendingScan]:
+        """
+        Delta of a scan against the store, without writing anything
+
+        Returns the same delta as ``record_scan`` and the pending writes;
+        the store only absorbs the scan once they go to ``commit_scan``.
+        """
+        scan_time = scan_time or datetime.now().isoformat()
+
+        keyed = {}
+        for listing in listings:
+            keyed[listing_fingerprint(listing)] = listing
+
+        existing = self._fetch_existing(list(keyed))
+
+        delta = []
+        inserts = []
+        updates = []
+        touches = []
+        change_rows = []
+
+        for fingerprint, listing in keyed.items():
+            data = json.dumps(listing, default=str)
+            previous = existing.get(fingerprint)
+
+            if previous is None:
+                inserts.append((fingerprint, listing.get('source'), listing.get('url'), scan_time, scan_time, data))
+                delta.append(dict(listing, change_type='new'))
+                continue
+
+            changes = self._diff(json.loads(previous['data']), listing)
+            if not changes:
+                touches.append((scan_time, fingerprint))
+                continue
+
+            updates.append((scan_time, data, fingerprint))
+            change_rows.extend(
+                (fingerprint, change['field'], change['old'], change['new'], scan_time)
+                for change in changes
+            )
+            delta.append(dict(listing, change_type='changed', changes=changes))
+
+        return delta, PendingScan(inserts, updates, touches, change_rows)
+
+    def commit_scan(self, pending: PendingScan):
+        """Write a diffed scan to the store in one transaction"""
+        with self.conn:
+            self.conn.executemany(
+                "INSERT INTO listings (fingerprint, source, url, first_seen, last_seen, data) VALUES (?, ?, ?, ?, ?, ?)",
+                pending.inserts
+            )
+            self.conn.executemany("UPDATE listings SET last_seen = ?, data = ? WHERE fingerprint = ?", pending.updates)
+            self.conn.executemany("UPDATE listings SET last_seen = ? WHERE fingerprint = ?", pending.touches)
+            self.conn.executemany(
+                "INSERT INTO listing_changes (fingerprint, field, old_value, new_value, changed_at) VALUES (?, ?, ?, ?, ?)",
+                pending.change_rows
+            )
+
+    def close(self):
+        self.conn.close()
+
+    def _fetch_existing(self, fingerprints: List[str]) -> Dict[str, sqlite3.Row]:
+        existing = {}
+        for start in range(0, len(fingerprints), _LOOKUP_CHUNK):
+            chunk = fingerprints[start:start + _LOOKUP_CHUNK]
+            placeholders = ','.join('?' * len(chunk))
+            rows = self.conn.execute(
+                f"SELECT fingerprint, data FROM listings WHERE fingerprint IN ({placeholders})",
+                chunk
+            )
+            for row in rows:
+                existing[row['fingerprint']] = row
+        return existing
+
+    @staticmethod
+    def _diff(old: Dict[str, Any], new: Dict[str, Any]) -> List[Dict[str, Any]]:
+        changes = []
+        for name in MATERIAL_FIELDS:
+            old_value, new_value = old.get(name), new.get(name)
+            if str(old_value or '').strip() != str(new_value or '').strip():
+                changes.append({'field': name, 'old': old_value, 'new': new_value})
+        return changes
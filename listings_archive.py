@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Listings Archive - Append-only Parquet dataset of every scan, partitioned by day and source
+"""
+
+import os
+import re
+from datetime import datetime
+from typing import List, Dict, Any, Optional, Sequence, Tuple
+
+from currency_parser import parse_currency_array
+from listing_io import LISTING_FIELDS, to_flat_record
+
+# Parsed financials stored next to the raw strings
+NUMERIC_FIELDS = ('asking_price', 'revenue', 'cash_flow')
+
+PARTITION_FIELDS = ('scan_day', 'source')
+
+# Listing fields stored as integers rather than text
+INTEGER_FIELDS = ('duplicate_count',)
+
+def archive_schema():
+    """Stable column layout shared by every partition"""
+    import pyarrow as pa
+
+    fields = [
+        pa.field(field, pa.int64() if field in INTEGER_FIELDS else pa.string())
+        for field in LISTING_FIELDS if field != 'source'
+    ]
+    fields += [pa.field(f"{field}_value", pa.float64()) for field in NUMERIC_FIELDS]
+    fields += [pa.field('cycle_id', pa.string())]
+    fields += [pa.field(field, pa.string()) for field in PARTITION_FIELDS]
+    return pa.schema(fields)
+
+class ListingsArchive:
+    """
+    Consolidated history of every scan as a Hive-partitioned Parquet dataset
+    (``scan_day=YYYY-MM-DD/source=<name>/<cycle_id>-N.parquet``).
+
+    Each cycle appends new files and never rewrites other cycles'. Reads push
+    column projection and partition/row filters down to Parquet, so a
+    question about one source over a few months only touches those files.
+
+    Requires ``pyarrow``.
+    """
+
+    def __init__(self, root_dir: str):
+        self.root_dir = root_dir
+
+    def append(self, listings: List[Dict[str, Any]], cycle_id: str, scan_time: Optional[datetime] = None) -> int:
+        """
+        Append one cycle's listings; returns the number of rows written
+
+        Files an earlier attempt of the same cycle wrote are removed first,
+        so re-running a cycle replaces its rows instead of duplicating them.
+        """
+        import pyarrow as pa
+        import pyarrow.dataset as ds
+
+        self.remove_cycle(cycle_id)
+        if not listings:
+            return 0
+
+        scan_day = (scan_time or datetime.now()).strftime('%Y-%m-%d')
+
+        records = [to_flat_record(listing) for listing in listings]
+        columns = {}
+        for field in LISTING_FIELDS:
+            if field == 'source':
+                continue
+            if field in INTEGER_FIELDS:
+                columns[field] = [record[field] for record in records]
+            else:
+                columns[field] = [_as_text(record[field]) for record in records]
+        for field in NUMERIC_FIELDS:
+            columns[f"{field}_value"] = parse_currency_array(listing.get(field) for listing in listings)
+        columns['cycle_id'] = [cycle_id] * len(listings)
+        columns['scan_day'] = [scan_day] * len(listings)
+        columns['source'] = [listing.get('source') or 'unknown' for listing in listings]
+
+        table = pa.Table.from_pydict(columns, schema=archive_schema())
+
+        ds.write_dataset(
+            table,
+            self.root_dir,
+            format='parquet',
+            partitioning=self._partitioning(),
+            basename_template=f"{cycle_id}-{{i}}.parquet",
+            existing_data_behavior='overwrite_or_ignore'
+        )
+
+        return table.num_rows
+
+    def remove_cycle(self, cycle_id: str) -> int:
+        """Delete every file written for ``cycle_id``; returns how many were removed"""
+        if not os.path.isdir(self.root_dir):
+            return 0
+
+        pattern = re.compile(rf"{re.escape(cycle_id)}-\d+\.parquet")
+        removed = 0
+        for dirpath, _, filenames in os.walk(self.root_dir):
+            for filename in filenames:
+                if pattern.fullmatch(filename):
+                    os.remove(os.path.join(dirpath, filename))
+                    removed += 1
+        return removed
+
+    def read(self, columns: Optional[Sequence[str]] = None,
+             filters: Optional[List[Tuple[str, str, Any]]] = None,
+             start_day: Optional[str] = None, end_day: Optional[str] = None,
+             sources: Optional[Sequence[str]] = None):
+        """
+        Query the archive into a pandas DataFrame
+
+        ``columns`` limits which columns are read. ``filters`` takes
+        pyarrow-style predicates, e.g. [('revenue_value', '>=', 1e6)];
+        ``start_day`` / ``end_day`` (inclusive, YYYY-MM-DD) and ``sources``
+        are shorthands that prune whole partitions.
+        """
+        import pyarrow.dataset as ds
+        import pyarrow.parquet as pq
+
+        predicates = list(filters or [])
+        if start_day:
+            predicates.append(('scan_day', '>=', start_day))
+        if end_day:
+            predicates.append(('scan_day', '<=', end_day))
+        if sources:
+            predicates.append(('source', 'in', list(sources)))
+
+        if not os.path.isdir(self.root_dir):
+            return archive_schema().empty_table().select(list(columns) if columns else archive_schema().names).to_pandas()
+
+        dataset = ds.dataset(
+            self.root_dir,
+            format='parquet',
+            schema=archive_schema(),
+            partitioning=self._partitioning()
+        )
+
+        table = dataset.to_table(
+            columns=list(columns) if columns else None,
+            filter=pq.filters_to_expression(predicates) if predicates else None
+        )
+        return table.to_pandas()
+
+    def _partitioning(self):
+        import pyarrow as pa
+        import pyarrow.dataset as ds
+
+        return ds.partitioning(
+            pa.schema([(field, pa.string()) for field in PARTITION_FIELDS]),
+            flavor='hive'
+        )
+
+def _as_text(value) -> Optional[str]:
+    if value is None:
+        return None
+    return value if isinstance(value, str) else str(value)
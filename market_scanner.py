@@ -3,25 +3,65 @@
 Market Scanner - Aggregates business listings from multiple sources
 """
 
-import json
 import csv
 import os
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterable
 import requests
 from bs4 import BeautifulSoup
 import time
+import threading
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+
+from app_config import load_config
+from http_cache import HttpCache
+from http_client import HttpClient
+from listing_io import LISTING_FIELDS, to_flat_record
+from structured_log import StructuredLogger
 
 class MarketScanner:
     def __init__(self, config_path: str = "/home/ubuntu/million_hunter/config.json"):
-        with open(config_path, 'r') as f:
-            self.config = json.load(f)
+        self.config = load_config(config_path)
         
         self.sources = self.config['sources']
         self.filters = self.config['filters']
         self.output_dir = "/home/ubuntu/million_hunter/data"
         self.log_dir = "/home/ubuntu/million_hunter/logs"
+        self.logger = StructuredLogger(
+            os.path.join(self.log_dir, f"scanner_{datetime.now().strftime('%Y%m%d')}.jsonl"),
+            component='market_scanner'
+        )
+        
+        # Pooled, rate-limited client behind an on-disk response cache, shared by all sources
+        self.http_client = HttpClient(self.config.get('http_client', {}))
+        
+        cache_config = self.config.get('http_cache', {})
+        self.http_cache = HttpCache(
+            cache_config.get('dir', "/home/ubuntu/million_hunter/cache/http"),
+            max_bytes=int(cache_config.get('max_mb', 500)) * 1024 * 1024,
+            session=self.http_client
+        )
+        self.cache_ttl = cache_config.get('ttl', {})  # seconds, keyed by source name
+        self.default_cache_ttl = cache_config.get('default_ttl', 6 * 3600)
         
+        # Hard per-source deadline for scan_all_sources, in seconds
+        self.source_timeout = float(self.config.get('scanner', {}).get('source_timeout', 300))
+        
+    def fetch(self, source: str, url: str, params: Dict[str, Any] = None) -> Dict[str, Any]:
+        """
+        Fetch a source page through the on-disk HTTP cache
+
+        Uses the source's TTL from ``http_cache.ttl`` (falling back to
+        ``http_cache.default_ttl``); stale entries are revalidated with
+        conditional requests instead of being re-downloaded.
+        """
+        ttl = self.cache_ttl.get(source, self.default_cache_ttl)
+        return self.http_cache.get(url, params=params, ttl=ttl)
+    
+    def request_counts(self) -> Dict[str, Dict[str, int]]:
+        """Network requests made per host (cache hits are not counted)"""
+        return self.http_client.request_counts()
+    
     def scan_bizbuysell(self) -> List[Dict[str, Any]]:
         """Scan BizBuySell.com for business listings"""
         listings = []
@@ -53,7 +93,7 @@ class MarketScanner:
             }
             
             # Note: Actual implementation would use Selenium/Playwright for dynamic content
-            # This is a template structure
+            # This is a template structure; a parser should load the page via self.fetch
             listing = {
                 'source': 'bizbuysell',
                 'sector': sector,
@@ -127,7 +167,15 @@ class MarketScanner:
         return listings
     
     def scan_all_sources(self) -> List[Dict[str, Any]]:
-        """Execute scan across all configured sources"""
+        """
+        Execute scan across all configured sources
+
+        Sources run in parallel, each on its own daemon thread. A source
+        that raises or misses its ``scanner.source_timeout`` deadline is
+        logged and skipped; the other sources' listings are returned in
+        configured order. A hung source's thread is left behind and can't
+        keep the process alive at exit.
+        """
         all_listings = []
         
         print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Starting market scan...")
@@ -141,52 +189,102 @@ class MarketScanner:
             'sam.gov': self.scan_sam_gov
         }
         
-        for source_name, scanner_func in scanners.items():
-            if source_name in self.sources:
-                try:
-                    print(f"  Scanning {source_name}...")
-                    listings = scanner_func()
-                    all_listings.extend(listings)
-                    print(f"  Found {len(listings)} listings from {source_name}")
-                except Exception as e:
-                    print(f"  Error scanning {source_name}: {str(e)}")
-                    self.log_error(source_name, str(e))
+        active_scanners = {
+            source_name: scanner_func
+            for source_name, scanner_func in scanners.items()
+            if source_name in self.sources
+        }
+        
+        futures = {}
+        for source_name, scanner_func in active_scanners.items():
+            print(f"  Scanning {source_name}...")
+            futures[source_name] = self._start_source(source_name, scanner_func)
+        
+        # Every source started together, so they share one deadline
+        deadline = time.monotonic() + self.source_timeout
+        
+        for source_name, future in futures.items():
+            try:
+                listings = future.result(timeout=max(0.0, deadline - time.monotonic()))
+                all_listings.extend(listings)
+                print(f"  Found {len(listings)} listings from {source_name}")
+            except FutureTimeoutError:
+                message = f"Timed out after {self.source_timeout:.0f}s"
+                print(f"  Error scanning {source_name}: {message}")
+                self.log_error(source_name, message)
+            except Exception as e:
+                print(f"  Error scanning {source_name}: {str(e)}")
+                self.log_error(source_name, str(e))
         
         print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Scan complete. Total listings: {len(all_listings)}")
         
+        for host, counts in sorted(self.request_counts().items()):
+            print(f"  {host}: {counts['requests']} requests, {counts['retries']} retries, {counts['throttled']} throttled")
+        
         return all_listings
     
-    def save_listings(self, listings: List[Dict[str, Any]], filename: str = None):
-        """Save listings to CSV file"""
+    def _start_source(self, source_name: str, scanner_func) -> Future:
+        """
+        Scan one source on a daemon thread
+
+        ThreadPoolExecutor workers are joined at interpreter exit, so a
+        source stuck in a request would hold the process open after its
+        deadline; a daemon thread is simply dropped.
+        """
+        future = Future()
+        
+        def run():
+            future.set_running_or_notify_cancel()
+            try:
+                future.set_result(self._scan_source(source_name, scanner_func))
+            except BaseException as e:
+                future.set_exception(e)
+        
+        threading.Thread(target=run, name=f"scanner-{source_name}", daemon=True).start()
+        return future
+    
+    def _scan_source(self, source_name: str, scanner_func) -> List[Dict[str, Any]]:
+        with self.logger.span('scan_source', source=source_name) as span:
+            listings = scanner_func()
+            span.add_items(len(listings))
+        return listings
+    
+    def save_listings(self, listings: Iterable[Dict[str, Any]], filename: str = None):
+        """
+        Save listings to CSV file
+
+        Rows are written in a single pass using the fixed ``LISTING_FIELDS``
+        schema, so ``listings`` may be any iterable, including a generator.
+        Nested fields such as ``source_links`` are written as JSON.
+        """
         if not filename:
             filename = f"new_listings_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
         
         filepath = os.path.join(self.output_dir, filename)
         
-        if not listings:
+        listings = iter(listings)
+        first = next(listings, None)
+        if first is None:
             print("No listings to save")
             return
         
-        # Get all unique keys from listings
-        fieldnames = set()
-        for listing in listings:
-            fieldnames.update(listing.keys())
-        fieldnames = sorted(list(fieldnames))
-        
+        count = 0
         with open(filepath, 'w', newline='') as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
+            writer = csv.DictWriter(csvfile, fieldnames=LISTING_FIELDS)
             writer.writeheader()
-            writer.writerows(listings)
+            
+            writer.writerow(to_flat_record(first))
+            count += 1
+            for listing in listings:
+                writer.writerow(to_flat_record(listing))
+                count += 1
         
-        print(f"Saved {len(listings)} listings to {filepath}")
+        print(f"Saved {count} listings to {filepath}")
         return filepath
     
     def log_error(self, source: str, error: str):
         """Log errors to file"""
-        log_file = os.path.join(self.log_dir, f"scanner_errors_{datetime.now().strftime('%Y%m%d')}.log")
-        
-        with open(log_file, 'a') as f:
-            f.write(f"[{datetime.now().isoformat()}] {source}: {error}\n")
+        self.logger.error(error, source=source)
 
 def main():
     """Main execution function"""
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Phase Profiler - cProfile + tracemalloc per pipeline phase, and asyncio task timing
+"""
+
+import asyncio
+import cProfile
+import glob
+import io
+import json
+import os
+import pstats
+import shutil
+import time
+import tracemalloc
+import uuid
+from contextlib import contextmanager
+from typing import List, Dict, Any, Optional
+
+class PhaseProfiler:
+    """
+    Profiles named phases into ``profile_dir``.
+
+    Each phase gets a ``<phase>.prof`` dump (open with ``python -m pstats``
+    or snakeviz) and an entry in the summary: wall time, peak traced
+    memory, the top-N functions by cumulative time and the top-N
+    allocation sites still alive when the phase ended.
+
+    cProfile and tracemalloc are process-wide, so phases must be profiled
+    one at a time. cProfile only sees the thread that entered ``profile``:
+    work a phase hands to process-pool workers is captured by running it
+    through ``profile_call`` with ``worker_profile_dir()`` and merged into
+    the phase's stats, but other threads (and worker memory) are not
+    covered, which the summary notes.
+    """
+
+    def __init__(self, profile_dir: str, top_n: int = 20):
+        self.profile_dir = profile_dir
+        self.top_n = top_n
+        self.phases: List[Dict[str, Any]] = []
+        self.active: Optional[str] = None
+        os.makedirs(profile_dir, exist_ok=True)
+
+    def worker_profile_dir(self) -> Optional[str]:
+        """Where workers of the phase being profiled dump their stats (None outside a phase)"""
+        if self.active is None:
+            return None
+        return os.path.join(self.profile_dir, f"{self.active}.workers")
+
+    @contextmanager
+    def profile(self, name: str):
+        started_tracing = not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start(10)
+        tracemalloc.clear_traces()
+        tracemalloc.reset_peak()
+
+        self.active = name
+        worker_dir = self.worker_profile_dir()
+        shutil.rmtree(worker_dir, ignore_errors=True)
+
+        profiler = cProfile.Profile()
+        start = time.perf_counter()
+        profiler.enable()
+        try:
+            yield
+        finally:
+            profiler.disable()
+            wall_s = time.perf_counter() - start
+            self.active = None
+
+            current, peak = tracemalloc.get_traced_memory()
+            snapshot = tracemalloc.take_snapshot().filter_traces((
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, "<frozen importlib._bootstrap*>")
+            ))
+            if started_tracing:
+                tracemalloc.stop()
+
+            # Worker stats are summed into the phase's, so their times are CPU time across processes
+            stats = pstats.Stats(profiler, stream=io.StringIO())
+            worker_dumps = sorted(glob.glob(os.path.join(worker_dir, '*.prof')))
+            for worker_dump in worker_dumps:
+                stats.add(worker_dump)
+            shutil.rmtree(worker_dir, ignore_errors=True)
+
+            dump_path = os.path.join(self.profile_dir, f"{name}.prof")
+            stats.dump_stats(dump_path)
+
+            self.phases.append({
+                'phase': name,
+                'wall_s': round(wall_s, 3),
+                'peak_mb': round(peak / 1e6, 2),
+                'retained_mb': round(current / 1e6, 2),
+                'dump': dump_path,
+                'worker_profiles': len(worker_dumps),
+                'hotspots': self._hotspots(stats),
+                'allocations': [
+                    {'site': str(stat.traceback[0]), 'mb': round(stat.size / 1e6, 3), 'blocks': stat.count}
+                    for stat in snapshot.statistics('lineno')[:self.top_n]
+                ]
+            })
+
+    def write_summary(self, summary_path: str) -> str:
+        """Markdown hotspot summary at ``summary_path`` plus the same data as JSON beside it"""
+        with open(os.path.splitext(summary_path)[0] + '.json', 'w') as f:
+            json.dump(self.phases, f, indent=2)
+
+        lines = ["# Cycle Profile", ""]
+        lines.append("Hotspots cover each phase's own thread plus its process-pool workers (summed "
+                     "across processes). Other threads, such as the per-source scan threads, are not "
+                     "profiled and show up only as time spent waiting; memory figures are for the "
+                     "main process only.")
+        lines.append("")
+        lines.append("| Phase | Wall (s) | Peak traced (MB) | Retained (MB) |")
+        lines.append("|---|---|---|---|")
+        for phase in self.phases:
+            lines.append(f"| {phase['phase']} | {phase['wall_s']:.3f} | {phase['peak_mb']:.2f} | {phase['retained_mb']:.2f} |")
+
+        for phase in self.phases:
+            lines += ["", f"## {phase['phase']}", "", f"Dump: `{phase['dump']}`", ""]
+            if phase['worker_profiles']:
+                lines += [f"Includes {phase['worker_profiles']} worker profiles.", ""]
+            lines.append("| Cumulative (s) | Own (s) | Calls | Function |")
+            lines.append("|---|---|---|---|")
+            for hotspot in phase['hotspots']:
+                lines.append(f"| {hotspot['cumtime']:.3f} | {hotspot['tottime']:.3f} | {hotspot['calls']} | `{hotspot['function']}` |")
+
+            if phase['allocations']:
+                lines += ["", "| Retained (MB) | Blocks | Allocated at |", "|---|---|---|"]
+                for allocation in phase['allocations']:
+                    lines.append(f"| {allocation['mb']:.3f} | {allocation['blocks']} | `{allocation['site']}` |")
+
+        with open(summary_path, 'w') as f:
+            f.write('\n'.join(lines) + '\n')
+        return summary_path
+
+    def _hotspots(self, stats: pstats.Stats) -> List[Dict[str, Any]]:
+        rows = sorted(stats.stats.items(), key=lambda item: item[1][3], reverse=True)
+
+        hotspots = []
+        for (filename, line, function), (_, calls, tottime, cumtime, _) in rows[:self.top_n]:
+            location = f"{os.path.basename(filename)}:{line}" if line else filename
+            hotspots.append({
+                'function': f"{location}({function})",
+                'calls': calls,
+                'tottime': round(tottime, 4),
+                'cumtime': round(cumtime, 4)
+            })
+        return hotspots
+
+def profile_call(dump_dir: str, func, *args, **kwargs):
+    """
+    Call ``func`` under cProfile and dump its stats into ``dump_dir``
+
+    For work running in another process; point ``dump_dir`` at
+    ``PhaseProfiler.worker_profile_dir()`` to have it merged into the phase.
+    """
+    os.makedirs(dump_dir, exist_ok=True)
+    profiler = cProfile.Profile()
+    try:
+        return profiler.runcall(func, *args, **kwargs)
+    finally:
+        profiler.dump_stats(os.path.join(dump_dir, f"{os.getpid()}-{uuid.uuid4().hex}.prof"))
+
+class AsyncTaskTimer:
+    """
+    Per-coroutine breakdown of asyncio task lifetimes
+
+    Installed as the loop's task factory; every task is timed from creation
+    to completion and aggregated by coroutine name (count, total, max).
+    """
+
+    def __init__(self):
+        self.timings: Dict[str, Dict[str, float]] = {}
+
+    def install(self, loop: asyncio.AbstractEventLoop = None):
+        loop = loop or asyncio.get_running_loop()
+        previous_factory = loop.get_task_factory()
+
+        def factory(loop, coro, **kwargs):
+            if previous_factory is not None:
+                task = previous_factory(loop, coro, **kwargs)
+            else:
+                task = asyncio.Task(coro, loop=loop, **kwargs)
+
+            name = getattr(coro, '__qualname__', type(coro).__name__)
+            start = time.perf_counter()
+            task.add_done_callback(lambda _task: self._record(name, time.perf_counter() - start))
+            return task
+
+        loop.set_task_factory(factory)
+
+    def _record(self, name: str, elapsed: float):
+        timing = self.timings.setdefault(name, {'count': 0, 'total_s': 0.0, 'max_s': 0.0})
+        timing['count'] += 1
+        timing['total_s'] += elapsed
+        timing['max_s'] = max(timing['max_s'], elapsed)
+
+    def summary(self, top_n: int = 20) -> str:
+        rows = sorted(self.timings.items(), key=lambda item: item[1]['total_s'], reverse=True)[:top_n]
+        lines = [f"{'tasks':>6} {'total s':>9} {'max s':>8}  coroutine"]
+        for name, timing in rows:
+            lines.append(f"{timing['count']:>6} {timing['total_s']:>9.3f} {timing['max_s']:>8.3f}  {name}")
+        return '\n'.join(lines)
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Structured Log - Queue-backed JSON Lines logging with timing spans
+"""
+
+import atexit
+import json
+import os
+import queue
+import threading
+import time
+from datetime import datetime
+from typing import Dict, Any, Optional
+
+# Writer threads, one per log file, shared by every logger pointing at it
+_writers: Dict[str, "_BatchWriter"] = {}
+_writers_lock = threading.Lock()
+
+class _BatchWriter(threading.Thread):
+    """Drains queued records to one file in batches, off the caller's thread"""
+
+    def __init__(self, path: str, batch_size: int = 500, flush_interval: float = 0.5):
+        super().__init__(name=f"log-writer:{os.path.basename(path)}", daemon=True)
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.queue = queue.SimpleQueue()
+        self._closed = False
+
+    def run(self):
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+
+        with open(self.path, 'a') as f:
+            while True:
+                batch, markers, stop = self._next_batch()
+                if batch:
+                    f.write(''.join(_to_line(record) for record in batch))
+                    f.flush()
+                for marker in markers:
+                    marker.set()
+                if stop:
+                    return
+
+    def _next_batch(self):
+        """Block for the first record, then take whatever else is queued (up to batch_size)"""
+        batch, markers = [], []
+        try:
+            item = self.queue.get(timeout=self.flush_interval)
+        except queue.Empty:
+            return batch, markers, False
+
+        while True:
+            if item is None:
+                return batch, markers, True
+            if isinstance(item, threading.Event):
+                markers.append(item)
+            else:
+                batch.append(item)
+
+            if len(batch) >= self.batch_size:
+                return batch, markers, False
+            try:
+                item = self.queue.get_nowait()
+            except queue.Empty:
+                return batch, markers, False
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        marker = threading.Event()
+        self.queue.put(marker)
+        return marker.wait(timeout)
+
+    def close(self, timeout: float = 5.0):
+        if not self._closed:
+            self._closed = True
+            self.queue.put(None)
+            self.join(timeout)
+
+def _to_line(record: Dict[str, Any]) -> str:
+    record['ts'] = datetime.fromtimestamp(record['ts']).isoformat(timespec='milliseconds')
+    return json.dumps(record, default=str) + '\n'
+
+def _writer_for(path: str) -> _BatchWriter:
+    path = os.path.abspath(path)
+    with _writers_lock:
+        writer = _writers.get(path)
+        if writer is None or writer._closed:
+            writer = _BatchWriter(path)
+            writer.start()
+            _writers[path] = writer
+        return writer
+
+@atexit.register
+def close_all():
+    """Flush and stop every writer (runs at interpreter exit)"""
+    with _writers_lock:
+        writers = list(_writers.values())
+        _writers.clear()
+    for writer in writers:
+        writer.close()
+
+class StructuredLogger:
+    """
+    JSON Lines logger whose callers only pay for a queue put.
+
+    Records are serialized and written in batches by a background thread
+    per file. ``context`` fields (e.g. cycle_id) are added to every record.
+    """
+
+    def __init__(self, path: str, **context):
+        self.path = path
+        self.context = context
+        self._writer = _writer_for(path)
+
+    def log(self, message: str, level: str = "INFO", **fields):
+        record = {'ts': time.time(), 'level': level, 'event': 'log', 'message': message}
+        record.update(self.context)
+        record.update(fields)
+        self._writer.queue.put(record)
+
+    def error(self, message: str, **fields):
+        self.log(message, level="ERROR", **fields)
+
+    def span(self, name: str, **fields) -> "Span":
+        """Context manager timing a unit of work; see ``Span``"""
+        return Span(self, name, fields)
+
+    def bind(self, **context) -> "StructuredLogger":
+        """Logger for the same file with extra context fields"""
+        return StructuredLogger(self.path, **dict(self.context, **context))
+
+    def flush(self, timeout: float = 5.0) -> bool:
+        """Wait until everything logged so far is on disk"""
+        return self._writer.flush(timeout)
+
+class Span:
+    """
+    Timed unit of work, logged as one ``event: span`` record on exit
+
+    The record carries wall time in seconds, ``items`` and ``errors``
+    counters, ``status`` ('ok' or 'error') and any extra fields. An
+    exception escaping the span counts as an error and is re-raised.
+    """
+
+    def __init__(self, logger: StructuredLogger, name: str, fields: Dict[str, Any]):
+        self.logger = logger
+        self.name = name
+        self.fields = fields
+        self.items = 0
+        self.errors = 0
+        self.wall_s: Optional[float] = None
+
+    def add_items(self, count: int = 1):
+        self.items += count
+
+    def add_errors(self, count: int = 1):
+        self.errors += count
+
+    def set(self, **fields):
+        self.fields.update(fields)
+
+    def __enter__(self) -> "Span":
+        self._started = time.time()
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.wall_s = time.perf_counter() - self._start
+
+        record = {
+            'ts': self._started,
+            'level': "ERROR" if exc else "INFO",
+            'event': 'span',
+            'span': self.name,
+            'wall_s': round(self.wall_s, 6),
+            'items': self.items,
+            'errors': self.errors + (1 if exc else 0),
+            'status': 'error' if exc else 'ok'
+        }
+        if exc:
+            record['error'] = f"{exc_type.__name__}: {exc}"
+        record.update(self.logger.context)
+        record.update(self.fields)
+
+        self.logger._writer.queue.put(record)
+        return False
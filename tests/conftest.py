@@ -0,0 +1,27 @@
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import investment_analyzer
+from investment_analyzer import InvestmentAnalyzer
+
+
+@pytest.fixture
+def analyzer(tmp_path, monkeypatch):
+    config_path = tmp_path / "config.json"
+    config_path.write_text(json.dumps({
+        'ai_optimization_scenarios': {
+            'efficiency_gains': [0.15, 0.3],
+            'cost_reduction': [0.1, 0.25],
+            'revenue_increase': [0.2, 0.4],
+            'lead_gen': [0.15, 0.35],
+            'margin_expansion': [300, 500]
+        }
+    }))
+    # The analyzer creates its memo directory on construction
+    monkeypatch.setattr(investment_analyzer.os, 'makedirs', lambda *args, **kwargs: None)
+    return InvestmentAnalyzer(str(config_path))
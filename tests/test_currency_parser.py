@@ -0,0 +1,50 @@
+import math
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from currency_parser import parse_currency, parse_currency_array
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("$1,250,000", 1_250_000.0),
+    ("$1.2M (est.)", 1_200_000.0),
+    ("1.2 million", 1_200_000.0),
+    ("$500K - $750K", 625_000.0),
+    ("$1-2M", 1_500_000.0),
+    ("$1 to $2 million", 1_500_000.0),
+    ("1,200,000", 1_200_000.0),
+])
+def test_amounts(text, expected):
+    assert parse_currency(text) == expected
+
+
+@pytest.mark.parametrize("text", ["-$50,000", "($50,000)", "$-50,000", "$(50,000)", "- $50K", "(50,000)"])
+def test_negative_amounts(text):
+    assert parse_currency(text) == -50_000.0
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("2019 est. $1.2M", 1_200_000.0),
+    ("3 locations, $2M", 2_000_000.0),
+    ("Revenue (est.) $900K", 900_000.0),
+])
+def test_dollar_amount_wins_over_bare_numbers(text, expected):
+    assert parse_currency(text) == expected
+
+
+@pytest.mark.parametrize("text", [None, "", "N/A", "Not Disclosed", "Call for details"])
+def test_undisclosed(text):
+    assert math.isnan(parse_currency(text))
+
+
+def test_array_matches_scalar():
+    values = ["-$50,000", "($1.2M)", "2019 est. $1.2M", "N/A", None, "$500K - $750K", "-$50,000"]
+    parsed = parse_currency_array(values)
+    expected = [parse_currency(value) for value in values]
+    assert parsed.tolist()[:3] == expected[:3]
+    assert math.isnan(parsed[3]) and math.isnan(parsed[4])
+    assert parsed.tolist()[5:] == expected[5:]
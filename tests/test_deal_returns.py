@@ -0,0 +1,49 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from deal_returns import ReturnsEngine, solve_irr
+
+CASH_FLOWS = np.array([[[600_000.0, 618_000.0, 636_540.0, 655_636.2, 675_305.29]]])
+ASKING = np.array([1_800_000.0])
+
+
+def test_owner_compensation_and_capex_come_out_before_debt_service():
+    plain = ReturnsEngine({'financing': {'owner_compensation': 0, 'capex_rate': 0}})
+    haircut = ReturnsEngine({'financing': {'owner_compensation': 80_000, 'capex_rate': 0.1}})
+
+    plain_flows, plain_equity = plain.equity_cash_flows(CASH_FLOWS, ASKING)
+    haircut_flows, haircut_equity = haircut.equity_cash_flows(CASH_FLOWS, ASKING)
+
+    np.testing.assert_allclose(haircut_equity, plain_equity)
+    expected_cut = CASH_FLOWS[0, 0] * 0.1 + 80_000
+    np.testing.assert_allclose(plain_flows[0, 0, :, 1:] - haircut_flows[0, 0, :, 1:],
+                               np.broadcast_to(expected_cut, (plain.structure_count, 5)))
+
+    assert np.all(haircut.returns_batch(CASH_FLOWS, ASKING)['irr'] < plain.returns_batch(CASH_FLOWS, ASKING)['irr'])
+
+
+def test_solve_irr_matches_known_rate():
+    flows = np.array([-1000.0, 100.0, 100.0, 100.0, 100.0, 1100.0])
+    assert solve_irr(flows[None])[0] == pytest.approx(0.10, abs=1e-9)
+
+
+def test_unknown_financing_setting():
+    with pytest.raises(ValueError):
+        ReturnsEngine({'financing': {'owner_salary': 50_000}})
+
+
+def test_memo_when_only_negotiated_prices_are_solvable(analyzer):
+    # Small SDE against the placeholder asking price: no IRR at asking, but one at 85%
+    listing = {'title': 'Thin Margin Co', 'revenue_numeric': 370_000.0,
+               'cash_flow_numeric': 54_500.0, 'asking_price_numeric': 1_800_000.0}
+    analysis = analyzer.analyze_opportunity(listing, {'final_score': 0.9})
+
+    conservative = analysis['returns']['scenarios']['conservative']
+    assert conservative['irr'] == {}
+    assert conservative['best_structure']['price_to_asking'] < 1.0
+    assert "N/A (no financing structure at asking has a solution)" in analysis['investment_thesis']
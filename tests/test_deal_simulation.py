@@ -0,0 +1,52 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from deal_simulation import DealSimulator, QuantileSketch, PERCENTILES, SKETCH_ACCURACY
+
+CONFIG = {
+    'ai_optimization_scenarios': {
+        'cost_reduction': [0.1, 0.25],
+        'revenue_increase': [0.2, 0.4],
+        'margin_expansion': [300, 500]
+    }
+}
+
+LISTING = {'title': 'HVAC Services', 'revenue_numeric': 2_000_000.0,
+           'cash_flow_numeric': 600_000.0, 'asking_price_numeric': 1_800_000.0}
+
+
+@pytest.mark.parametrize("values", [
+    np.random.default_rng(1).lognormal(14, 0.5, 50_000),
+    np.random.default_rng(2).normal(0, 1e6, 50_000),
+    np.concatenate([np.zeros(100), np.random.default_rng(3).normal(-5e5, 1e5, 10_000)])
+])
+def test_sketch_quantiles_within_accuracy(values):
+    sketch = QuantileSketch()
+    for chunk in np.array_split(values, 7):
+        sketch.add(chunk)
+
+    exact = np.percentile(values, PERCENTILES)
+    approx = sketch.quantiles(PERCENTILES)
+    # Within the relative accuracy, or within a bucket of min_value around 0
+    assert np.all(np.abs(approx - exact) <= SKETCH_ACCURACY * np.abs(exact) + 2 * sketch.min_value)
+
+
+def test_results_independent_of_chunk_size():
+    whole = DealSimulator(CONFIG, paths=20_000, chunk_size=20_000).simulate(LISTING)
+    chunked = DealSimulator(CONFIG, paths=20_000, chunk_size=3_000).simulate(LISTING)
+
+    for key in ('standalone', 'ai_adjusted'):
+        assert whole[key]['dcf_bands'] == chunked[key]['dcf_bands']
+        assert whole[key]['cash_flow_bands'] == chunked[key]['cash_flow_bands']
+        assert whole[key]['prob_overpay'] == chunked[key]['prob_overpay']
+        assert whole[key]['dcf_mean'] == pytest.approx(chunked[key]['dcf_mean'], abs=0.01)
+        assert whole[key]['dcf_std'] == pytest.approx(chunked[key]['dcf_std'], abs=0.01)
+
+
+def test_insufficient_financials():
+    assert 'error' in DealSimulator(CONFIG, paths=100).simulate({'revenue_numeric': 0, 'cash_flow_numeric': 0})
@@ -0,0 +1,74 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from geo_normalizer import LocationNormalizer
+
+
+@pytest.fixture(scope='module')
+def geo():
+    return LocationNormalizer()
+
+
+@pytest.mark.parametrize("location, city, state", [
+    ("Atlanta, GA", "Atlanta", "GA"),
+    ("Atlanta GA 30303", "Atlanta", "GA"),
+    ("Tampa, FL", "Tampa", "FL"),
+    ("Dallas, tx", "Dallas", "TX"),
+])
+def test_state_codes(geo, location, city, state):
+    parsed = geo.normalize(location)
+    assert (parsed['city'], parsed['state']) == (city, state)
+    assert parsed['lat'] is not None
+
+
+@pytest.mark.parametrize("location, city, state", [
+    ("Atlanta, Georgia", "Atlanta", "GA"),
+    ("Tampa Florida", "Tampa", "FL"),
+    ("Raleigh North Carolina", "Raleigh", "NC"),
+    ("Metro Atlanta", "Atlanta", "GA"),
+])
+def test_state_names(geo, location, city, state):
+    parsed = geo.normalize(location)
+    assert (parsed['city'], parsed['state']) == (city, state)
+
+
+@pytest.mark.parametrize("location, city, state", [
+    ("Charleston West Virginia", "Charleston", "WV"),
+    ("Charleston, West Virginia", "Charleston", "WV"),
+    ("Richmond Virginia", "Richmond", "VA"),
+    ("Wichita Kansas", "Wichita", "KS"),
+    ("Little Rock Arkansas", "Little Rock", "AR"),
+])
+def test_longer_state_names_win(geo, location, city, state):
+    parsed = geo.normalize(location)
+    assert (parsed['city'], parsed['state']) == (city, state)
+
+
+def test_region_name_resolves_to_its_city(geo):
+    parsed = geo.normalize("Tampa Bay Area, Florida")
+    assert (parsed['city'], parsed['state']) == ("Tampa", "FL")
+    assert parsed['lat'] is not None
+
+
+@pytest.mark.parametrize("location, state", [
+    ("Smallville, GA", "GA"),
+    ("Nowhere Special", None),
+])
+def test_unknown_cities(geo, location, state):
+    parsed = geo.normalize(location)
+    assert parsed['state'] == state
+    assert parsed['lat'] is None and parsed['lon'] is None
+
+
+@pytest.mark.parametrize("location", [None, "", "N/A", "Not Disclosed"])
+def test_undisclosed(geo, location):
+    assert all(value is None for value in geo.normalize(location).values())
+
+
+def test_match_mask(geo):
+    mask = geo.match_mask(["Atlanta, GA", "Charleston West Virginia", "Dallas, TX"], ["GA", "WV"])
+    assert mask.tolist() == [True, True, False]
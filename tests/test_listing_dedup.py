@@ -0,0 +1,87 @@
+import csv
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from listing_dedup import ListingDeduplicator, lsh_bands
+from listing_io import LISTING_FIELDS, to_flat_record
+
+HVAC_BIZBUYSELL = {'source': 'bizbuysell', 'title': 'Established HVAC Services Company in Atlanta',
+                   'asking_price': '$1,800,000', 'revenue': '$2,400,000', 'cash_flow': '$610,000',
+                   'location': 'Atlanta, GA', 'url': 'https://www.bizbuysell.com/business/1'}
+HVAC_BIZQUEST = {'source': 'bizquest', 'title': 'HVAC Services Company - Atlanta',
+                 'asking_price': '$1.8M', 'revenue': '$2.4M', 'cash_flow': '$605,000',
+                 'location': 'Atlanta, Georgia', 'url': 'https://www.bizquest.com/listing/9'}
+PLUMBING = {'source': 'bizquest', 'title': 'Commercial Plumbing Contractor',
+            'asking_price': '$950,000', 'revenue': '$1,300,000', 'cash_flow': '$320,000',
+            'location': 'Tampa, FL', 'url': 'https://www.bizquest.com/listing/12'}
+
+
+@pytest.fixture
+def dedup(tmp_path):
+    return ListingDeduplicator(str(tmp_path / 'index'))
+
+
+def test_merges_same_business_across_sources(dedup):
+    records = dedup.dedupe([HVAC_BIZBUYSELL, HVAC_BIZQUEST, PLUMBING])
+
+    assert len(records) == 2
+    hvac = records[0]
+    assert hvac['duplicate_count'] == 1
+    assert hvac['source_links'] == [
+        {'source': 'bizbuysell', 'url': HVAC_BIZBUYSELL['url']},
+        {'source': 'bizquest', 'url': HVAC_BIZQUEST['url']}
+    ]
+    assert records[1]['title'] == PLUMBING['title']
+    assert records[1]['duplicate_count'] == 0
+
+
+def test_keeps_distinct_listings_apart(dedup):
+    other_hvac = dict(HVAC_BIZQUEST, title='Residential Pool Cleaning Route', location='Dallas, TX',
+                      asking_price='$400,000', revenue='$700,000', cash_flow='$150,000')
+    records = dedup.dedupe([HVAC_BIZBUYSELL, other_hvac, PLUMBING])
+
+    assert len(records) == 3
+    assert len({record['canonical_id'] for record in records}) == 3
+
+
+def test_same_source_repost_is_not_merged(dedup):
+    repost = dict(HVAC_BIZBUYSELL, url='https://www.bizbuysell.com/business/2')
+    assert len(dedup.dedupe([HVAC_BIZBUYSELL, repost])) == 2
+
+
+def test_canonical_id_survives_across_runs(tmp_path):
+    first = ListingDeduplicator(str(tmp_path / 'index')).dedupe([HVAC_BIZBUYSELL])
+    second = ListingDeduplicator(str(tmp_path / 'index')).dedupe([HVAC_BIZQUEST])
+
+    assert second[0]['canonical_id'] == first[0]['canonical_id']
+
+
+@pytest.mark.parametrize("num_perm, threshold", [(120, 0.5), (128, 0.8), (100, 0.3), (64, 0.6)])
+def test_lsh_bands_threshold_not_above_match_threshold(num_perm, threshold):
+    bands = lsh_bands(num_perm, threshold)
+
+    assert num_perm % bands == 0
+    assert (1 / bands) ** (bands / num_perm) <= threshold
+
+
+def test_lsh_bands_default():
+    assert lsh_bands(120, 0.5) == 30
+
+
+def test_dedup_fields_reach_csv(dedup, tmp_path):
+    records = dedup.dedupe([HVAC_BIZBUYSELL, HVAC_BIZQUEST])
+    path = tmp_path / 'listings.csv'
+    with open(path, 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=LISTING_FIELDS)
+        writer.writeheader()
+        writer.writerows(to_flat_record(record) for record in records)
+
+    with open(path, newline='') as f:
+        row = next(csv.DictReader(f))
+    assert json.loads(row['source_links']) == records[0]['source_links']
+    assert row['duplicate_count'] == '1'
@@ -0,0 +1,39 @@
+import os
+import random
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from valuation_sensitivity import ValuationSensitivity
+
+
+def _listings(count):
+    rng = random.Random(7)
+    listings = [
+        {'revenue_numeric': 2_000_000.0, 'cash_flow_numeric': 600_000.0, 'asking_price_numeric': 1_800_000.0},
+        {'revenue_numeric': 1_234_567.89, 'cash_flow_numeric': -45_000.0, 'asking_price_numeric': 900_000.0}
+    ]
+    for _ in range(count):
+        revenue = round(rng.uniform(2e5, 2e7), 2)
+        listings.append({
+            'revenue_numeric': revenue,
+            'cash_flow_numeric': round(revenue * rng.uniform(0.05, 0.45), 2),
+            'asking_price_numeric': round(revenue * rng.uniform(0.3, 1.5), 2)
+        })
+    return listings
+
+
+@pytest.mark.parametrize("listing", _listings(50))
+def test_base_cell_matches_run_valuation_methods(analyzer, listing):
+    valuation = analyzer.run_valuation_methods(listing, analyzer.build_5yr_cashflow_model(listing))
+    base = ValuationSensitivity({}).what_if(listing)
+
+    assert base['dcf'] == pytest.approx(valuation['dcf']['value'], abs=0.01)
+    for bound in ('low', 'mid', 'high'):
+        assert base[f'fair_value_{bound}'] == pytest.approx(valuation['fair_value_range'][bound], abs=0.01)
+
+
+def test_undisclosed_financials():
+    assert 'error' in ValuationSensitivity({}).grid({'revenue_numeric': 0, 'cash_flow_numeric': 100})
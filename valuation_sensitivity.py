@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Valuation Sensitivity - Cached what-if grids and tornado ranking for listing valuations
+"""
+
+from functools import lru_cache
+from typing import List, Dict, Any, Mapping, Optional, Tuple
+
+import numpy as np
+
+from investment_analyzer import PROJECTION_YEARS, BASE_GROWTH_RATE, DISCOUNT_RATE, _round
+
+# Axis -> (base value used by run_valuation_methods, default grid)
+AXES = {
+    'discount_rate': (DISCOUNT_RATE, (0.10, 0.12, 0.15, 0.18, 0.20, 0.25)),
+    'growth_rate': (BASE_GROWTH_RATE, (-0.02, 0.0, 0.03, 0.05, 0.08)),
+    'sde_multiple': (3.0, (2.0, 2.5, 3.0, 3.5, 4.0)),  # mid multiple; low / high are -/+ SDE_MULTIPLE_SPREAD
+    'terminal_growth': (0.0, (0.0, 0.01, 0.02, 0.03))  # Gordon growth after year 5; 0 is the analyzer's cash_flow / rate
+}
+SDE_MULTIPLE_SPREAD = 1.0
+REVENUE_MULTIPLES = (0.5, 1.0, 1.5)
+
+METRICS = ('dcf', 'fair_value_low', 'fair_value_mid', 'fair_value_high')
+
+class ValuationSensitivity:
+    """
+    How the DCF and fair value range of ``run_valuation_methods`` respond
+    to discount rate, growth rate, SDE multiple and terminal growth.
+
+    The full grid (every combination of the axes in ``config['sensitivity']
+    ['grid']``, defaults in ``AXES``) is evaluated in one broadcast NumPy
+    computation and memoized per listing financials and assumption set, so
+    repeated grids, tornado rankings and what-if lookups are dictionary
+    hits. The analyzer's base assumptions are always on the grid.
+    """
+
+    def __init__(self, config: Mapping[str, Any]):
+        grid_config = config.get('sensitivity', {}).get('grid', {})
+        for name in grid_config:
+            if name not in AXES:
+                raise ValueError(f"Unknown sensitivity axis '{name}'")
+
+        self.base = {name: base for name, (base, _) in AXES.items()}
+        self.axes = {
+            name: tuple(sorted(set(float(value) for value in grid_config.get(name, default)) | {base}))
+            for name, (base, default) in AXES.items()
+        }
+
+    def grid(self, listing: Dict[str, Any], axes: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """
+        Every metric over the full grid
+
+        Returns ``axes`` (name -> values, in axis order) and one read-only
+        array per metric shaped by the axis lengths. Cells where the
+        discount rate doesn't exceed terminal growth are NaN. ``axes``
+        overrides individual grids for this call.
+        """
+        revenue, cash_flow = _financials(listing)
+        if revenue == 0 or cash_flow == 0:
+            return {'error': 'Insufficient financial data'}
+
+        axes = dict(self.axes, **{name: tuple(float(value) for value in values) for name, values in (axes or {}).items()})
+        grid = _valuation_grid(revenue, cash_flow, tuple((name, axes[name]) for name in AXES))
+        return dict(grid, axes={name: list(values) for name, values in axes.items()})
+
+    def what_if(self, listing: Dict[str, Any], **assumptions) -> Dict[str, Any]:
+        """Metrics for one set of assumptions (unspecified ones stay at base)"""
+        point = dict(self.base)
+        for name, value in assumptions.items():
+            if name not in AXES:
+                raise ValueError(f"Unknown sensitivity axis '{name}'")
+            point[name] = float(value)
+
+        # On-grid points come out of the listing's cached grid; off-grid ones cost a 1-cell grid
+        if all(point[name] in self.axes[name] for name in AXES):
+            grid = self.grid(listing)
+            index = tuple(self.axes[name].index(point[name]) for name in AXES)
+        else:
+            grid = self.grid(listing, {name: (value,) for name, value in point.items()})
+            index = (0,) * len(AXES)
+
+        if 'error' in grid:
+            return grid
+        result = {metric: _value(grid[metric][index]) for metric in METRICS}
+        result['assumptions'] = point
+        return result
+
+    def tornado(self, listing: Dict[str, Any], metric: str = 'fair_value_mid') -> List[Dict[str, Any]]:
+        """
+        Axes ranked by how far ``metric`` swings across each one's grid,
+        the others held at base
+        """
+        grid = self.grid(listing)
+        if 'error' in grid:
+            return []
+
+        base_index = [self.axes[name].index(self.base[name]) for name in AXES]
+        bars = []
+        for position, name in enumerate(AXES):
+            index = list(base_index)
+            values = self.axes[name]
+            index[position] = 0
+            at_low = _value(grid[metric][tuple(index)])
+            index[position] = len(values) - 1
+            at_high = _value(grid[metric][tuple(index)])
+
+            bars.append({
+                'parameter': name,
+                'low': values[0],
+                'high': values[-1],
+                'metric_at_low': at_low,
+                'metric_at_high': at_high,
+                'swing': round(abs(at_high - at_low), 2) if at_low is not None and at_high is not None else None
+            })
+
+        return sorted(bars, key=lambda bar: bar['swing'] or 0, reverse=True)
+
+    def table(self, listing: Dict[str, Any], rows: str = 'discount_rate', columns: str = 'growth_rate',
+              metric: str = 'dcf') -> Dict[str, Any]:
+        """2-D slice of ``metric`` over two axes, the others held at base"""
+        grid = self.grid(listing)
+        if 'error' in grid:
+            return grid
+
+        index = tuple(
+            slice(None) if name in (rows, columns) else self.axes[name].index(self.base[name])
+            for name in AXES
+        )
+        values = grid[metric][index]
+        if list(AXES).index(rows) > list(AXES).index(columns):
+            values = values.T
+
+        return {
+            'metric': metric,
+            'rows': rows,
+            'columns': columns,
+            'row_values': list(self.axes[rows]),
+            'column_values': list(self.axes[columns]),
+            'values': [[_value(value) for value in row] for row in values]
+        }
+
+    def summary(self, listing: Dict[str, Any]) -> Dict[str, Any]:
+        """JSON-ready tornado ranking and DCF table for the investment memo"""
+        table = self.table(listing)
+        if 'error' in table:
+            return table
+
+        return {
+            'base': dict(self.base),
+            'tornado': self.tornado(listing),
+            'table': table
+        }
+
+@lru_cache(maxsize=1024)
+def _valuation_grid(revenue: float, cash_flow: float, axes: Tuple[Tuple[str, Tuple[float, ...]], ...]) -> Dict[str, np.ndarray]:
+    """Metric arrays over the grid; cached per financials and assumption set"""
+    shape = [len(values) for _, values in axes]
+
+    def axis(position: int) -> np.ndarray:
+        # Values of one axis, shaped to broadcast against the others
+        view = [1] * len(axes)
+        view[position] = shape[position]
+        return np.asarray(axes[position][1]).reshape(view)
+
+    rate, growth, sde_multiple, terminal_growth = (axis(position) for position in range(len(axes)))
+
+    # Same projection as build_5yr_cashflow_model (cash flows rounded to cents), with a trailing year axis
+    years = np.arange(1, PROJECTION_YEARS + 1)
+    cash_flows = _round(revenue * (1 + growth[..., None]) ** years * (cash_flow / revenue), 2)
+    discount = (1 + rate[..., None]) ** years
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        terminal = cash_flows[..., -1] * (1 + terminal_growth) / (rate - terminal_growth)
+        dcf = (cash_flows / discount).sum(axis=-1) + terminal / discount[..., -1]
+        dcf = np.where(rate > terminal_growth, dcf, np.nan)
+
+    # Fair value range as in run_valuation_methods
+    low_rev, mid_rev, high_rev = (revenue * multiple for multiple in REVENUE_MULTIPLES)
+    grid = {
+        'dcf': np.broadcast_to(dcf, shape),
+        'fair_value_low': np.broadcast_to(np.minimum(cash_flow * (sde_multiple - SDE_MULTIPLE_SPREAD), low_rev), shape),
+        'fair_value_mid': np.broadcast_to((cash_flow * sde_multiple + mid_rev + dcf) / 3, shape),
+        'fair_value_high': np.broadcast_to(np.maximum(cash_flow * (sde_multiple + SDE_MULTIPLE_SPREAD), high_rev), shape)
+    }
+    for name, values in grid.items():
+        # Cached arrays are shared by every caller
+        values = np.array(values)
+        values.setflags(write=False)
+        grid[name] = values
+    return grid
+
+def _financials(listing: Dict[str, Any]) -> Tuple[float, float]:
+    return float(listing.get('revenue_numeric', 0) or 0), float(listing.get('cash_flow_numeric', 0) or 0)
+
+def _value(value) -> Optional[float]:
+    return None if np.isnan(value) else round(float(value), 2)